@@ -0,0 +1,64 @@
+"""Benchmark'lar için deterministik sentetik plaka korpusu."""
+
+import random
+from typing import List
+
+from dfa.alphabet import ALLOWED_LETTERS
+
+# Sıralı izinli harfler (rastgele seçimin tekrarlanabilir olması için)
+_LETTERS = sorted(ALLOWED_LETTERS)
+_DIGITS = "0123456789"
+
+DEFAULT_SEED = 20240101
+
+
+def valid_plates(count: int, seed: int = DEFAULT_SEED) -> List[str]:
+    """Geçerli plakalar üretir (il kodu 01-81, 1-3 harf, 2-4 rakam)."""
+    rng = random.Random(seed)
+    plates = []
+    for _ in range(count):
+        province = rng.randint(1, 81)
+        letters = "".join(rng.choice(_LETTERS) for _ in range(rng.randint(1, 3)))
+        digits = "".join(rng.choice(_DIGITS) for _ in range(rng.randint(2, 4)))
+        plates.append(f"{province:02d} {letters} {digits}")
+    return plates
+
+
+def early_reject_plates(count: int, seed: int = DEFAULT_SEED) -> List[str]:
+    """İlk karakterlerde reddedilen girişler üretir (geçersiz il kodu)."""
+    rng = random.Random(seed + 1)
+    plates = []
+    for _ in range(count):
+        province = rng.choice(["90", "99", "00", "82", "A1", " 3"])
+        letters = "".join(rng.choice(_LETTERS) for _ in range(rng.randint(1, 3)))
+        plates.append(f"{province} {letters} {rng.randint(10, 9999)}")
+    return plates
+
+
+def late_reject_plates(count: int, seed: int = DEFAULT_SEED) -> List[str]:
+    """Son karakterlerde reddedilen girişler üretir (fazla veya eksik rakam)."""
+    rng = random.Random(seed + 2)
+    plates = []
+    for plate in valid_plates(count, seed + 3):
+        if rng.random() < 0.5:
+            plates.append(plate + rng.choice(_DIGITS) * 4)  # Fazla rakam
+        else:
+            plates.append(plate.rsplit(" ", 1)[0] + " " + rng.choice(_DIGITS))  # Tek rakam
+    return plates
+
+
+def raw_reads(count: int, seed: int = DEFAULT_SEED) -> List[str]:
+    """Kamera okumalarına benzeyen ham girişler üretir (küçük harf, satır sonu)."""
+    rng = random.Random(seed + 4)
+    pools = (
+        valid_plates(count, seed),
+        early_reject_plates(count, seed),
+        late_reject_plates(count, seed),
+    )
+    reads = []
+    for index in range(count):
+        plate = rng.choice(pools)[index]
+        if rng.random() < 0.3:
+            plate = plate.lower()
+        reads.append(plate + rng.choice(["", "\n", "\r\n"]))
+    return reads
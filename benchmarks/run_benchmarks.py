@@ -0,0 +1,283 @@
+"""Plaka DFA'sı için performans ölçüm (benchmark) paketi.
+
+Her ölçüm için işlem başına süre (ns/op), saniyedeki işlem sayısı (ops/s)
+ve `tracemalloc` ile tepe bellek kullanımı raporlanır. Sonuçlar makineye
+özel bir JSON temel çizgisi (baseline) olarak saklanabilir; sonraki
+çalıştırmalar bu temel çizgiyle karşılaştırılır ve eşik değerini aşan
+yavaşlamalar gerileme (regression) olarak işaretlenir.
+
+Kullanım:
+    python benchmarks/run_benchmarks.py            # ölç ve karşılaştır
+    python benchmarks/run_benchmarks.py --save     # temel çizgiyi kaydet
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCHMARK_DIR), "src")
+BASELINE_DIR = os.path.join(BENCHMARK_DIR, "baselines")
+sys.path.insert(0, SRC_DIR)
+
+from corpus import (  # noqa: E402
+    early_reject_plates,
+    late_reject_plates,
+    raw_reads,
+    valid_plates,
+)
+from dfa.alphabet import classify_char  # noqa: E402
+from dfa.runner import run_dfa, run_dfa_batch  # noqa: E402
+from utils.normalize import normalize_input  # noqa: E402
+
+# Ölçüm sabitleri
+DEFAULT_CORPUS_SIZE = 2000
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.15  # %15'ten fazla yavaşlama gerileme sayılır
+
+
+@dataclass
+class BenchmarkResult:
+    """Tek bir ölçümün sonucu."""
+    name: str  # Ölçüm adı
+    ns_per_op: float  # İşlem başına süre (nanosaniye)
+    ops_per_sec: float  # Saniyedeki işlem sayısı
+    peak_bytes: int  # Bir tur boyunca tepe bellek kullanımı (bayt)
+
+
+@dataclass
+class Benchmark:
+    """Ölçülecek bir iş yükü."""
+    name: str  # Ölçüm adı
+    func: Callable[[], None]  # Bir tur iş yükü
+    ops: int  # Bir turdaki işlem sayısı
+
+
+def _each(func: Callable[[str], object], items: List[str]) -> Callable[[], None]:
+    """Fonksiyonu tüm elemanlara sonuç biriktirmeden uygulayan bir tur oluşturur."""
+    def run() -> None:
+        for item in items:
+            func(item)
+    return run
+
+
+def measure(benchmark: Benchmark, repeat: int = DEFAULT_REPEAT) -> BenchmarkResult:
+    """Bir iş yükünü ölçer.
+
+    Süre, en az 0.2 sn süren tur gruplarının en iyisinden hesaplanır.
+    Bellek ölçümü ayrı bir turda yapılır (tracemalloc süreyi etkilemez).
+
+    Args:
+        benchmark: Ölçülecek iş yükü.
+        repeat: Tekrar sayısı.
+
+    Returns:
+        Ölçüm sonucu.
+    """
+    timer = timeit.Timer(benchmark.func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    seconds_per_op = best / benchmark.ops
+
+    tracemalloc.start()
+    try:
+        benchmark.func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=benchmark.name,
+        ns_per_op=seconds_per_op * 1e9,
+        ops_per_sec=1.0 / seconds_per_op if seconds_per_op > 0 else 0.0,
+        peak_bytes=peak
+    )
+
+
+def build_benchmarks(size: int) -> List[Benchmark]:
+    """Sentetik korpus üzerinde ölçülecek iş yüklerini oluşturur."""
+    valid = valid_plates(size)
+    early = early_reject_plates(size)
+    late = late_reject_plates(size)
+    reads = raw_reads(size)
+    characters = list("".join(valid))
+
+    return [
+        Benchmark("classify_char", _each(classify_char, characters), len(characters)),
+        Benchmark("normalize_input", _each(normalize_input, reads), len(reads)),
+        Benchmark("run_dfa[valid]", _each(run_dfa, valid), len(valid)),
+        Benchmark("run_dfa[early_reject]", _each(run_dfa, early), len(early)),
+        Benchmark("run_dfa[late_reject]", _each(run_dfa, late), len(late)),
+        Benchmark(
+            "run_dfa[valid,trace]",
+            _each(lambda plate: run_dfa(plate, trace=True), valid),
+            len(valid)
+        ),
+        Benchmark("run_dfa_batch", lambda: run_dfa_batch(reads), len(reads)),
+    ]
+
+
+def build_ui_benchmark() -> Optional[Benchmark]:
+    """Başsız (gizli pencereli) Tk altında `DFACanvasView.draw` ölçümünü kurar.
+
+    Returns:
+        İş yükü; Tk kullanılamıyorsa (ör. ekran yoksa) None.
+    """
+    try:
+        import tkinter as tk
+        from ui.dfa_view_tk import DFACanvasView
+
+        root = tk.Tk()
+    except Exception:  # tkinter eksik veya ekran yok
+        return None
+
+    root.withdraw()
+    view = DFACanvasView(root)
+
+    def draw() -> None:
+        view.draw()
+        root.update_idletasks()
+
+    return Benchmark("DFACanvasView.draw", draw, 1)
+
+
+def machine_id() -> str:
+    """Temel çizgi dosyası için makine ve Python sürümüne özel bir kimlik üretir."""
+    raw = (
+        f"{platform.node()}-{platform.system()}-{platform.machine()}"
+        f"-py{sys.version_info[0]}{sys.version_info[1]}"
+    )
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", raw)
+
+
+def default_baseline_path() -> str:
+    """Bu makinenin temel çizgi dosyası yolunu döndürür."""
+    return os.path.join(BASELINE_DIR, f"{machine_id()}.json")
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    """Temel çizgiyi okur; dosya yoksa boş sözlük döndürür."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as stream:
+        data = json.load(stream)
+    return {
+        name: BenchmarkResult(**fields)
+        for name, fields in data.get("results", {}).items()
+    }
+
+
+def save_baseline(path: str, results: Iterable[BenchmarkResult]) -> None:
+    """Sonuçları temel çizgi olarak kaydeder."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {
+        "machine": machine_id(),
+        "python": platform.python_version(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as stream:
+        json.dump(data, stream, indent=2, sort_keys=True)
+        stream.write("\n")
+
+
+def find_regressions(
+    results: Iterable[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    threshold: float
+) -> List[str]:
+    """Temel çizgiye göre eşikten fazla yavaşlayan ölçümlerin adlarını döndürür."""
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is not None and result.ns_per_op > reference.ns_per_op * (1 + threshold):
+            regressions.append(result.name)
+    return regressions
+
+
+def _format_row(
+    result: BenchmarkResult,
+    reference: Optional[BenchmarkResult],
+    regressed: bool
+) -> str:
+    """Bir sonuç satırını biçimlendirir."""
+    change = ""
+    if reference is not None and reference.ns_per_op > 0:
+        ratio = result.ns_per_op / reference.ns_per_op - 1
+        change = f"{ratio:+7.1%}"
+        if regressed:
+            change += "  GERİLEME"
+    return (
+        f"{result.name:<24} {result.ns_per_op:>12.1f} {result.ops_per_sec:>14,.0f} "
+        f"{result.peak_bytes / 1024:>12.1f}  {change}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark paketini çalıştırır.
+
+    Returns:
+        Çıkış kodu (gerileme varsa 1).
+    """
+    parser = argparse.ArgumentParser(description="Plaka DFA performans ölçümleri")
+    parser.add_argument("--size", type=int, default=DEFAULT_CORPUS_SIZE,
+                        help="Korpus boyutu (iş yükü başına giriş sayısı)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="Tekrar sayısı")
+    parser.add_argument("--filter", default="",
+                        help="Yalnızca adında bu metin geçen ölçümleri çalıştırır")
+    parser.add_argument("--baseline", default=None,
+                        help="Temel çizgi dosyası (varsayılan: makineye özel dosya)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Gerileme eşiği (0.15 = %%15 yavaşlama)")
+    parser.add_argument("--save", action="store_true",
+                        help="Sonuçları temel çizgi olarak kaydeder")
+    parser.add_argument("--no-ui", action="store_true",
+                        help="Tk çizim ölçümünü atlar")
+    args = parser.parse_args(argv)
+
+    benchmarks = build_benchmarks(args.size)
+    if not args.no_ui:
+        ui_benchmark = build_ui_benchmark()
+        if ui_benchmark is None:
+            print("Tk kullanılamıyor; DFACanvasView.draw ölçümü atlandı.", file=sys.stderr)
+        else:
+            benchmarks.append(ui_benchmark)
+    benchmarks = [bench for bench in benchmarks if args.filter in bench.name]
+
+    baseline_path = args.baseline or default_baseline_path()
+    baseline = load_baseline(baseline_path)
+
+    print(f"{'ölçüm':<24} {'ns/op':>12} {'ops/s':>14} {'tepe KiB':>12}  değişim")
+    results: List[BenchmarkResult] = []
+    for benchmark in benchmarks:
+        result = measure(benchmark, args.repeat)
+        results.append(result)
+        regressed = bool(find_regressions([result], baseline, args.threshold))
+        print(_format_row(result, baseline.get(result.name), regressed), flush=True)
+
+    regressions = find_regressions(results, baseline, args.threshold)
+
+    if args.save:
+        # Yalnızca ölçülenler güncellenir; --filter/--no-ui ile atlananlar korunur
+        merged = dict(baseline)
+        merged.update((result.name, result) for result in results)
+        save_baseline(baseline_path, merged.values())
+        print(f"Temel çizgi kaydedildi: {baseline_path}")
+    elif not baseline:
+        print(f"Temel çizgi bulunamadı ({baseline_path}); kaydetmek için --save kullanın.")
+
+    if regressions and not args.save:
+        print(f"{len(regressions)} ölçümde gerileme: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""Türk plaka DFA doğrulaması için komut satırı arayüzü.
+
+Satırlar standart girişten veya dosyalardan akış hâlinde okunur,
+normalize edilir ve DFA ile doğrulanır. Tüm işlem üreteç (generator)
+zinciri üzerinden yürüdüğünden bellek kullanımı girdi boyutundan bağımsızdır.
+
+Kullanım:
+    python src/cli.py [--count | --valid-only | --invalid-only] [dosya ...]
+"""
+
+import argparse
+import sys
+import time
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from utils.normalize import normalize_input
+from dfa.runner import validate
+from dfa.parallel import DEFAULT_CHUNK_SIZE, iter_lines_at, validate_file
+
+# G/Ç sabitleri
+READ_BUFFER_SIZE = 1 << 20
+WRITE_BUFFER_SIZE = 1 << 20
+STDIN_PATH = "-"
+
+# Çıktı modları
+MODE_ALL = "all"
+MODE_VALID = "valid"
+MODE_INVALID = "invalid"
+MODE_COUNT = "count"
+
+
+def iter_lines(paths: List[str]) -> Iterator[str]:
+    """Verilen dosyalardaki (veya standart girişteki) satırları akış hâlinde üretir.
+
+    Args:
+        paths: Dosya yolları. Boşsa veya "-" ise standart giriş okunur.
+
+    Yields:
+        Ham satırlar (satır sonu karakterleri dahil). Satırlar paralel yolla
+        aynı şekilde yalnızca "\n" ile ayrılır; tek başına "\r" satır sonu
+        sayılmaz.
+    """
+    for path in paths or [STDIN_PATH]:
+        if path == STDIN_PATH:
+            stream = open(
+                sys.stdin.fileno(),
+                "r",
+                encoding="utf-8",
+                errors="replace",
+                newline="\n",
+                buffering=READ_BUFFER_SIZE,
+                closefd=False
+            )
+        else:
+            stream = open(
+                path,
+                "r",
+                encoding="utf-8",
+                errors="replace",
+                newline="\n",
+                buffering=READ_BUFFER_SIZE
+            )
+
+        with stream:
+            yield from stream
+
+
+def _open_stdout() -> TextIO:
+    """Standart çıktıyı geniş tamponlu bir metin akışı olarak açar."""
+    return open(
+        sys.stdout.fileno(),
+        "w",
+        encoding="utf-8",
+        buffering=WRITE_BUFFER_SIZE,
+        closefd=False
+    )
+
+
+def iter_verdicts(lines: Iterable[str]) -> Iterator[Tuple[str, bool, int]]:
+    """Satırları normalize edip doğrular.
+
+    Args:
+        lines: Ham satırlar.
+
+    Yields:
+        (normalize edilmiş plaka, kabul, hata indeksi) üçlüleri.
+        Hata indeksi yoksa -1 kullanılır.
+    """
+    normalize = normalize_input
+    check = validate
+    for line in lines:
+        plate = normalize(line)
+        accepted, fail_index = check(plate)
+        yield plate, accepted, -1 if fail_index is None else fail_index
+
+
+def write_verdicts(
+    verdicts: Iterable[Tuple[str, bool, int]],
+    out: TextIO,
+    mode: str = MODE_ALL
+) -> Tuple[int, int]:
+    """Doğrulama sonuçlarını seçilen moda göre yazar.
+
+    Args:
+        verdicts: (plaka, kabul, hata indeksi) üçlüleri.
+        out: Çıktı akışı.
+        mode: MODE_ALL, MODE_VALID, MODE_INVALID veya MODE_COUNT.
+
+    Returns:
+        (toplam satır, kabul edilen satır) çifti.
+    """
+    total = 0
+    accepted_total = 0
+    write = out.write
+
+    for plate, accepted, fail_index in verdicts:
+        total += 1
+        if accepted:
+            accepted_total += 1
+
+        if mode == MODE_ALL:
+            write(f"{plate}\t{int(accepted)}\t{fail_index}\n")
+        elif mode == MODE_VALID and accepted:
+            write(f"{plate}\n")
+        elif mode == MODE_INVALID and not accepted:
+            write(f"{plate}\n")
+
+    if mode == MODE_COUNT:
+        write(
+            f"total\t{total}\n"
+            f"valid\t{accepted_total}\n"
+            f"invalid\t{total - accepted_total}\n"
+        )
+
+    return total, accepted_total
+
+
+def _write_parallel(
+    paths: List[str],
+    out: TextIO,
+    mode: str,
+    workers: int,
+    chunk_size: int
+) -> Tuple[int, int]:
+    """Dosyaları paralel doğrular ve sonuçları seçilen moda göre yazar.
+
+    Returns:
+        (toplam satır, kabul edilen satır) çifti.
+    """
+    total = 0
+    accepted_total = 0
+    collect_invalid = mode == MODE_INVALID
+
+    for path in paths:
+        result = validate_file(path, workers, chunk_size, collect_invalid)
+        total += result.total
+        accepted_total += result.accepted
+
+        for raw_line in iter_lines_at(path, result.invalid_offsets):
+            out.write(normalize_input(raw_line.decode("utf-8", "replace")))
+            out.write("\n")
+
+    if mode == MODE_COUNT:
+        out.write(
+            f"total\t{total}\n"
+            f"valid\t{accepted_total}\n"
+            f"invalid\t{total - accepted_total}\n"
+        )
+
+    return total, accepted_total
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Komut satırı argüman ayrıştırıcısını oluşturur."""
+    parser = argparse.ArgumentParser(
+        description="Türk plaka formatını DFA ile satır satır doğrular."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        metavar="dosya",
+        help="Okunacak dosyalar (verilmezse veya '-' ise standart giriş)"
+    )
+
+    mode_group = parser.add_mutually_exclusive_group()
+    mode_group.add_argument(
+        "--count",
+        dest="mode",
+        action="store_const",
+        const=MODE_COUNT,
+        help="Yalnızca toplam/geçerli/geçersiz sayılarını yazar"
+    )
+    mode_group.add_argument(
+        "--valid-only",
+        dest="mode",
+        action="store_const",
+        const=MODE_VALID,
+        help="Yalnızca geçerli plakaları yazar"
+    )
+    mode_group.add_argument(
+        "--invalid-only",
+        dest="mode",
+        action="store_const",
+        const=MODE_INVALID,
+        help="Yalnızca geçersiz plakaları yazar"
+    )
+    parser.set_defaults(mode=MODE_ALL)
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Dosyaları mmap ile paralel doğrulayan işçi süreç sayısı "
+            "(yalnızca --count ve --invalid-only ile)"
+        )
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Paralel doğrulamada işçi başına bayt aralığı boyutu"
+    )
+
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="İşlem hızı özetini standart hataya yazmaz"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Komut satırı giriş noktası.
+
+    Args:
+        argv: Argüman listesi (None ise sys.argv kullanılır).
+
+    Returns:
+        Çıkış kodu.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.chunk_size <= 0:
+        parser.error(f"--chunk-size pozitif olmalıdır, alınan: {args.chunk_size}")
+    if args.workers is not None:
+        if args.workers <= 0:
+            parser.error(f"--workers pozitif olmalıdır, alınan: {args.workers}")
+        if args.mode not in (MODE_COUNT, MODE_INVALID):
+            parser.error("--workers yalnızca --count veya --invalid-only ile kullanılabilir")
+        if not args.paths or STDIN_PATH in args.paths:
+            parser.error("--workers standart giriş yerine dosya yolları gerektirir")
+
+    started = time.perf_counter()
+    with _open_stdout() as out:
+        if args.workers is not None:
+            total, accepted_total = _write_parallel(
+                args.paths, out, args.mode, args.workers, args.chunk_size
+            )
+        else:
+            total, accepted_total = write_verdicts(
+                iter_verdicts(iter_lines(args.paths)),
+                out,
+                args.mode
+            )
+    elapsed = time.perf_counter() - started
+
+    if not args.quiet:
+        rate = total / elapsed if elapsed > 0 else 0.0
+        print(
+            f"{total} satır, {accepted_total} geçerli, "
+            f"{total - accepted_total} geçersiz; "
+            f"{elapsed:.3f} sn ({rate:,.0f} satır/sn)",
+            file=sys.stderr
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
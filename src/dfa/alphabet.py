@@ -1,6 +1,7 @@
 """Türk plaka alfabesi tanımları ve karakter sınıflandırma fonksiyonları."""
 
 from enum import Enum
+from typing import Dict
 
 
 class CharClass(str, Enum):
@@ -21,6 +22,49 @@ ALLOWED_LETTERS = {
     chr(code) for code in range(ord("A"), ord("Z") + 1)
 } - FORBIDDEN_LETTERS
 
+# Karakter sınıfı kimlikleri (classify_string çıktısındaki bayt değerleri)
+CHAR_CLASSES = tuple(CharClass)
+CHAR_CLASS_IDS = {
+    char_class: class_id for class_id, char_class in enumerate(CHAR_CLASSES)
+}
+OTHER_ID = CHAR_CLASS_IDS[CharClass.OTHER]
+
+
+def _classify_uncached(ch: str) -> CharClass:
+    """Bir karakteri tablo kullanmadan sınıflandırır (tablo üretimi için)."""
+    if ch == " ":
+        return CharClass.SPACE
+
+    if "0" <= ch <= "9":
+        return CharClass.DIGIT
+
+    if ch in ALLOWED_LETTERS:
+        return CharClass.LETTER
+
+    return CharClass.OTHER
+
+
+# Önceden hesaplanmış sınıflandırma tablosu (ASCII + yasaklı Türkçe harfler).
+# Tabloda olmayan tüm karakterler OTHER sınıfındadır.
+CLASS_TABLE: Dict[str, CharClass] = {
+    ch: _classify_uncached(ch)
+    for ch in [chr(code) for code in range(128)] + sorted(FORBIDDEN_LETTERS)
+}
+
+
+class _TranslationTable(dict):
+    """Tabloda olmayan karakterleri OTHER kimliğine eşleyen çeviri tablosu."""
+
+    def __missing__(self, code: int) -> int:
+        return OTHER_ID
+
+
+# str.translate için karakter kodu -> sınıf kimliği tablosu
+_CLASS_TRANSLATION = _TranslationTable(
+    (ord(ch), CHAR_CLASS_IDS[char_class])
+    for ch, char_class in CLASS_TABLE.items()
+)
+
 
 def classify_char(ch: str) -> CharClass:
     """Bir karakteri DFA için sınıflandırır.
@@ -39,16 +83,21 @@ def classify_char(ch: str) -> CharClass:
             f"classify_char tek bir karakter bekler, alınan: {len(ch)} karakter"
         )
 
-    if ch == " ":
-        return CharClass.SPACE
-    
-    if "0" <= ch <= "9":
-        return CharClass.DIGIT
+    return CLASS_TABLE.get(ch, CharClass.OTHER)
 
-    if ch in ALLOWED_LETTERS:
-        return CharClass.LETTER
 
-    return CharClass.OTHER
+def classify_string(text: str) -> bytes:
+    """Bir metnin tüm karakterlerini tek geçişte sınıflandırır.
+    
+    Sınıflandırma `str.translate` ile C seviyesinde yapılır.
+    
+    Args:
+        text: Sınıflandırılacak metin.
+        
+    Returns:
+        Her karakter için bir bayt; değerler `CHAR_CLASSES` indeksleridir.
+    """
+    return text.translate(_CLASS_TRANSLATION).encode("ascii")
 
 
 def is_in_alphabet(text: str) -> bool:
@@ -60,4 +109,4 @@ def is_in_alphabet(text: str) -> bool:
     Returns:
         Tüm karakterler geçerliyse True, aksi halde False.
     """
-    return all(classify_char(ch) != CharClass.OTHER for ch in text)
+    return OTHER_ID not in classify_string(text)
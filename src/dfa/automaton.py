@@ -0,0 +1,384 @@
+"""Genel amaçlı, değişmez (immutable) deterministik sonlu otomat yapısı.
+
+Otomat; durum sayısı, sınıf kimliklerinden oluşan bir alfabe, yoğun (dense)
+bir geçiş dizisi ve kabul bayraklarıyla tanımlanır. Geçiş dizisi
+`transitions[state * num_classes + class_id]` biçiminde indekslenir;
+tanımsız geçişler `MISSING` ile işaretlenir.
+
+Desteklenen işlemler:
+- Tamamlama (complete): tanımsız geçişleri bir yutak (sink) duruma yönlendirir
+- Küçültme (minimize): erişilemeyen durumları atar ve denk durumları
+  Hopcroft algoritmasıyla birleştirir
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Tanımsız geçiş işareti (durum sayısı bu değerden küçük olmalıdır)
+MISSING = 0xFF
+
+# Tamamlamada eklenen yutak durumunun varsayılan adı
+SINK_NAME = "qDead"
+
+
+class DFA:
+    """Sınıf kimlikleri üzerinde çalışan değişmez bir DFA.
+
+    Attributes:
+        num_states: Durum sayısı.
+        num_classes: Alfabedeki sınıf sayısı.
+        start: Başlangıç durumu kimliği.
+        transitions: Yoğun geçiş dizisi (`MISSING` tanımsız geçiştir).
+        accepting: Durum kimliğine göre kabul bayrakları (1/0).
+        state_names: Durum adları (görselleştirme ve hata ayıklama için).
+    """
+
+    __slots__ = (
+        "_num_states",
+        "_num_classes",
+        "_start",
+        "_transitions",
+        "_accepting",
+        "_state_names",
+    )
+
+    def __init__(
+        self,
+        num_classes: int,
+        transitions: Iterable[int],
+        accepting: Iterable[int],
+        start: int = 0,
+        state_names: Optional[Sequence[str]] = None
+    ) -> None:
+        """Otomatı doğrulayarak oluşturur.
+
+        Args:
+            num_classes: Alfabedeki sınıf sayısı.
+            transitions: Durum başına `num_classes` uzunluğunda satırlar.
+            accepting: Durum başına kabul bayrağı.
+            start: Başlangıç durumu kimliği.
+            state_names: Durum adları; verilmezse "s0", "s1", ... kullanılır.
+
+        Raises:
+            ValueError: Tablo boyutları veya durum kimlikleri tutarsızsa.
+        """
+        transitions = bytes(transitions)
+        accepting = bytes(1 if flag else 0 for flag in accepting)
+        num_states = len(accepting)
+
+        if num_classes <= 0:
+            raise ValueError("Alfabe en az bir sınıf içermelidir")
+        if not 0 < num_states < MISSING:
+            raise ValueError(f"Geçersiz durum sayısı: {num_states}")
+        if len(transitions) != num_states * num_classes:
+            raise ValueError(
+                f"Geçiş tablosu boyutu {len(transitions)}, "
+                f"beklenen {num_states * num_classes}"
+            )
+        if any(target >= num_states and target != MISSING for target in transitions):
+            raise ValueError("Geçiş tablosunda tanımsız durum kimliği var")
+        if not 0 <= start < num_states:
+            raise ValueError(f"Geçersiz başlangıç durumu: {start}")
+
+        if state_names is None:
+            state_names = [f"s{state_id}" for state_id in range(num_states)]
+        if len(state_names) != num_states:
+            raise ValueError("Durum adı sayısı durum sayısıyla uyuşmuyor")
+
+        self._num_states = num_states
+        self._num_classes = num_classes
+        self._start = start
+        self._transitions = transitions
+        self._accepting = accepting
+        self._state_names: Tuple[str, ...] = tuple(state_names)
+
+    # ---------- Özellikler ----------
+    @property
+    def num_states(self) -> int:
+        return self._num_states
+
+    @property
+    def num_classes(self) -> int:
+        return self._num_classes
+
+    @property
+    def start(self) -> int:
+        return self._start
+
+    @property
+    def transitions(self) -> bytes:
+        return self._transitions
+
+    @property
+    def accepting(self) -> bytes:
+        return self._accepting
+
+    @property
+    def state_names(self) -> Tuple[str, ...]:
+        return self._state_names
+
+    def __len__(self) -> int:
+        return self._num_states
+
+    def __repr__(self) -> str:
+        return (
+            f"DFA(states={self._num_states}, classes={self._num_classes}, "
+            f"start={self._start}, accepting={self.accepting_states()})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DFA):
+            return NotImplemented
+        return (
+            self._num_classes == other._num_classes
+            and self._start == other._start
+            and self._transitions == other._transitions
+            and self._accepting == other._accepting
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._num_classes, self._start, self._transitions, self._accepting))
+
+    # ---------- Çalıştırma ----------
+    def step(self, state_id: int, class_id: int) -> int:
+        """Tek bir geçişi uygular (`MISSING` dönebilir)."""
+        return self._transitions[state_id * self._num_classes + class_id]
+
+    def is_accepting(self, state_id: int) -> bool:
+        """Durumun kabul durumu olup olmadığını döndürür."""
+        return self._accepting[state_id] == 1
+
+    def accepting_states(self) -> List[int]:
+        """Kabul durumlarının kimliklerini döndürür."""
+        return [state_id for state_id, flag in enumerate(self._accepting) if flag]
+
+    def run_classes(self, classes: Iterable[int]) -> Tuple[int, int]:
+        """Sınıf dizisini çalıştırır.
+
+        Returns:
+            (son durum kimliği, hata indeksi) çifti. Tanımsız bir geçişte son
+            durum `MISSING` olur; hata yoksa indeks -1'dir.
+        """
+        transitions = self._transitions
+        width = self._num_classes
+        state_id = self._start
+        for index, class_id in enumerate(classes):
+            state_id = transitions[state_id * width + class_id]
+            if state_id == MISSING:
+                return MISSING, index
+        return state_id, -1
+
+    def accepts_classes(self, classes: Iterable[int]) -> bool:
+        """Sınıf dizisinin kabul edilip edilmediğini döndürür."""
+        state_id, _ = self.run_classes(classes)
+        return state_id != MISSING and self.is_accepting(state_id)
+
+    # ---------- Yapısal sorgular ----------
+    def is_complete(self) -> bool:
+        """Tüm geçişlerin tanımlı olup olmadığını döndürür."""
+        return MISSING not in self._transitions
+
+    def reachable_states(self) -> List[int]:
+        """Başlangıçtan erişilebilen durumları genişlik öncelikli sırayla döndürür."""
+        order = [self._start]
+        seen = {self._start}
+        queue = deque(order)
+        while queue:
+            state_id = queue.popleft()
+            for class_id in range(self._num_classes):
+                target = self.step(state_id, class_id)
+                if target != MISSING and target not in seen:
+                    seen.add(target)
+                    order.append(target)
+                    queue.append(target)
+        return order
+
+    def live_states(self) -> Set[int]:
+        """Bir kabul durumuna ulaşabilen (canlı) durumları döndürür."""
+        predecessors: List[Set[int]] = [set() for _ in range(self._num_states)]
+        for state_id in range(self._num_states):
+            for class_id in range(self._num_classes):
+                target = self.step(state_id, class_id)
+                if target != MISSING:
+                    predecessors[target].add(state_id)
+
+        live = set(self.accepting_states())
+        pending = list(live)
+        while pending:
+            for source in predecessors[pending.pop()]:
+                if source not in live:
+                    live.add(source)
+                    pending.append(source)
+        return live
+
+    # ---------- Dönüşümler ----------
+    def complete(self, sink_name: str = SINK_NAME) -> "DFA":
+        """Tanımsız geçişleri yeni bir yutak duruma yönlendiren otomatı döndürür.
+
+        Otomat zaten tamsa kendisi döndürülür.
+        """
+        if self.is_complete():
+            return self
+
+        sink = self._num_states
+        transitions = bytearray(
+            sink if target == MISSING else target for target in self._transitions
+        )
+        transitions.extend([sink] * self._num_classes)
+        return DFA(
+            self._num_classes,
+            transitions,
+            self._accepting + b"\x00",
+            self._start,
+            self._state_names + (sink_name,)
+        )
+
+    def minimize(self) -> "DFA":
+        """Dili koruyan en küçük tam otomatı döndürür (Hopcroft algoritması).
+
+        Erişilemeyen durumlar atılır, denk durumlar birleştirilir. Birleşen
+        durumların adları "+" ile birleştirilir; kimlikler başlangıçtan
+        genişlik öncelikli sırayla yeniden numaralandırılır.
+        """
+        complete = self.complete()
+        reachable = complete.reachable_states()
+        blocks = _hopcroft(complete, reachable)
+
+        block_of: Dict[int, int] = {}
+        for block_index, block in enumerate(blocks):
+            for state_id in block:
+                block_of[state_id] = block_index
+
+        # Blok kimliklerini başlangıçtan BFS sırasına göre numaralandır
+        order: List[int] = []
+        numbering: Dict[int, int] = {}
+        for state_id in reachable:
+            block_index = block_of[state_id]
+            if block_index not in numbering:
+                numbering[block_index] = len(order)
+                order.append(block_index)
+
+        transitions = bytearray()
+        accepting = []
+        names = []
+        for block_index in order:
+            members = sorted(blocks[block_index])
+            representative = members[0]
+            for class_id in range(complete.num_classes):
+                target = complete.step(representative, class_id)
+                transitions.append(numbering[block_of[target]])
+            accepting.append(complete.accepting[representative])
+            names.append("+".join(complete.state_names[member] for member in members))
+
+        return DFA(
+            complete.num_classes,
+            transitions,
+            accepting,
+            numbering[block_of[complete.start]],
+            names
+        )
+
+
+def _hopcroft(dfa: DFA, states: Sequence[int]) -> List[Set[int]]:
+    """Tam bir otomatın verilen durumlarını denklik sınıflarına ayırır."""
+    width = dfa.num_classes
+    state_set = set(states)
+
+    # Ters geçişler: (hedef, sınıf) -> kaynaklar
+    inverse: Dict[Tuple[int, int], List[int]] = {}
+    for state_id in states:
+        for class_id in range(width):
+            target = dfa.step(state_id, class_id)
+            inverse.setdefault((target, class_id), []).append(state_id)
+
+    accepting = {state_id for state_id in states if dfa.is_accepting(state_id)}
+    rejecting = state_set - accepting
+    partition: List[Set[int]] = [block for block in (accepting, rejecting) if block]
+
+    # Bekleyen ayırıcılar (splitter): daha küçük blokla başla
+    pending: List[Set[int]] = [min(partition, key=len)] if len(partition) == 2 else []
+
+    while pending:
+        splitter = pending.pop()
+        for class_id in range(width):
+            sources: Set[int] = set()
+            for target in splitter:
+                sources.update(inverse.get((target, class_id), ()))
+            if not sources:
+                continue
+
+            refined: List[Set[int]] = []
+            for block in partition:
+                inside = block & sources
+                if not inside or len(inside) == len(block):
+                    refined.append(block)
+                    continue
+                outside = block - inside
+                refined.extend((inside, outside))
+                if block in pending:
+                    pending.remove(block)
+                    pending.extend((inside, outside))
+                else:
+                    pending.append(min(inside, outside, key=len))
+            partition = refined
+
+    return partition
+
+
+def union_product(automata: Sequence[DFA]) -> Tuple[DFA, List[Tuple[int, ...]]]:
+    """Aynı alfabe üzerindeki otomatların birleşimini çarpım yapısıyla kurar.
+
+    Çarpım otomatının her durumu, bileşen durumlarından oluşan bir demettir
+    ve yalnızca başlangıçtan erişilebilen demetler üretilir. Bir durum, en az
+    bir bileşen kabul ediyorsa kabul durumudur.
+
+    Args:
+        automata: Aynı sayıda sınıf üzerinde tanımlı otomatlar.
+
+    Returns:
+        (birleşim otomatı, durum kimliğine göre bileşen durumları) çifti.
+
+    Raises:
+        ValueError: Otomat listesi boşsa veya alfabeler uyuşmuyorsa.
+    """
+    if not automata:
+        raise ValueError("En az bir otomat gereklidir")
+    num_classes = automata[0].num_classes
+    if any(automaton.num_classes != num_classes for automaton in automata):
+        raise ValueError("Birleşimdeki otomatların alfabeleri uyuşmuyor")
+
+    components = [automaton.complete() for automaton in automata]
+    start = tuple(component.start for component in components)
+    tuples: List[Tuple[int, ...]] = [start]
+    ids: Dict[Tuple[int, ...], int] = {start: 0}
+    transitions = bytearray()
+
+    position = 0
+    while position < len(tuples):
+        current = tuples[position]
+        for class_id in range(num_classes):
+            target = tuple(
+                component.step(state_id, class_id)
+                for component, state_id in zip(components, current)
+            )
+            if target not in ids:
+                ids[target] = len(tuples)
+                tuples.append(target)
+            transitions.append(ids[target])
+        position += 1
+
+    accepting = [
+        any(
+            component.is_accepting(state_id)
+            for component, state_id in zip(components, current)
+        )
+        for current in tuples
+    ]
+    names = [
+        "(" + ", ".join(
+            component.state_names[state_id]
+            for component, state_id in zip(components, current)
+        ) + ")"
+        for current in tuples
+    ]
+    return DFA(num_classes, transitions, accepting, 0, names), tuples
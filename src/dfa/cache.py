@@ -0,0 +1,188 @@
+"""DFA sonuçları için sınırlı boyutlu LRU önbellek.
+
+Önbellek, normalize edilmiş giriş metnini anahtar olarak kullanır.
+İz (trace) istenmediğinde yalnızca karar (son durum, hata indeksi)
+saklanır; tam `RunResult` yalnızca iz istendiğinde önbelleğe alınır.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple, Union
+
+from .compiled import PLATE_DFA, STATE_IDS
+from .runner import RunResult, run_dfa, result_from_verdict
+
+# Varsayılan önbellek boyutu (kayıt sayısı)
+DEFAULT_MAX_SIZE = 65536
+
+# Bu uzunluktan uzun girişler önbelleğe alınmaz (en uzun plaka 11 karakterdir)
+MAX_KEY_LENGTH = 32
+
+# (son durum kimliği, hata indeksi) kararı
+Verdict = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Önbellek istatistikleri."""
+    hits: int  # İsabet sayısı
+    misses: int  # Iskalama sayısı
+    evictions: int  # Boyut veya süre nedeniyle çıkarılan kayıt sayısı
+    size: int  # Güncel kayıt sayısı
+    max_size: int  # En fazla kayıt sayısı
+
+    @property
+    def hit_rate(self) -> float:
+        """İsabet oranını (0-1) döndürür."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """`run_dfa` ve kabul-odaklı yolların önünde duran LRU önbellek."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Önbelleği oluşturur.
+
+        Args:
+            max_size: En fazla kayıt sayısı.
+            ttl: Kayıt ömrü (saniye). None ise kayıtlar süresizdir.
+            clock: Zaman kaynağı (saniye döndüren fonksiyon).
+
+        Raises:
+            ValueError: max_size veya ttl pozitif değilse.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size pozitif olmalıdır, alınan: {max_size}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl pozitif olmalıdır, alınan: {ttl}")
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[Union[Verdict, RunResult], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # ---------- Public API ----------
+    def accepts(self, input_string: str) -> bool:
+        """Girişin kabul edilip edilmediğini önbellek üzerinden döndürür."""
+        final_id, _ = self._verdict(input_string)
+        return PLATE_DFA.is_accepting_id(final_id)
+
+    def validate(self, input_string: str) -> Tuple[bool, Optional[int]]:
+        """`runner.validate` ile aynı sonucu önbellek üzerinden döndürür."""
+        final_id, fail_index = self._verdict(input_string)
+        if fail_index >= 0:
+            return False, fail_index
+        return PLATE_DFA.is_accepting_id(final_id), None
+
+    def run_dfa(self, input_string: str, trace: bool = False) -> RunResult:
+        """`runner.run_dfa` ile aynı sonucu önbellek üzerinden döndürür.
+
+        İz istendiğinde dönen `RunResult` önbellekle paylaşılır;
+        değiştirilmemelidir.
+        """
+        if trace:
+            return self._traced(input_string)
+        return result_from_verdict(input_string, *self._verdict(input_string))
+
+    def cache_info(self) -> CacheInfo:
+        """Önbellek istatistiklerini döndürür."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self._max_size
+            )
+
+    def cache_clear(self) -> None:
+        """Tüm kayıtları ve sayaçları sıfırlar."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    # ---------- Yardımcılar ----------
+    def _verdict(self, input_string: str) -> Verdict:
+        """Kararı önbellekten okur veya hesaplayıp saklar."""
+        if len(input_string) > MAX_KEY_LENGTH:
+            return PLATE_DFA.run(input_string)
+
+        cached = self._lookup(input_string)
+        if cached is not None:
+            if isinstance(cached, RunResult):
+                return _verdict_from_result(cached)
+            return cached
+
+        verdict = PLATE_DFA.run(input_string)
+        self._store(input_string, verdict)
+        return verdict
+
+    def _traced(self, input_string: str) -> RunResult:
+        """İzli sonucu önbellekten okur; yalnızca karar varsa yeniden hesaplar."""
+        if len(input_string) > MAX_KEY_LENGTH:
+            return run_dfa(input_string, trace=True)
+
+        cached = self._lookup(input_string, require_trace=True)
+        if cached is not None:
+            return cached
+
+        result = run_dfa(input_string, trace=True)
+        self._store(input_string, result)
+        return result
+
+    def _lookup(
+        self,
+        key: str,
+        require_trace: bool = False
+    ) -> Optional[Union[Verdict, RunResult]]:
+        """Geçerli (süresi dolmamış) kaydı döndürür ve LRU sırasını günceller.
+
+        İz istendiğinde yalnızca karar içeren kayıt ıskalama sayılır.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at < self._clock():
+                    del self._entries[key]
+                    self._evictions += 1
+                elif not require_trace or isinstance(value, RunResult):
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+
+            self._misses += 1
+            return None
+
+    def _store(self, key: str, value: Union[Verdict, RunResult]) -> None:
+        """Kaydı ekler ve gerekirse en eski kayıtları çıkarır."""
+        expires_at = (
+            self._clock() + self._ttl if self._ttl is not None else float("inf")
+        )
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+
+def _verdict_from_result(result: RunResult) -> Verdict:
+    """İzli sonuçtan (son durum kimliği, hata indeksi) kararını çıkarır."""
+    fail_index = -1 if result.fail_index is None else result.fail_index
+    return STATE_IDS[result.final_state], fail_index
@@ -0,0 +1,237 @@
+"""Geçerli plakaların tamsayı kodlarına (ve geri) dönüştürülmesi.
+
+Her geçerli plaka, karışık tabanlı (mixed radix) tek bir tamsayıya eşlenir:
+
+    kod = ((il - 1) * HARF_UZAYI + harf_sırası) * SERİ_UZAYI + seri_sırası
+
+- il: 1-81 (81 değer)
+- harf_sırası: 1-3 harfli blokların, öneki önce gelen sözlük sırası
+  (23 + 23² + 23³ = 12719 değer)
+- seri_sırası: seri numarasının önce sayısal değere, sonra basamak sayısına
+  göre sırası; "12" < "012" < "0012" < "13" < "123" (11100 değer)
+
+Böylece kodların sırası plakaların doğal (natural) sıralamasıyla aynıdır:
+il numarası, harfler, seri numarasının sayısal değeri, basamak sayısı.
+
+Dilde 81 × 12719 × 11100 = 11.435.652.900 plaka vardır; bu 2^32'yi
+aştığından kodlar 34 bitliktir ve toplu işlemlerde `array('Q')` kullanılır
+(plaka başına 8 bayt).
+
+Kodlama ayrı bir ayrıştırıcı değil, DFA geçişinin kendisidir: durum başına
+önceden hesaplanan tablo her karakter için hedef durumu ve koda katkısını
+(il rakamı veya harf ağırlığı) birlikte verir; geçersiz girişler aynı
+geçişte reddedilir. Seri sırası kabul durumundan sonra tablodan okunur.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+from .alphabet import ALLOWED_LETTERS
+from .compiled import PLATE_DFA, STATES, STATE_IDS, START_ID, DEAD_ID
+from .tr_plate_dfa import State, MIN_PROVINCE_CODE, MAX_PROVINCE_CODE
+
+# Harfler ve sıraları
+LETTERS = "".join(sorted(ALLOWED_LETTERS))
+_LETTER_INDEX = {letter: index for index, letter in enumerate(LETTERS)}
+MAX_LETTERS = 3
+
+# Seri numarası basamak sayıları
+MIN_SERIAL_WIDTH = 2
+MAX_SERIAL_WIDTH = 4
+
+# Alan boyutları
+PROVINCE_SPACE = MAX_PROVINCE_CODE - MIN_PROVINCE_CODE + 1
+LETTER_SPACE = sum(len(LETTERS) ** length for length in range(1, MAX_LETTERS + 1))
+SERIAL_SPACE = sum(10 ** width for width in range(MIN_SERIAL_WIDTH, MAX_SERIAL_WIDTH + 1))
+CODE_SPACE = PROVINCE_SPACE * LETTER_SPACE * SERIAL_SPACE
+
+# Toplu kodlama dizisinin türü ve geçersiz girişler için işaret değeri
+CODE_TYPECODE = "Q"
+INVALID_CODE = (1 << 64) - 1
+
+
+def _subtree_size(remaining: int) -> int:
+    """Bir harften sonra en fazla `remaining` harf daha eklenebilen blok sayısı."""
+    return sum(len(LETTERS) ** length for length in range(remaining + 1))
+
+
+# Kod alanlarının çarpanları
+_PROVINCE_UNIT = LETTER_SPACE * SERIAL_SPACE
+_LETTER_UNIT = SERIAL_SPACE
+
+# İl ilk rakamı durumları ve harf durumları (durum -> bloktaki konum)
+_PROVINCE_FIRST_STATES = (State.Q1_0, State.Q1_1_7, State.Q1_8)
+_LETTER_POSITIONS = {State.Q4: 0, State.Q5: 1, State.Q6: 2}
+
+# Kabul durumuna göre seri numarasının basamak sayısı (0: kabul değil)
+_SERIAL_WIDTHS = bytearray(len(STATES))
+_SERIAL_WIDTHS[STATE_IDS[State.Q9]] = 2
+_SERIAL_WIDTHS[STATE_IDS[State.Q10]] = 3
+_SERIAL_WIDTHS[STATE_IDS[State.Q11]] = 4
+
+
+def _contribution(target: State, ch: str) -> int:
+    """`target` durumuna `ch` ile geçişin koda eklediği değeri döndürür.
+
+    İl rakamları konum değeriyle, harfler sözlük sırasındaki ağırlıklarıyla
+    katkı yapar. Seri rakamları 0 ekler; seri sırası kabulden sonra eklenir.
+    """
+    if target in _PROVINCE_FIRST_STATES:
+        return (ord(ch) - 48) * 10 * _PROVINCE_UNIT
+    if target == State.Q2:
+        return (ord(ch) - 48) * _PROVINCE_UNIT
+    position = _LETTER_POSITIONS.get(target)
+    if position is not None:
+        weight = _subtree_size(MAX_LETTERS - 1 - position)
+        return (_LETTER_INDEX[ch] * weight + (1 if position else 0)) * _LETTER_UNIT
+    return 0
+
+
+def _build_steps() -> Tuple[Dict[str, Tuple[int, int]], ...]:
+    """Durum başına {karakter: (hedef durum, koda katkı)} tablosunu üretir.
+
+    Tablo, derlenmiş DFA geçiş tablosunun karakterlere açılmış hâlidir;
+    ölü duruma giden karakterler tabloda yer almaz. Böylece kodlama,
+    geçiş başına tek bir sözlük araması yapan DFA geçişinin kendisidir.
+    """
+    steps = []
+    for state_id in range(len(STATES)):
+        table: Dict[str, Tuple[int, int]] = {}
+        for code, byte_class in enumerate(PLATE_DFA.ascii_classes):
+            target = PLATE_DFA.step(state_id, byte_class)
+            if target != DEAD_ID:
+                ch = chr(code)
+                table[ch] = (target, _contribution(STATES[target], ch))
+        steps.append(table)
+    return tuple(steps)
+
+
+_STEPS = _build_steps()
+
+
+def _serial_rank(value: int, width: int) -> int:
+    """Seri numarasının (değer, basamak sayısı) doğal sırasını döndürür."""
+    rank = 0
+    for limit_width in range(MIN_SERIAL_WIDTH, MAX_SERIAL_WIDTH + 1):
+        # Bu değerden küçük olup bu genişlikte yazılabilen değerler
+        rank += min(value, 10 ** limit_width)
+    return rank + width - max(MIN_SERIAL_WIDTH, len(str(value)))
+
+
+# Seri numarası metninden sırasına tablo ("012" -> sıra)
+_SERIAL_RANKS: Dict[str, int] = {
+    f"{value:0{width}d}": _serial_rank(value, width)
+    for width in range(MIN_SERIAL_WIDTH, MAX_SERIAL_WIDTH + 1)
+    for value in range(10 ** width)
+}
+
+
+def _serial_unrank(rank: int) -> Tuple[int, int]:
+    """Seri sırasından (değer, basamak sayısı) çiftini döndürür."""
+    start = 0
+    lower = 0
+    for widths in range(MAX_SERIAL_WIDTH - MIN_SERIAL_WIDTH + 1, 0, -1):
+        upper = 10 ** (MAX_SERIAL_WIDTH - widths + 1)
+        block = (upper - lower) * widths
+        if rank < start + block:
+            offset = rank - start
+            value = lower + offset // widths
+            return value, MAX_SERIAL_WIDTH - widths + 1 + offset % widths
+        start += block
+        lower = upper
+    raise ValueError(f"Seri sırası aralık dışında: {rank}")
+
+
+def _encode(plate: str) -> int:
+    """Plakanın kodunu döndürür; plaka geçerli değilse -1 döndürür."""
+    steps = _STEPS
+    state_id = START_ID
+    code = -MIN_PROVINCE_CODE * _PROVINCE_UNIT
+
+    for ch in plate:
+        step = steps[state_id].get(ch)
+        if step is None:
+            return -1
+        state_id, contribution = step
+        code += contribution
+
+    width = _SERIAL_WIDTHS[state_id]
+    if not width:
+        return -1
+    return code + _SERIAL_RANKS[plate[-width:]]
+
+
+def encode(plate: str) -> int:
+    """Geçerli bir plakayı tek DFA geçişinde tamsayı koduna çevirir.
+
+    Args:
+        plate: Normalize edilmiş plaka.
+
+    Returns:
+        0 ile `CODE_SPACE - 1` arasında kod.
+
+    Raises:
+        ValueError: Plaka geçerli değilse.
+    """
+    code = _encode(plate)
+    if code < 0:
+        raise ValueError(f"Geçerli bir plaka değil: {plate!r}")
+    return code
+
+
+def decode(code: int) -> str:
+    """Tamsayı kodunu plakaya çevirir.
+
+    Args:
+        code: `encode` ile üretilmiş kod.
+
+    Returns:
+        Normalize edilmiş plaka.
+
+    Raises:
+        ValueError: Kod aralık dışındaysa.
+    """
+    if not 0 <= code < CODE_SPACE:
+        raise ValueError(f"Geçersiz plaka kodu: {code}")
+
+    rest, serial_rank = divmod(code, SERIAL_SPACE)
+    province_index, letter_rank = divmod(rest, LETTER_SPACE)
+
+    letters: List[str] = []
+    for position in range(MAX_LETTERS):
+        if position:
+            if letter_rank == 0:
+                break
+            letter_rank -= 1  # Önekin kendisi
+        weight = _subtree_size(MAX_LETTERS - 1 - position)
+        index, letter_rank = divmod(letter_rank, weight)
+        letters.append(LETTERS[index])
+
+    value, width = _serial_unrank(serial_rank)
+    return (
+        f"{province_index + MIN_PROVINCE_CODE:02d} "
+        f"{''.join(letters)} {value:0{width}d}"
+    )
+
+
+def encode_many(plates: Iterable[str]) -> array:
+    """Plakaları toplu olarak kodlar.
+
+    Geçersiz plakalar için `INVALID_CODE` yazılır.
+
+    Returns:
+        `array('Q')` kod dizisi.
+    """
+    return array(
+        CODE_TYPECODE,
+        [code if code >= 0 else INVALID_CODE for code in map(_encode, plates)]
+    )
+
+
+def decode_many(codes: Iterable[int]) -> List[str]:
+    """Kodları toplu olarak plakalara çevirir.
+
+    Raises:
+        ValueError: Geçersiz (ör. `INVALID_CODE`) bir kod varsa.
+    """
+    return [decode(code) for code in codes]
@@ -0,0 +1,212 @@
+"""Plaka otomatı için özelleştirilmiş Python kodu üretimi.
+
+Derlenmiş geçiş tablosu, her karakter konumu için açılmış (unrolled) düz
+bir Python fonksiyonuna çevrilir. Üretilen kodda sözlük erişimi, Enum
+karşılaştırması veya tablo okuması yoktur; her konumda yalnızca o konumda
+ulaşılabilen durumlar için yerel değişken karşılaştırmaları yapılır.
+Açılım yalnızca döngüsüz (sonlu dil) otomatlarda sonludur; döngü içeren bir
+tablo (ör. sınırsız seri numarası) `generate_source` tarafından reddedilir ve
+`load_generated_run` tablo motoruna geri döner.
+
+Üretilen kaynak, geçiş tablosunun özetiyle (hash) adlandırılmış bir dosya
+olarak `__pycache__` dizinine yazılır ve sonraki içe aktarmalarda yeniden
+kullanılır. Dizin yazılamıyorsa kod yalnızca bellekte derlenir.
+"""
+
+import hashlib
+import os
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .compiled import (
+    PLATE_DFA,
+    STATES,
+    START_ID,
+    DEAD_ID,
+    NUM_CLASSES,
+    CLASS_OTHER,
+)
+
+# Üretici sürümü (çıktı biçimi değiştiğinde artırılır; önbelleği geçersiz kılar)
+GENERATOR_VERSION = 1
+
+# Üretilen dosyaların saklandığı dizin
+CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "__pycache__"
+)
+
+GENERATED_FUNCTION_NAME = "run_generated"
+
+# (son durum kimliği, hata indeksi) döndüren çalıştırıcı
+VerdictFunction = Callable[[str], Tuple[int, int]]
+
+
+def table_digest() -> str:
+    """Geçiş tablosunun ve üretici sürümünün kısa özetini döndürür."""
+    digest = hashlib.sha256()
+    digest.update(bytes([GENERATOR_VERSION, NUM_CLASSES, START_ID, DEAD_ID]))
+    digest.update(PLATE_DFA.transitions)
+    digest.update(PLATE_DFA.ascii_classes)
+    digest.update(PLATE_DFA.accepting)
+    return digest.hexdigest()[:16]
+
+
+def _char_condition(codes: List[int]) -> str:
+    """Karakter kodu kümesi için `ch` üzerinde bir koşul ifadesi üretir."""
+    codes = sorted(codes)
+    if len(codes) == 1:
+        return f"ch == {chr(codes[0])!r}"
+    if codes[-1] - codes[0] == len(codes) - 1:
+        return f"{chr(codes[0])!r} <= ch <= {chr(codes[-1])!r}"
+    members = ", ".join(repr(chr(code)) for code in codes)
+    return f"ch in {{{members}}}"
+
+
+def _outgoing(state_id: int) -> List[Tuple[int, List[int]]]:
+    """Bir durumdan canlı hedeflere giden (hedef, karakter kodları) listesi."""
+    targets: Dict[int, List[int]] = {}
+    for code, byte_class in enumerate(PLATE_DFA.ascii_classes):
+        if byte_class == CLASS_OTHER:
+            continue
+        next_id = PLATE_DFA.step(state_id, byte_class)
+        if next_id != DEAD_ID:
+            targets.setdefault(next_id, []).append(code)
+    return sorted(targets.items())
+
+
+def find_cycle() -> Optional[List[int]]:
+    """Başlangıçtan ulaşılabilen canlı durumlar arasında bir döngü arar.
+
+    Returns:
+        Döngüdeki durum kimlikleri (ilk durum sonda tekrar edilir) veya
+        döngü yoksa None.
+    """
+    # 0: ziyaret edilmedi, 1: yığında, 2: tamamlandı
+    marks = [0] * len(STATES)
+    path: List[int] = [START_ID]
+    stack = [iter(_outgoing(START_ID))]
+    marks[START_ID] = 1
+
+    while stack:
+        for next_id, _ in stack[-1]:
+            if marks[next_id] == 1:
+                return path[path.index(next_id):] + [next_id]
+            if marks[next_id] == 0:
+                marks[next_id] = 1
+                path.append(next_id)
+                stack.append(iter(_outgoing(next_id)))
+                break
+        else:
+            marks[path.pop()] = 2
+            stack.pop()
+    return None
+
+
+def generate_source() -> str:
+    """Otomat için konum bazında açılmış Python kaynak kodunu üretir.
+
+    Returns:
+        `run_generated(text) -> (son durum kimliği, hata indeksi)`
+        fonksiyonunu tanımlayan kaynak kod.
+
+    Raises:
+        ValueError: Otomat döngü içeriyorsa (açılım sonsuz olurdu).
+    """
+    cycle = find_cycle()
+    if cycle is not None:
+        names = " -> ".join(STATES[state_id].value for state_id in cycle)
+        raise ValueError(f"Döngü içeren otomat açılamaz: {names}")
+
+    lines = [
+        f"# Otomatik üretilmiştir (tablo özeti {table_digest()}); elle düzenlemeyin.",
+        "",
+        "",
+        f"def {GENERATED_FUNCTION_NAME}(text):",
+        "    length = len(text)",
+        f"    state = {START_ID}",
+    ]
+
+    reachable: Set[int] = {START_ID}
+    position = 0
+    while reachable:
+        lines.append(f"    if length == {position}:")
+        lines.append("        return state, -1")
+        lines.append(f"    ch = text[{position}]")
+
+        next_reachable: Set[int] = set()
+        ordered = sorted(reachable)
+        for branch_index, state_id in enumerate(ordered):
+            indent = "    "
+            if len(ordered) > 1:
+                keyword = "if" if branch_index == 0 else "elif"
+                lines.append(
+                    f"    {keyword} state == {state_id}:  # {STATES[state_id].value}"
+                )
+                indent = "        "
+
+            outgoing = _outgoing(state_id)
+            for target_index, (next_id, codes) in enumerate(outgoing):
+                keyword = "if" if target_index == 0 else "elif"
+                lines.append(f"{indent}{keyword} {_char_condition(codes)}:")
+                lines.append(f"{indent}    state = {next_id}")
+                next_reachable.add(next_id)
+
+            if outgoing:
+                lines.append(f"{indent}else:")
+                lines.append(f"{indent}    return {DEAD_ID}, {position}")
+            else:
+                lines.append(f"{indent}return {DEAD_ID}, {position}")
+
+        reachable = next_reachable
+        position += 1
+
+    return "\n".join(lines) + "\n"
+
+
+def _cache_path(digest: str) -> str:
+    """Üretilen kaynağın önbellek dosyası yolunu döndürür."""
+    return os.path.join(CACHE_DIR, f"plate_dfa_generated_{digest}.py")
+
+
+def _read_or_generate(path: str) -> str:
+    """Önbellekteki kaynağı okur; yoksa üretip yazmayı dener."""
+    try:
+        with open(path, "r", encoding="utf-8") as stream:
+            return stream.read()
+    except OSError:
+        pass
+
+    source = generate_source()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as stream:
+            stream.write(source)
+        os.replace(temporary_path, path)
+    except OSError:
+        # Salt okunur kurulumlarda yalnızca bellekte derlenir
+        pass
+    return source
+
+
+def load_generated_run() -> VerdictFunction:
+    """Üretilen çalıştırıcıyı (gerekirse üreterek) derler ve döndürür.
+
+    Otomat döngü içeriyorsa kod üretilmez; tablo motoru (`PLATE_DFA.run`)
+    döndürülür.
+
+    Returns:
+        `(son durum kimliği, hata indeksi)` döndüren fonksiyon.
+    """
+    if find_cycle() is not None:
+        return PLATE_DFA.run
+
+    path = _cache_path(table_digest())
+    source = _read_or_generate(path)
+    namespace: Dict[str, object] = {}
+    exec(compile(source, path, "exec"), namespace)
+    return namespace[GENERATED_FUNCTION_NAME]  # type: ignore[return-value]
+
+
+# İçe aktarma sırasında derlenen çalıştırıcı
+run_generated: VerdictFunction = load_generated_run()
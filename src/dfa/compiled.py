@@ -0,0 +1,238 @@
+"""Plaka DFA'sının yoğun (dense) tamsayı geçiş tablosuna derlenmiş hâli.
+
+`tr_plate_dfa` modülündeki `TRANSITIONS` tablosu ve il kodu özel kuralları,
+(durum_id, bayt_sınıfı) ile indekslenen düz bir tamsayı tablosuna indirgenir.
+İl kodu rakam ayrımları (0 / 1 / 2-7 / 8 / 9) ek karakter sınıfları olarak
+temsil edildiğinden, sıcak döngüde karakter başına tek bir tablo okuması yapılır.
+"""
+
+from typing import List, Tuple
+
+from .alphabet import CharClass, classify_char
+from .automaton import DFA
+from .tr_plate_dfa import State, Q0, is_accepting, next_state_with_char
+
+# Bayt sınıfları (il kodu rakam ayrımları dahil)
+CLASS_OTHER = 0
+CLASS_SPACE = 1
+CLASS_LETTER = 2
+CLASS_DIGIT_0 = 3
+CLASS_DIGIT_1 = 4
+CLASS_DIGIT_2_7 = 5
+CLASS_DIGIT_8 = 6
+CLASS_DIGIT_9 = 7
+NUM_CLASSES = 8
+
+# Her bayt sınıfı için temsilci karakter (tablo bu karakterlerle üretilir)
+CLASS_REPRESENTATIVES = ("#", " ", "A", "0", "1", "2", "8", "9")
+
+# Bayt sınıfından genel karakter sınıfına eşleme
+BYTE_CLASS_TO_CHAR_CLASS = (
+    CharClass.OTHER,
+    CharClass.SPACE,
+    CharClass.LETTER,
+    CharClass.DIGIT,
+    CharClass.DIGIT,
+    CharClass.DIGIT,
+    CharClass.DIGIT,
+    CharClass.DIGIT,
+)
+
+# Durum kimlikleri (State tanım sırası)
+STATES: Tuple[State, ...] = tuple(State)
+STATE_IDS = {state: state_id for state_id, state in enumerate(STATES)}
+START_ID = STATE_IDS[Q0]
+DEAD_ID = STATE_IDS[State.DEAD]
+
+# Tablo boyutu dışındaki karakterler için sınır
+ASCII_LIMIT = 128
+
+
+def byte_class_of(ch: str) -> int:
+    """Bir karakterin bayt sınıfını hesaplar.
+
+    Args:
+        ch: Sınıflandırılacak karakter (tek karakter).
+
+    Returns:
+        Bayt sınıfı kimliği (CLASS_* sabitlerinden biri).
+    """
+    cc = classify_char(ch)
+    if cc == CharClass.SPACE:
+        return CLASS_SPACE
+    if cc == CharClass.LETTER:
+        return CLASS_LETTER
+    if cc != CharClass.DIGIT:
+        return CLASS_OTHER
+
+    if ch == "0":
+        return CLASS_DIGIT_0
+    if ch == "1":
+        return CLASS_DIGIT_1
+    if ch == "8":
+        return CLASS_DIGIT_8
+    if ch == "9":
+        return CLASS_DIGIT_9
+    return CLASS_DIGIT_2_7
+
+
+def _lower_transitions() -> List[int]:
+    """Her (durum, bayt sınıfı) çifti için sonraki durumu hesaplar."""
+    table: List[int] = []
+    for state in STATES:
+        for representative in CLASS_REPRESENTATIVES:
+            next_state = next_state_with_char(
+                state,
+                representative,
+                classify_char(representative)
+            )
+            table.append(STATE_IDS[next_state])
+    return table
+
+
+def build_plate_automaton() -> DFA:
+    """`tr_plate_dfa` kurallarını bayt sınıfları üzerinde genel bir DFA'ya indirger.
+
+    Durum kimlikleri `STATES` sırasını izler; böylece iz (trace) ve arayüz
+    kodu `State` değerlerine doğrudan geri dönebilir.
+    """
+    return DFA(
+        NUM_CLASSES,
+        _lower_transitions(),
+        (is_accepting(state) for state in STATES),
+        START_ID,
+        [state.value for state in STATES]
+    )
+
+
+# `tr_plate_dfa` otomatının genel DFA gösterimi (tüm hızlı motorların kaynağı)
+PLATE_AUTOMATON = build_plate_automaton()
+
+
+class _ByteClassTable(dict):
+    """Tabloda olmayan karakterleri OTHER bayt sınıfına eşleyen çeviri tablosu."""
+
+    def __missing__(self, code: int) -> int:
+        return CLASS_OTHER
+
+
+class CompiledPlateDFA:
+    """Plaka DFA'sının düz tamsayı tablosu üzerinde çalışan derlenmiş hâli.
+
+    Durum kimlikleri `STATES` sırasını izleyen tam bir `DFA` örneğinden
+    beslenir.
+
+    Attributes:
+        automaton: Tablonun kaynağı olan genel otomat.
+        transitions: `transitions[state_id * NUM_CLASSES + byte_class]`
+            biçiminde indekslenen sonraki durum kimlikleri.
+        ascii_classes: ASCII karakterlerin bayt sınıfları (ord ile indekslenir).
+        accepting: Durum kimliğine göre kabul bayrakları (1/0).
+    """
+
+    def __init__(self, automaton: DFA = PLATE_AUTOMATON) -> None:
+        """Geçiş tablosunu verilen otomattan alır.
+
+        Args:
+            automaton: Bayt sınıfları üzerinde tanımlı, `STATES` sırasıyla
+                numaralandırılmış tam otomat.
+
+        Raises:
+            ValueError: Otomat bu tabloyla uyumlu değilse.
+        """
+        if automaton.num_classes != NUM_CLASSES or len(automaton) != len(STATES):
+            raise ValueError(f"Plaka tablosuyla uyumsuz otomat: {automaton!r}")
+        if not automaton.is_complete() or DEAD_ID in automaton.live_states():
+            raise ValueError("Otomat tam olmalı ve ölü durum canlı olmamalıdır")
+
+        self.automaton = automaton
+        self.ascii_classes = bytes(
+            byte_class_of(chr(code)) for code in range(ASCII_LIMIT)
+        )
+        self.transitions = automaton.transitions
+        self.accepting = automaton.accepting
+
+        # str.translate ile toplu sınıflandırma tablosu (ASCII dışı: OTHER)
+        self._class_translation = _ByteClassTable(
+            (code, byte_class) for code, byte_class in enumerate(self.ascii_classes)
+        )
+
+        # Sıcak döngü için önceden çarpılmış satır ofsetleri
+        self._jump: List[int] = [
+            next_id * NUM_CLASSES for next_id in self.transitions
+        ]
+        self._start_offset = automaton.start * NUM_CLASSES
+        self._dead_offset = DEAD_ID * NUM_CLASSES
+
+    def class_of(self, ch: str) -> int:
+        """Bir karakterin bayt sınıfını tablo üzerinden döndürür."""
+        code = ord(ch)
+        return self.ascii_classes[code] if code < ASCII_LIMIT else CLASS_OTHER
+
+    def classify(self, text: str) -> bytes:
+        """Normalize edilmiş bir metnin bayt sınıflarını tek geçişte döndürür."""
+        return text.translate(self._class_translation).encode("ascii")
+
+    def step(self, state_id: int, byte_class: int) -> int:
+        """Tek bir geçişi uygular.
+
+        Args:
+            state_id: Geçerli durum kimliği.
+            byte_class: Okunan karakterin bayt sınıfı.
+
+        Returns:
+            Sonraki durum kimliği.
+        """
+        return self.transitions[state_id * NUM_CLASSES + byte_class]
+
+    def run(self, text: str) -> Tuple[int, int]:
+        """Metni iz (trace) tutmadan çalıştırır.
+
+        Args:
+            text: Doğrulanacak (normalize edilmiş) metin.
+
+        Returns:
+            (son durum kimliği, hata indeksi) çifti. Hata yoksa indeks -1'dir.
+        """
+        jump = self._jump
+        classes = self.ascii_classes
+        dead = self._dead_offset
+        offset = self._start_offset
+
+        for index, ch in enumerate(text):
+            code = ord(ch)
+            offset = jump[
+                offset + (classes[code] if code < ASCII_LIMIT else CLASS_OTHER)
+            ]
+            if offset == dead:
+                return DEAD_ID, index
+
+        return offset // NUM_CLASSES, -1
+
+    def run_classes(self, classes: bytes) -> Tuple[int, int]:
+        """Önceden sınıflandırılmış bayt sınıfı dizisini çalıştırır.
+
+        Args:
+            classes: Her karakter için bir bayt sınıfı (ör. `normalize_to_classes`).
+
+        Returns:
+            (son durum kimliği, hata indeksi) çifti. Hata yoksa indeks -1'dir.
+        """
+        jump = self._jump
+        dead = self._dead_offset
+        offset = self._start_offset
+
+        for index, byte_class in enumerate(classes):
+            offset = jump[offset + byte_class]
+            if offset == dead:
+                return DEAD_ID, index
+
+        return offset // NUM_CLASSES, -1
+
+    def is_accepting_id(self, state_id: int) -> bool:
+        """Durum kimliğinin kabul durumu olup olmadığını döndürür."""
+        return self.accepting[state_id] == 1
+
+
+# Modül genelinde paylaşılan derlenmiş otomat
+PLATE_DFA = CompiledPlateDFA()
@@ -0,0 +1,269 @@
+"""Birden fazla plaka formatını tek geçişte tanıyan birleşim otomatı.
+
+Her format kendi alfabesi (ASCII karakterden sınıf kimliğine tablo) ve
+kendi `DFA`'sı ile tanımlanır. Formatların alfabeleri ortak bir inceltmede
+(refinement) birleştirilir: iki karakter ancak tüm formatlarda aynı sınıfa
+düşüyorsa aynı ortak sınıftadır. Format otomatları bu ortak alfabeye
+taşınır ve çarpım yapısıyla tek bir otomatta birleştirilir; kabul durumları
+hangi formatların eşleştiğini gösteren bit maskeleriyle etiketlenir.
+
+Varsayılan formatlar: standart, katı harf/rakam eşleştirmesi ve
+diplomatik (CC/CD) seriler. Resmî (kamu kurumu) seriler dahil değildir:
+bu serilerin harf ve rakam kuralları bu depoda tanımlı değildir. Kuralları
+belirlendiğinde `pattern_format` ile tanımlanıp `MultiFormatDFA` yapısına
+eklenebilirler.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from .automaton import DFA, MISSING, union_product
+from .compiled import PLATE_AUTOMATON, PLATE_DFA, ASCII_LIMIT, CLASS_LETTER
+
+# Format kimlikleri (`DEFAULT_FORMATS` sırası)
+FORMAT_STANDARD = 0
+FORMAT_STRICT = 1
+FORMAT_DIPLOMATIC = 2
+
+# Karakter kümeleri
+DIGITS = "0123456789"
+PLATE_LETTERS = "".join(
+    chr(code)
+    for code, byte_class in enumerate(PLATE_DFA.ascii_classes)
+    if byte_class == CLASS_LETTER
+)
+
+# İl kodu (01-81) kalıpları
+PROVINCE_PATTERNS: Tuple[Tuple[str, ...], ...] = (
+    ("0", "123456789"),
+    ("1234567", DIGITS),
+    ("8", "01"),
+)
+
+# Harf sayısına göre izin verilen rakam sayıları (katı eşleştirme)
+STRICT_PAIRINGS: Dict[int, Tuple[int, ...]] = {
+    1: (4,),
+    2: (3, 4),
+    3: (2, 3),
+}
+
+# Diplomatik seriler (CC: konsolosluk, CD: kordiplomatik) ve rakam sayıları
+DIPLOMATIC_SERIES = ("CC", "CD")
+DIPLOMATIC_DIGIT_COUNTS = (3, 4)
+
+# Kalıp: her konum için izin verilen karakterler
+Pattern = Sequence[str]
+
+
+@dataclass(frozen=True)
+class PlateFormat:
+    """Tek bir plaka formatının tanımı."""
+    name: str  # Format adı
+    automaton: DFA  # Formatın otomatı
+    ascii_classes: bytes  # ASCII karakterden otomat sınıfına tablo (0: diğer)
+
+    def class_of(self, ch: str) -> int:
+        """Bir karakterin bu formattaki sınıfını döndürür."""
+        code = ord(ch)
+        return self.ascii_classes[code] if code < ASCII_LIMIT else 0
+
+
+def pattern_format(name: str, patterns: Sequence[Pattern]) -> PlateFormat:
+    """Konum kalıplarının birleşimini tanıyan bir format oluşturur.
+
+    Alfabe, kalıplardaki karakter kümelerinden otomatik türetilir: aynı
+    kümelere üye olan karakterler aynı sınıftadır. Sınıf 0, hiçbir kümede
+    bulunmayan karakterlerdir.
+
+    Args:
+        name: Format adı.
+        patterns: Her biri konum başına izin verilen karakterleri veren kalıplar.
+
+    Returns:
+        Küçültülmüş otomatlı format.
+    """
+    charsets = sorted({charset for pattern in patterns for charset in pattern})
+    ascii_classes = _classes_from_signatures(
+        [tuple(chr(code) in charset for charset in charsets) for code in range(ASCII_LIMIT)]
+    )
+    num_classes = max(ascii_classes) + 1
+
+    chains: List[DFA] = []
+    for pattern in patterns:
+        transitions = bytearray([MISSING] * ((len(pattern) + 1) * num_classes))
+        for position, charset in enumerate(pattern):
+            for code in range(ASCII_LIMIT):
+                if chr(code) in charset:
+                    transitions[position * num_classes + ascii_classes[code]] = position + 1
+        accepting = [0] * len(pattern) + [1]
+        chains.append(DFA(num_classes, transitions, accepting))
+
+    automaton, _ = union_product(chains)
+    return PlateFormat(name, automaton.minimize(), ascii_classes)
+
+
+def _classes_from_signatures(signatures: Sequence[tuple]) -> bytes:
+    """ASCII karakter imzalarını, ilk görülme sırasıyla sınıf kimliklerine çevirir.
+
+    NUL karakterinin imzası (hiçbir kümeye üye olmayanlar) sınıf 0 olur.
+    """
+    ids: Dict[tuple, int] = {}
+    return bytes(ids.setdefault(signature, len(ids)) for signature in signatures)
+
+
+def _standard_format() -> PlateFormat:
+    """Mevcut `tr_plate_dfa` otomatını format olarak döndürür."""
+    return PlateFormat("standart", PLATE_AUTOMATON, PLATE_DFA.ascii_classes)
+
+
+def _strict_format() -> PlateFormat:
+    """Harf sayısına göre rakam sayısını sınırlayan katı formatı oluşturur."""
+    patterns = [
+        province + (" ",) + (PLATE_LETTERS,) * letters + (" ",) + (DIGITS,) * digits
+        for province in PROVINCE_PATTERNS
+        for letters, digit_counts in STRICT_PAIRINGS.items()
+        for digits in digit_counts
+    ]
+    return pattern_format("katı", patterns)
+
+
+def _diplomatic_format() -> PlateFormat:
+    """Diplomatik (CC/CD) seri formatını oluşturur."""
+    patterns = [
+        province + (" ",) + tuple(series) + (" ",) + (DIGITS,) * digits
+        for province in PROVINCE_PATTERNS
+        for series in DIPLOMATIC_SERIES
+        for digits in DIPLOMATIC_DIGIT_COUNTS
+    ]
+    return pattern_format("diplomatik", patterns)
+
+
+class MultiFormatDFA:
+    """Birden fazla formatı tek doğrusal geçişte tanıyan birleşim otomatı.
+
+    Attributes:
+        formats: Formatlar (kimlikleri bu demetteki sıralarıdır).
+        ascii_classes: ASCII karakterden ortak sınıfa tablo.
+        automaton: Ortak alfabe üzerindeki birleşim otomatı.
+        format_masks: Durum kimliğine göre eşleşen formatların bit maskesi.
+    """
+
+    def __init__(self, formats: Sequence[PlateFormat]) -> None:
+        """Formatların ortak alfabesini ve birleşim otomatını kurar."""
+        self.formats: Tuple[PlateFormat, ...] = tuple(formats)
+        self.ascii_classes = _classes_from_signatures(
+            [tuple(fmt.ascii_classes[code] for fmt in self.formats)
+             for code in range(ASCII_LIMIT)]
+        )
+        num_classes = max(self.ascii_classes) + 1
+
+        # Her ortak sınıfın format sınıfları (temsilci karakter üzerinden)
+        representatives: Dict[int, int] = {}
+        for code, class_id in enumerate(self.ascii_classes):
+            representatives.setdefault(class_id, code)
+
+        lifted = [
+            _lift(fmt, [representatives[class_id] for class_id in range(num_classes)])
+            for fmt in self.formats
+        ]
+        self.automaton, self._components = union_product(lifted)
+
+        self.format_masks: Tuple[int, ...] = tuple(
+            sum(
+                1 << format_id
+                for format_id, (automaton, state_id) in enumerate(zip(lifted, components))
+                if automaton.is_accepting(state_id)
+            )
+            for components in self._components
+        )
+
+        # Hiçbir formatın kabule ulaşamayacağı durumlar tek bir ölü duruma yönlenir
+        live = self.automaton.live_states()
+        dead = [state_id for state_id in range(len(self.automaton)) if state_id not in live]
+        self._dead_id = dead[0] if dead else -1
+        self._num_classes = num_classes
+        self._jump: List[int] = [
+            (next_id if next_id in live else self._dead_id) * num_classes
+            for next_id in self.automaton.transitions
+        ]
+
+    def class_of(self, ch: str) -> int:
+        """Bir karakterin ortak sınıfını döndürür."""
+        code = ord(ch)
+        return self.ascii_classes[code] if code < ASCII_LIMIT else 0
+
+    def component_state(self, state_id: int, format_id: int) -> int:
+        """Birleşim durumunun verilen formattaki bileşen durumunu döndürür."""
+        return self._components[state_id][format_id]
+
+    def run(self, text: str) -> Tuple[int, int]:
+        """Metni tüm formatlara karşı tek geçişte çalıştırır.
+
+        Returns:
+            (son durum kimliği, hata indeksi) çifti. Hata indeksi, hiçbir
+            formatın devam edemediği ilk konumdur; yoksa -1'dir.
+        """
+        jump = self._jump
+        classes = self.ascii_classes
+        width = self._num_classes
+        dead = self._dead_id * width
+        offset = self.automaton.start * width
+
+        for index, ch in enumerate(text):
+            code = ord(ch)
+            offset = jump[offset + (classes[code] if code < ASCII_LIMIT else 0)]
+            if offset == dead:
+                return self._dead_id, index
+
+        return offset // width, -1
+
+    def matched_formats(self, state_id: int) -> Tuple[int, ...]:
+        """Bir durumda eşleşen format kimliklerini döndürür."""
+        mask = self.format_masks[state_id]
+        return tuple(
+            format_id for format_id in range(len(self.formats)) if mask >> format_id & 1
+        )
+
+    def match(self, text: str) -> Tuple[int, ...]:
+        """Metnin eşleştiği format kimliklerini döndürür."""
+        state_id, fail_index = self.run(text)
+        if fail_index >= 0:
+            return ()
+        return self.matched_formats(state_id)
+
+    def format_names(self, format_ids: Sequence[int]) -> List[str]:
+        """Format kimliklerini adlarına çevirir."""
+        return [self.formats[format_id].name for format_id in format_ids]
+
+
+def _lift(fmt: PlateFormat, representatives: Sequence[int]) -> DFA:
+    """Bir format otomatını ortak alfabeye taşır.
+
+    Args:
+        fmt: Taşınacak format.
+        representatives: Her ortak sınıf için temsilci ASCII kodu.
+    """
+    automaton = fmt.automaton.complete()
+    transitions = bytearray()
+    for state_id in range(len(automaton)):
+        for code in representatives:
+            transitions.append(automaton.step(state_id, fmt.ascii_classes[code]))
+    return DFA(
+        len(representatives),
+        transitions,
+        automaton.accepting,
+        automaton.start,
+        automaton.state_names
+    )
+
+
+# Varsayılan formatlar (kimlikleri FORMAT_* sabitleriyle uyumludur).
+# Resmî seriler kuralları tanımlı olmadığından dahil değildir.
+DEFAULT_FORMATS: Tuple[PlateFormat, ...] = (
+    _standard_format(),
+    _strict_format(),
+    _diplomatic_format(),
+)
+
+# Modül genelinde paylaşılan birleşim otomatı
+MULTI_FORMAT_DFA = MultiFormatDFA(DEFAULT_FORMATS)
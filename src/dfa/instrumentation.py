@@ -0,0 +1,197 @@
+"""DFA çalıştırıcısı için isteğe bağlı enstrümantasyon (sayaçlar ve süreler).
+
+Enstrümantasyon kapalıyken çalıştırıcıya maliyeti, çağrı başına tek bir
+modül değişkeni denetimidir. Açıkken doğrulamalar, aşağıdaki sayaçları
+güncelleyen ayrı bir yoldan geçer:
+
+- durum başına ziyaret sayısı,
+- (kaynak, hedef) kenarı başına geçiş sayısı,
+- (durum, CharClass) anahtarına göre ret sayısı (girdi bitince kabul
+  dışı bir durumda kalanlar "END" sınıfıyla sayılır),
+- normalize, sınıflandırma ve geçiş aşamalarının toplam süreleri.
+
+Sayaçlar sözlük olarak veya Prometheus metin biçiminde dışa aktarılabilir.
+Sayaçlar iş parçacığı güvenli (thread-safe) değildir.
+"""
+
+import time
+from array import array
+from typing import Any, Dict, List, Tuple
+
+from utils.normalize import normalize_input
+
+from .alphabet import CHAR_CLASSES, CHAR_CLASS_IDS
+from .compiled import (
+    PLATE_DFA,
+    STATES,
+    START_ID,
+    DEAD_ID,
+    NUM_CLASSES,
+    BYTE_CLASS_TO_CHAR_CLASS,
+)
+
+# Ölçülen aşamalar
+PHASE_NORMALIZE = "normalize"
+PHASE_CLASSIFY = "classify"
+PHASE_TRANSITION = "transition"
+PHASES = (PHASE_NORMALIZE, PHASE_CLASSIFY, PHASE_TRANSITION)
+
+# Girdi kabul dışı bir durumda bittiğinde kullanılan ret anahtarı
+END_OF_INPUT = "END"
+
+# Bayt sınıfından CharClass kimliğine eşleme (ret sayaçları için)
+_BYTE_CLASS_TO_CHAR_CLASS_ID = bytes(
+    CHAR_CLASS_IDS[char_class] for char_class in BYTE_CLASS_TO_CHAR_CLASS
+)
+
+_NUM_STATES = len(STATES)
+_NUM_CHAR_CLASSES = len(CHAR_CLASSES)
+
+
+class RunnerStats:
+    """Enstrümanlı çalıştırmaların sayaçları ve aşama süreleri."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Tüm sayaçları ve süreleri sıfırlar."""
+        self.runs = 0
+        self.accepted = 0
+        self.visits = array("Q", bytes(8 * _NUM_STATES))
+        self.edges = array("Q", bytes(8 * _NUM_STATES * _NUM_STATES))
+        self.rejections = array("Q", bytes(8 * _NUM_STATES * _NUM_CHAR_CLASSES))
+        self.incomplete = array("Q", bytes(8 * _NUM_STATES))
+        self.seconds: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+
+    # ---------- Çalıştırma ----------
+    def run_raw(self, raw_input: str) -> Tuple[int, int]:
+        """Ham girişi normalize edip enstrümanlı olarak çalıştırır.
+
+        Returns:
+            (son durum kimliği, hata indeksi) çifti. Hata yoksa indeks -1'dir.
+        """
+        started = time.perf_counter()
+        text = normalize_input(raw_input)
+        self.seconds[PHASE_NORMALIZE] += time.perf_counter() - started
+        return self.run(text)
+
+    def run(self, text: str) -> Tuple[int, int]:
+        """Normalize edilmiş metni enstrümanlı olarak çalıştırır.
+
+        Returns:
+            (son durum kimliği, hata indeksi) çifti. Hata yoksa indeks -1'dir.
+        """
+        started = time.perf_counter()
+        classes = PLATE_DFA.classify(text)
+        classified = time.perf_counter()
+        verdict = self.run_classes(classes)
+        finished = time.perf_counter()
+
+        self.seconds[PHASE_CLASSIFY] += classified - started
+        self.seconds[PHASE_TRANSITION] += finished - classified
+        return verdict
+
+    def run_classes(self, classes: bytes) -> Tuple[int, int]:
+        """Bayt sınıfı dizisini çalıştırır ve sayaçları günceller."""
+        transitions = PLATE_DFA.transitions
+        visits = self.visits
+        edges = self.edges
+        current_id = START_ID
+        visits[current_id] += 1
+        self.runs += 1
+
+        for index, byte_class in enumerate(classes):
+            next_id = transitions[current_id * NUM_CLASSES + byte_class]
+            visits[next_id] += 1
+            edges[current_id * _NUM_STATES + next_id] += 1
+            if next_id == DEAD_ID:
+                char_class_id = _BYTE_CLASS_TO_CHAR_CLASS_ID[byte_class]
+                self.rejections[current_id * _NUM_CHAR_CLASSES + char_class_id] += 1
+                return DEAD_ID, index
+            current_id = next_id
+
+        if PLATE_DFA.is_accepting_id(current_id):
+            self.accepted += 1
+        else:
+            self.incomplete[current_id] += 1
+        return current_id, -1
+
+    # ---------- Dışa aktarma ----------
+    def _rejection_items(self) -> List[Tuple[str, str, int]]:
+        """Sıfır olmayan ret sayaçlarını (durum, sınıf, sayı) olarak döndürür."""
+        items = []
+        for state_id, state in enumerate(STATES):
+            for class_id, char_class in enumerate(CHAR_CLASSES):
+                count = self.rejections[state_id * _NUM_CHAR_CLASSES + class_id]
+                if count:
+                    items.append((state.value, char_class.value, count))
+            if self.incomplete[state_id]:
+                items.append((state.value, END_OF_INPUT, self.incomplete[state_id]))
+        return items
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Sayaçları (sıfır olmayanlarla) sözlük olarak döndürür.
+
+        Returns:
+            `runs`, `accepted`, `visits`, `edges`, `rejections` ve `seconds`
+            anahtarlarını içeren sözlük. Kenar ve ret anahtarları
+            "kaynak->hedef" ve "durum/sınıf" biçimindedir.
+        """
+        return {
+            "runs": self.runs,
+            "accepted": self.accepted,
+            "visits": {
+                state.value: self.visits[state_id]
+                for state_id, state in enumerate(STATES)
+                if self.visits[state_id]
+            },
+            "edges": {
+                f"{source.value}->{target.value}": self.edges[source_id * _NUM_STATES + target_id]
+                for source_id, source in enumerate(STATES)
+                for target_id, target in enumerate(STATES)
+                if self.edges[source_id * _NUM_STATES + target_id]
+            },
+            "rejections": {
+                f"{state}/{char_class}": count
+                for state, char_class, count in self._rejection_items()
+            },
+            "seconds": dict(self.seconds),
+        }
+
+    def to_prometheus(self, prefix: str = "plate_dfa") -> str:
+        """Sayaçları Prometheus metin biçiminde döndürür."""
+        lines = [
+            f"# TYPE {prefix}_runs_total counter",
+            f"{prefix}_runs_total {self.runs}",
+            f"# TYPE {prefix}_accepted_total counter",
+            f"{prefix}_accepted_total {self.accepted}",
+            f"# TYPE {prefix}_state_visits_total counter",
+        ]
+        for state_id, state in enumerate(STATES):
+            lines.append(
+                f'{prefix}_state_visits_total{{state="{state.value}"}} {self.visits[state_id]}'
+            )
+
+        lines.append(f"# TYPE {prefix}_edge_traversals_total counter")
+        for source_id, source in enumerate(STATES):
+            for target_id, target in enumerate(STATES):
+                count = self.edges[source_id * _NUM_STATES + target_id]
+                if count:
+                    lines.append(
+                        f'{prefix}_edge_traversals_total'
+                        f'{{from="{source.value}",to="{target.value}"}} {count}'
+                    )
+
+        lines.append(f"# TYPE {prefix}_rejections_total counter")
+        for state, char_class, count in self._rejection_items():
+            lines.append(
+                f'{prefix}_rejections_total{{state="{state}",char_class="{char_class}"}} {count}'
+            )
+
+        lines.append(f"# TYPE {prefix}_phase_seconds_total counter")
+        for phase in PHASES:
+            lines.append(
+                f'{prefix}_phase_seconds_total{{phase="{phase}"}} {self.seconds[phase]:.9f}'
+            )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,232 @@
+"""Plaka dilinin sayılması, sıralanması ve rastgele plaka üretimi.
+
+Otomat döngüsüz olduğundan kabul edilen dil sonludur. Her durum için
+"bu durumdan kabule giden kaç dizi var" sayıları dinamik programlama ile
+bir kez hesaplanır. Bu tablolarla:
+
+- uzunluğa göre dil boyutu sayılır,
+- `rank`/`unrank` ile geçerli plakalar ile [0, dil boyutu) aralığı arasında
+  sözlük sırasını koruyan bir eşleme (bijection) kurulur,
+- her örnekleme O(11) adımda, reddetmeli örnekleme olmadan yapılır.
+"""
+
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .compiled import PLATE_DFA, STATES, START_ID, DEAD_ID, CLASS_OTHER
+
+# Plaka alfabesi (sözlük sırasıyla): boşluk, rakamlar, izinli harfler
+ALPHABET = "".join(
+    chr(code)
+    for code, byte_class in enumerate(PLATE_DFA.ascii_classes)
+    if byte_class != CLASS_OTHER
+)
+
+# Mutasyonlarda kullanılan, alfabe dışı karakterler
+_MUTATION_EXTRA = "ÇĞİÖŞÜQWX-."
+
+# Geçersiz plaka üretiminde bir örnek için en fazla deneme
+_MAX_MUTATION_ATTEMPTS = 32
+
+# Durumdan çıkan, aynı hedefe giden ardışık karakter blokları:
+# (karakterler, hedef durum kimliği)
+Run = Tuple[str, int]
+
+
+def outgoing_runs(state_id: int) -> List[Run]:
+    """Bir durumdan canlı hedeflere giden ardışık karakter bloklarını döndürür."""
+    runs: List[Run] = []
+    for ch in ALPHABET:
+        next_id = PLATE_DFA.step(state_id, PLATE_DFA.class_of(ch))
+        if next_id == DEAD_ID:
+            continue
+        if runs and runs[-1][1] == next_id:
+            runs[-1] = (runs[-1][0] + ch, next_id)
+        else:
+            runs.append((ch, next_id))
+    return runs
+
+
+class PlateLanguage:
+    """Plaka dili üzerinde sayma, sıralama ve örnekleme tabloları."""
+
+    def __init__(self) -> None:
+        """Yol sayısı tablolarını hesaplar."""
+        state_count = len(STATES)
+        self._runs: List[List[Run]] = [
+            outgoing_runs(state_id) for state_id in range(state_count)
+        ]
+        self._accepting = [
+            PLATE_DFA.is_accepting_id(state_id) for state_id in range(state_count)
+        ]
+
+        # _totals[s]: s durumundan kabul edilen (boş dahil) dizi sayısı
+        self._totals: List[Optional[int]] = [None] * state_count
+        for state_id in range(state_count):
+            self._total(state_id)
+
+        # _by_length[s][k]: s durumundan tam k uzunluklu kabul edilen dizi sayısı
+        self._by_length: List[Dict[int, int]] = [{} for _ in range(state_count)]
+        for state_id in range(state_count):
+            self._length_counts(state_id)
+
+    def _total(self, state_id: int) -> int:
+        """Bir durumdan kabul edilen dizi sayısını (ezberleyerek) hesaplar."""
+        cached = self._totals[state_id]
+        if cached is not None:
+            return cached
+
+        total = 1 if self._accepting[state_id] else 0
+        for chars, next_id in self._runs[state_id]:
+            total += len(chars) * self._total(next_id)
+        self._totals[state_id] = total
+        return total
+
+    def _length_counts(self, state_id: int) -> Dict[int, int]:
+        """Bir durumdan uzunluğa göre kabul edilen dizi sayılarını hesaplar."""
+        counts = self._by_length[state_id]
+        if counts or self._totals[state_id] == 0:
+            return counts
+
+        if self._accepting[state_id]:
+            counts[0] = 1
+        for chars, next_id in self._runs[state_id]:
+            for length, count in self._length_counts(next_id).items():
+                counts[length + 1] = counts.get(length + 1, 0) + len(chars) * count
+        return counts
+
+    # ---------- Sayma ----------
+    @property
+    def size(self) -> int:
+        """Dildeki (geçerli) plaka sayısı."""
+        return self._totals[START_ID] or 0
+
+    def count_by_length(self) -> Dict[int, int]:
+        """Uzunluğa göre geçerli plaka sayılarını döndürür."""
+        return dict(sorted(self._by_length[START_ID].items()))
+
+    # ---------- Sıralama ----------
+    def rank(self, plate: str) -> int:
+        """Bir plakanın sözlük sırasındaki konumunu döndürür.
+
+        Args:
+            plate: Geçerli (normalize edilmiş) plaka.
+
+        Returns:
+            0 ile `size - 1` arasında sıra numarası.
+
+        Raises:
+            ValueError: Plaka geçerli değilse.
+        """
+        state_id = START_ID
+        rank = 0
+        for ch in plate:
+            if self._accepting[state_id]:
+                rank += 1  # Kendisi de geçerli olan önek daha öncedir
+
+            next_id = DEAD_ID
+            for chars, target in self._runs[state_id]:
+                position = chars.find(ch)
+                if position >= 0:
+                    rank += position * self._totals[target]
+                    next_id = target
+                    break
+                if chars < ch:
+                    rank += len(chars) * self._totals[target]
+
+            if next_id == DEAD_ID:
+                raise ValueError(f"Geçerli bir plaka değil: {plate!r}")
+            state_id = next_id
+
+        if not self._accepting[state_id]:
+            raise ValueError(f"Geçerli bir plaka değil: {plate!r}")
+        return rank
+
+    def unrank(self, index: int) -> str:
+        """Sözlük sırasındaki konumu verilen plakayı döndürür.
+
+        Args:
+            index: 0 ile `size - 1` arasında sıra numarası.
+
+        Returns:
+            Geçerli plaka.
+
+        Raises:
+            IndexError: Sıra numarası aralık dışındaysa.
+        """
+        if not 0 <= index < self.size:
+            raise IndexError(f"Sıra numarası aralık dışında: {index}")
+
+        state_id = START_ID
+        chars_out: List[str] = []
+        while True:
+            if self._accepting[state_id]:
+                if index == 0:
+                    return "".join(chars_out)
+                index -= 1
+
+            for chars, target in self._runs[state_id]:
+                subtotal = self._totals[target]
+                block = len(chars) * subtotal
+                if index < block:
+                    chars_out.append(chars[index // subtotal])
+                    index %= subtotal
+                    state_id = target
+                    break
+                index -= block
+
+    # ---------- Üretim ----------
+    def sample(self, rng: Optional[random.Random] = None) -> str:
+        """Dilden düzgün dağılımlı rastgele bir plaka seçer."""
+        return self.unrank((rng or random).randrange(self.size))
+
+    def iter_lexicographic(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None
+    ) -> Iterator[str]:
+        """Plakaları sözlük sırasıyla tembel (lazy) olarak üretir.
+
+        Args:
+            start: Başlangıç sıra numarası.
+            stop: Bitiş sıra numarası (dahil değil); None ise dilin sonu.
+
+        Yields:
+            Geçerli plakalar.
+        """
+        stop = self.size if stop is None else min(stop, self.size)
+        for index in range(start, stop):
+            yield self.unrank(index)
+
+    def sample_invalid(self, rng: Optional[random.Random] = None) -> str:
+        """Geçerli bir plakayı mutasyona uğratarak geçersiz bir giriş üretir.
+
+        Mutasyonlar: karakter değiştirme, ekleme, silme, komşu karakterleri
+        yer değiştirme. Sonuç hâlâ geçerliyse yeni bir mutasyon denenir.
+        """
+        rng = rng or random
+        pool = ALPHABET + _MUTATION_EXTRA
+        for _ in range(_MAX_MUTATION_ATTEMPTS):
+            plate = list(self.sample(rng))
+            position = rng.randrange(len(plate))
+            mutation = rng.randrange(4)
+            if mutation == 0:
+                plate[position] = rng.choice(pool)
+            elif mutation == 1:
+                plate.insert(position, rng.choice(pool))
+            elif mutation == 2:
+                del plate[position]
+            elif position + 1 < len(plate):
+                plate[position], plate[position + 1] = plate[position + 1], plate[position]
+
+            candidate = "".join(plate)
+            final_id, _ = PLATE_DFA.run(candidate)
+            if not PLATE_DFA.is_accepting_id(final_id):
+                return candidate
+
+        # Pratikte ulaşılmaz; il kodunu bozmak her zaman geçersizdir
+        return "9" + self.sample(rng)[1:]
+
+
+# Modül genelinde paylaşılan dil tabloları
+PLATE_LANGUAGE = PlateLanguage()
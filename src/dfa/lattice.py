@@ -0,0 +1,151 @@
+"""OCR olasılık kafesinin (lattice) plaka otomatıyla kesişimi.
+
+OCR motoru her karakter konumu için tek bir karakter yerine bir olasılık
+dağılımı (`{karakter: olasılık}`) üretir. Kod çözücü, bu kafesi DFA ile
+kesiştirerek en olası N geçerli plakayı bulur. Her konumda her DFA durumu
+için en iyi N kısmi hipotez tutulur (liste Viterbi): gelecekteki puan
+yalnızca duruma bağlı olduğundan bu, tüm kombinasyonları denemeden kesin
+N-en-iyi sonucu verir. Maliyet O(konum × durum × aday × N)'dir.
+
+O/0, I/1, B/8 gibi karışıklıklar kendiliğinden çözülür: rakam beklenen
+konumda 'O' ölü duruma götürdüğünden yalnızca '0' hipotezi yaşar.
+"""
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .compiled import PLATE_DFA, START_ID, DEAD_ID
+
+# Varsayılan sonuç sayısı
+DEFAULT_RESULTS = 5
+
+# Konum başına {karakter: olasılık} dağılımları
+Lattice = Sequence[Mapping[str, float]]
+
+# (log olasılık, kısmi plaka) hipotezi
+Hypothesis = Tuple[float, str]
+
+
+def _rank(hypothesis: Hypothesis) -> Tuple[float, str]:
+    """Sıralama anahtarı: olasılığa göre azalan, eşitlikte plakaya göre artan.
+
+    Kesim, ara adımlar ve son sıralama aynı anahtarı kullanır; böylece
+    eşitlikte belgelenen sıradaki sonuçlar atılmaz.
+    """
+    return -hypothesis[0], hypothesis[1]
+
+
+@dataclass(frozen=True)
+class Decoding:
+    """Kafesten çözülen tek bir geçerli plaka."""
+    plate: str  # Geçerli plaka
+    log_prob: float  # Konum olasılıklarının log toplamı
+
+    @property
+    def probability(self) -> float:
+        """Plakanın kafes altındaki olasılığı."""
+        return math.exp(self.log_prob)
+
+
+def _column_candidates(
+    distribution: Mapping[str, float],
+    limit: int
+) -> Dict[int, List[Tuple[float, str]]]:
+    """Bir konumun adaylarını bayt sınıfına göre gruplar.
+
+    Karakterler büyük harfe çevrilir (aynı karaktere düşen olasılıklar
+    toplanır); pozitif olmayan olasılıklar atlanır. Aynı hipotezden
+    yalnızca en iyi N uzantı sonuca girebileceğinden her sınıfta en olası
+    `limit` aday tutulur.
+    """
+    merged: Dict[str, float] = {}
+    for ch, probability in distribution.items():
+        if probability > 0:
+            key = ch.upper()
+            if len(key) == 1:
+                merged[key] = merged.get(key, 0.0) + probability
+
+    by_class: Dict[int, List[Tuple[float, str]]] = {}
+    for ch, probability in merged.items():
+        by_class.setdefault(PLATE_DFA.class_of(ch), []).append((math.log(probability), ch))
+    return {
+        byte_class: heapq.nsmallest(limit, candidates, key=_rank)
+        for byte_class, candidates in by_class.items()
+    }
+
+
+def decode_lattice(
+    lattice: Lattice,
+    n: int = DEFAULT_RESULTS,
+    beam: Optional[int] = None
+) -> List[Decoding]:
+    """Kafesteki en olası N geçerli plakayı döndürür.
+
+    Args:
+        lattice: Her konum için `{karakter: olasılık}` dağılımı.
+        n: En fazla sonuç sayısı.
+        beam: Verilirse her konumda (tüm durumlar genelinde) tutulan en
+            fazla hipotez sayısı. Hızı artırır ancak sonucu yaklaşık yapar;
+            None ise çözüm kesindir.
+
+    Returns:
+        Log olasılığa göre azalan (eşitlikte plakaya göre) sıralı sonuçlar.
+    """
+    if n <= 0:
+        return []
+
+    hypotheses: Dict[int, List[Hypothesis]] = {START_ID: [(0.0, "")]}
+
+    for distribution in lattice:
+        candidates = _column_candidates(distribution, n)
+        extended: Dict[int, List[Hypothesis]] = {}
+
+        for state_id, items in hypotheses.items():
+            for byte_class, options in candidates.items():
+                next_id = PLATE_DFA.step(state_id, byte_class)
+                if next_id == DEAD_ID:
+                    continue
+                bucket = extended.setdefault(next_id, [])
+                for score, prefix in items:
+                    for log_prob, ch in options:
+                        bucket.append((score + log_prob, prefix + ch))
+
+        hypotheses = {
+            state_id: heapq.nsmallest(n, items, key=_rank)
+            for state_id, items in extended.items()
+        }
+        if beam is not None:
+            hypotheses = _prune(hypotheses, beam)
+        if not hypotheses:
+            return []
+
+    finals = [
+        hypothesis
+        for state_id, items in hypotheses.items()
+        if PLATE_DFA.is_accepting_id(state_id)
+        for hypothesis in items
+    ]
+    finals.sort(key=_rank)
+    return [Decoding(plate, log_prob) for log_prob, plate in finals[:n]]
+
+
+def _prune(
+    hypotheses: Dict[int, List[Hypothesis]],
+    beam: int
+) -> Dict[int, List[Hypothesis]]:
+    """Tüm durumlar genelinde en iyi `beam` hipotezi tutar."""
+    ranked = heapq.nsmallest(
+        beam,
+        (
+            (score, prefix, state_id)
+            for state_id, items in hypotheses.items()
+            for score, prefix in items
+        ),
+        key=_rank
+    )
+    pruned: Dict[int, List[Hypothesis]] = {}
+    for score, prefix, state_id in ranked:
+        pruned.setdefault(state_id, []).append((score, prefix))
+    return pruned
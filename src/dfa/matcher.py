@@ -0,0 +1,141 @@
+"""Karakter karakter beslenen artımlı (incremental) plaka eşleştirici.
+
+Eşleştirici, ziyaret edilen durumları küçük bir yığında tutar. Her yeni
+karakter tek bir tablo okumasıyla, her silme ise yığından tek bir çıkarmayla
+işlenir; önek baştan çalıştırılmaz. Canlı klavye doğrulaması ve seri porttan
+karakter karakter gelen plakalar için uygundur.
+"""
+
+from enum import Enum
+from typing import List, Optional
+
+from .compiled import PLATE_DFA, STATES, START_ID, DEAD_ID, NUM_CLASSES
+from .tr_plate_dfa import State
+
+
+class MatchStatus(str, Enum):
+    """Artımlı eşleştiricinin anlık durumu."""
+    VALID = "VALID"  # Şu ana kadarki giriş geçerli bir plaka
+    INVALID = "INVALID"  # Giriş ölü duruma düştü
+    INCOMPLETE = "INCOMPLETE"  # Giriş geçerli bir plakanın öneki
+
+
+class PlateMatcher:
+    """Plaka DFA'sını karakter karakter ilerleten artımlı eşleştirici."""
+
+    def __init__(self) -> None:
+        """Boş girişle başlayan bir eşleştirici oluşturur."""
+        self._states: List[int] = [START_ID]
+        self._chars: List[str] = []
+        self._fail_index: Optional[int] = None
+
+    # ---------- Durum Bilgisi ----------
+    @property
+    def state(self) -> State:
+        """Geçerli DFA durumu."""
+        return STATES[self._states[-1]]
+
+    @property
+    def path(self) -> List[State]:
+        """Başlangıçtan geçerli duruma kadar ziyaret edilen durumlar."""
+        return [STATES[state_id] for state_id in self._states]
+
+    @property
+    def text(self) -> str:
+        """Şu ana kadar beslenen metin."""
+        return "".join(self._chars)
+
+    @property
+    def fail_index(self) -> Optional[int]:
+        """Ölü duruma geçilen karakterin indeksi (yoksa None)."""
+        return self._fail_index
+
+    @property
+    def status(self) -> MatchStatus:
+        """Geçerli girişin geçerli/geçersiz/eksik durumu."""
+        state_id = self._states[-1]
+        if state_id == DEAD_ID:
+            return MatchStatus.INVALID
+        if PLATE_DFA.is_accepting_id(state_id):
+            return MatchStatus.VALID
+        return MatchStatus.INCOMPLETE
+
+    @property
+    def accepted(self) -> bool:
+        """Geçerli giriş kabul ediliyorsa True."""
+        return PLATE_DFA.is_accepting_id(self._states[-1])
+
+    def __len__(self) -> int:
+        return len(self._chars)
+
+    # ---------- Düzenleme ----------
+    def feed(self, ch: str) -> State:
+        """Bir karakter ekler ve yeni durumu döndürür.
+
+        Args:
+            ch: Eklenecek (normalize edilmiş) karakter.
+
+        Returns:
+            Yeni DFA durumu.
+
+        Raises:
+            ValueError: Eğer girdi tek karakter değilse.
+        """
+        if len(ch) != 1:
+            raise ValueError(
+                f"feed tek bir karakter bekler, alınan: {len(ch)} karakter"
+            )
+
+        current_id = self._states[-1]
+        next_id = PLATE_DFA.transitions[
+            current_id * NUM_CLASSES + PLATE_DFA.class_of(ch)
+        ]
+        if next_id == DEAD_ID and self._fail_index is None:
+            self._fail_index = len(self._chars)
+
+        self._states.append(next_id)
+        self._chars.append(ch)
+        return STATES[next_id]
+
+    def backspace(self) -> State:
+        """Son karakteri siler ve önceki durumu döndürür.
+
+        Returns:
+            Yeni DFA durumu (giriş boşsa başlangıç durumu).
+        """
+        if self._chars:
+            self._states.pop()
+            self._chars.pop()
+            if self._fail_index is not None and self._fail_index >= len(self._chars):
+                self._fail_index = None
+        return self.state
+
+    def reset(self) -> None:
+        """Eşleştiriciyi boş girişe döndürür."""
+        del self._states[1:]
+        self._chars.clear()
+        self._fail_index = None
+
+    def sync(self, text: str) -> State:
+        """Eşleştiriciyi verilen metne getirir.
+
+        Yalnızca ortak önekten sonraki kısım silinip yeniden beslenir;
+        metnin sonuna yazma veya sondan silme tek adım sürer.
+
+        Args:
+            text: Hedef (normalize edilmiş) metin.
+
+        Returns:
+            Yeni DFA durumu.
+        """
+        chars = self._chars
+        common = 0
+        limit = min(len(chars), len(text))
+        while common < limit and chars[common] == text[common]:
+            common += 1
+
+        while len(chars) > common:
+            self.backspace()
+        for ch in text[common:]:
+            self.feed(ch)
+        return self.state
@@ -0,0 +1,198 @@
+"""Sabit genişlikli plaka dizileri için NumPy tabanlı vektörel doğrulayıcı.
+
+Plakalar, her satırı bir plaka olan sabit genişlikli bayt dizisi
+(`S12` dtype veya uint8 matris) olarak verilir. Derlenmiş geçiş tablosu
+sütun sütun uygulanır; her karakter konumunda tüm otomatlar tek bir
+"fancy indexing" işlemiyle birlikte ilerletilir.
+
+Kısa plakalar NUL (0) baytları ile doldurulur. Dolgu, satır uzunluklarıyla
+(`lengths`) belirlenir ve durumu değiştirmez; uzunluk içindeki NUL baytları
+sıradan (geçersiz) karakterlerdir. Uzunluklar verilmezse yalnızca satır
+sonundaki NUL baytları dolgu sayılır.
+
+NumPy isteğe bağlı bir bağımlılıktır; kurulu değilse fonksiyonlar
+ImportError fırlatır.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy isteğe bağlıdır
+    np = None
+
+from .compiled import PLATE_DFA, STATES, START_ID, DEAD_ID, NUM_CLASSES
+
+# Dolgu baytı için ek sınıf (durumu değiştirmez)
+CLASS_PAD = NUM_CLASSES
+
+# En uzun geçerli plaka uzunluğu ("34 ABC 1234")
+MAX_PLATE_LENGTH = 11
+
+# Varsayılan paketleme genişliği: fazladan bir bayt, 11 karakterden uzun
+# girişlerin reddini korur
+DEFAULT_PACK_WIDTH = MAX_PLATE_LENGTH + 1
+
+
+@dataclass
+class ArrayBatchResult:
+    """Vektörel doğrulama sonucu (satır başına bir eleman)."""
+    accepted: Any  # bool dizisi
+    fail_indices: Any  # int16 dizisi (hata yoksa -1)
+    final_states: Any  # uint8 durum kimlikleri
+
+
+def _require_numpy() -> None:
+    """NumPy kurulu değilse anlaşılır bir hata fırlatır."""
+    if np is None:
+        raise ImportError(
+            "NumPy arka ucu için 'numpy' paketinin kurulu olması gerekir"
+        )
+
+
+@lru_cache(maxsize=None)
+def _build_tables():
+    """Bayt sınıf tablosunu ve dolgu sütunlu geçiş tablosunu üretir."""
+    byte_classes = np.zeros(256, dtype=np.uint8)
+    byte_classes[:len(PLATE_DFA.ascii_classes)] = np.frombuffer(
+        PLATE_DFA.ascii_classes, dtype=np.uint8
+    )
+
+    transitions = np.frombuffer(PLATE_DFA.transitions, dtype=np.uint8)
+    transitions = transitions.reshape(len(STATES), NUM_CLASSES)
+    pad_column = np.arange(len(STATES), dtype=np.uint8).reshape(-1, 1)
+    table = np.hstack([transitions, pad_column])
+
+    accepting = np.frombuffer(PLATE_DFA.accepting, dtype=np.uint8).astype(bool)
+    return byte_classes, table, accepting
+
+
+def pack_plates(plates: Iterable[str], width: int = DEFAULT_PACK_WIDTH) -> Tuple[Any, Any]:
+    """Normalize edilmiş plakaları sabit genişlikli uint8 matrise paketler.
+
+    Karakterler UTF-8 olarak kodlanır. ASCII dışı ilk karakter zaten
+    ölü duruma götürdüğünden hata indeksleri karakter indeksleriyle aynıdır.
+    Genişlikten uzun girişler kırpılır; genişlik en uzun plakadan büyük
+    olduğundan bu girişler kırpılan konumdan önce ölür, sonuç değişmez.
+
+    Args:
+        plates: Normalize edilmiş plaka metinleri.
+        width: Satır genişliği (bayt).
+
+    Returns:
+        (satır sayısı, width) boyutlu uint8 matris ve `validate_array`
+        fonksiyonuna verilecek kırpılmamış bayt uzunlukları.
+
+    Raises:
+        ValueError: width `DEFAULT_PACK_WIDTH` değerinden küçükse.
+    """
+    _require_numpy()
+    if width < DEFAULT_PACK_WIDTH:
+        raise ValueError(
+            f"width en az {DEFAULT_PACK_WIDTH} olmalıdır, alınan: {width}"
+        )
+
+    raw = [plate.encode("utf-8") for plate in plates]
+    lengths = np.fromiter((len(item) for item in raw), dtype=np.int64, count=len(raw))
+    encoded = np.array([item[:width] for item in raw], dtype=f"S{width}")
+    return as_byte_matrix(encoded), lengths
+
+
+def as_byte_matrix(plates):
+    """`S` dtype diziyi veya uint8 matrisi (n, genişlik) uint8 matrise çevirir.
+
+    Args:
+        plates: `S<n>` dtype tek boyutlu dizi ya da iki boyutlu uint8 matris.
+
+    Returns:
+        (satır sayısı, genişlik) boyutlu uint8 matris.
+
+    Raises:
+        ValueError: Dizi biçimi desteklenmiyorsa.
+    """
+    _require_numpy()
+    plates = np.asarray(plates)
+
+    if plates.dtype.kind == "S" and plates.ndim == 1:
+        width = plates.dtype.itemsize
+        return np.ascontiguousarray(plates).view(np.uint8).reshape(-1, width)
+
+    if plates.dtype == np.uint8 and plates.ndim == 2:
+        return plates
+
+    raise ValueError(
+        "Beklenen biçim: tek boyutlu 'S' dtype dizi veya iki boyutlu uint8 "
+        f"matris, alınan: {plates.dtype} ({plates.ndim} boyut)"
+    )
+
+
+def _trailing_pad_lengths(codes):
+    """Her satırın, sondaki NUL baytları hariç uzunluğunu döndürür."""
+    present = codes != 0
+    width = codes.shape[1]
+    last = width - np.argmax(present[:, ::-1], axis=1)
+    return np.where(present.any(axis=1), last, 0)
+
+
+def validate_array(plates, lengths: Optional[Any] = None) -> ArrayBatchResult:
+    """Sabit genişlikli plaka satırlarını vektörel olarak doğrular.
+
+    Girişlerin `normalize_input` ile normalize edilmiş olduğu varsayılır.
+
+    Args:
+        plates: `S<n>` dtype dizi veya (n, genişlik) uint8 matris.
+        lengths: Satır başına bayt uzunlukları (ör. `pack_plates` çıktısı).
+            Uzunluğun ötesindeki baytlar dolgudur. None ise satır sonundaki
+            NUL baytları dolgu sayılır.
+
+    Returns:
+        Satır başına kabul bayrağı, hata indeksi ve son durum.
+
+    Raises:
+        ValueError: lengths satır sayısıyla uyuşmuyorsa veya genişlik en
+            uzun plakayı aşmıyorken bir satır genişliğe sığmıyorsa (hata
+            indeksi kırpılan baytlara bağlı olabilir).
+    """
+    _require_numpy()
+    codes = as_byte_matrix(plates)
+    byte_classes, table, accepting = _build_tables()
+
+    row_count, width = codes.shape
+    if lengths is None:
+        lengths = _trailing_pad_lengths(codes)
+    else:
+        lengths = np.asarray(lengths)
+        if lengths.shape != (row_count,):
+            raise ValueError(
+                f"lengths boyutu {row_count} olmalıdır, alınan: {lengths.shape}"
+            )
+        if width <= MAX_PLATE_LENGTH and np.any(lengths > width):
+            raise ValueError(
+                f"{width} bayt genişliğe sığmayan satırlar var; "
+                f"en az {DEFAULT_PACK_WIDTH} bayt genişlik kullanın"
+            )
+
+    states = np.full(row_count, START_ID, dtype=np.uint8)
+    fail_indices = np.full(row_count, -1, dtype=np.int16)
+
+    for column in range(width):
+        ended = lengths <= column
+        classes = byte_classes[codes[:, column]]
+        classes[ended] = CLASS_PAD
+
+        states = table[states, classes]
+
+        newly_dead = (states == DEAD_ID) & (fail_indices < 0)
+        fail_indices[newly_dead] = column
+
+        # Tüm satırlar bittiyse veya öldüyse kalan sütunları atla
+        if np.all(ended | (states == DEAD_ID)):
+            break
+
+    return ArrayBatchResult(
+        accepted=accepting[states],
+        fail_indices=fail_indices,
+        final_states=states
+    )
@@ -0,0 +1,195 @@
+"""Büyük plaka dosyalarının çok süreçli (multi-process) doğrulanması.
+
+Dosya bellek eşlemeli (mmap) olarak açılır ve satır sonlarına hizalanmış
+bayt aralıklarına (shard) bölünür. Her aralık bir `ProcessPoolExecutor`
+işçisinde derlenmiş DFA ile doğrulanır; işçiler dosyayı kendileri eşler,
+böylece hiçbir süreç dosyanın tamamını belleğe kopyalamaz. Satırlar (CLI'nin
+sıralı yolu gibi) yalnızca "\n" ile ayrılır. Sonuçlar giriş sırasıyla
+birleştirilir.
+"""
+
+import mmap
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from utils.normalize import normalize_to_classes
+
+from .compiled import PLATE_DFA
+
+# Varsayılan parça boyutu (bayt)
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+
+NEWLINE = b"\n"
+
+
+@dataclass
+class FileValidationResult:
+    """Dosya doğrulama sonucunu temsil eder."""
+    total: int = 0  # Toplam satır sayısı
+    accepted: int = 0  # Geçerli satır sayısı
+    invalid_offsets: array = field(default_factory=lambda: array("Q"))  # Geçersiz satırların bayt ofsetleri
+
+    @property
+    def rejected(self) -> int:
+        """Geçersiz satır sayısını döndürür."""
+        return self.total - self.accepted
+
+
+def plan_shards(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Dosyayı satır sonlarına hizalanmış bayt aralıklarına böler.
+
+    Args:
+        path: Dosya yolu.
+        chunk_size: Hedef aralık boyutu (bayt).
+
+    Returns:
+        (başlangıç, bitiş) bayt aralıkları, dosya sırasıyla.
+
+    Raises:
+        ValueError: chunk_size pozitif değilse.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size pozitif olmalıdır, alınan: {chunk_size}")
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    shards: List[Tuple[int, int]] = []
+    with open(path, "rb") as stream:
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            while start < size:
+                target = start + chunk_size
+                if target >= size:
+                    end = size
+                else:
+                    newline_at = mapped.find(NEWLINE, target - 1)
+                    end = size if newline_at < 0 else newline_at + 1
+                shards.append((start, end))
+                start = end
+
+    return shards
+
+
+def validate_shard(
+    path: str,
+    start: int,
+    end: int,
+    collect_invalid: bool = True
+) -> FileValidationResult:
+    """Dosyanın tek bir bayt aralığındaki satırları doğrular.
+
+    Args:
+        path: Dosya yolu.
+        start: Aralık başlangıcı (bir satır başı).
+        end: Aralık sonu (bir satır sonundan hemen sonrası veya dosya sonu).
+        collect_invalid: True ise geçersiz satırların ofsetleri toplanır.
+
+    Returns:
+        Aralığın doğrulama sonucu (ofsetler dosya başına göredir).
+    """
+    result = FileValidationResult()
+    if start >= end:
+        return result
+
+    run_classes = PLATE_DFA.run_classes
+    accepting = PLATE_DFA.accepting
+    normalize = normalize_to_classes
+    append_offset = result.invalid_offsets.append
+
+    total = 0
+    accepted = 0
+    with open(path, "rb") as stream:
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Satırlar eşlenmiş bellekte yerinde bulunur; aralık kopyalanmaz
+            find = mapped.find
+            offset = start
+            while offset < end:
+                newline_at = find(NEWLINE, offset, end)
+                line_end = end if newline_at < 0 else newline_at
+                total += 1
+                final_id, _ = run_classes(
+                    normalize(mapped[offset:line_end].decode("utf-8", "replace"))
+                )
+                if accepting[final_id]:
+                    accepted += 1
+                elif collect_invalid:
+                    append_offset(offset)
+                offset = line_end + 1
+
+    result.total = total
+    result.accepted = accepted
+    return result
+
+
+def validate_file(
+    path: str,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    collect_invalid: bool = True
+) -> FileValidationResult:
+    """Bir plaka dosyasını (satır başına bir plaka) paralel olarak doğrular.
+
+    Args:
+        path: Dosya yolu.
+        workers: İşçi süreç sayısı (None ise işlemci sayısı).
+        chunk_size: Aralık boyutu (bayt).
+        collect_invalid: True ise geçersiz satır ofsetleri döndürülür.
+
+    Returns:
+        Birleştirilmiş doğrulama sonucu (ofsetler giriş sırasıyla).
+    """
+    shards = plan_shards(path, chunk_size)
+    merged = FileValidationResult()
+    if not shards:
+        return merged
+
+    starts = [start for start, _ in shards]
+    ends = [end for _, end in shards]
+    count = len(shards)
+
+    if workers == 1 or count == 1:
+        partials: Iterator[FileValidationResult] = map(
+            validate_shard,
+            [path] * count, starts, ends, [collect_invalid] * count
+        )
+        return _merge(partials, merged)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = executor.map(
+            validate_shard,
+            [path] * count, starts, ends, [collect_invalid] * count
+        )
+        return _merge(partials, merged)
+
+
+def _merge(
+    partials: Iterator[FileValidationResult],
+    merged: FileValidationResult
+) -> FileValidationResult:
+    """Aralık sonuçlarını sırayla birleştirir."""
+    for partial in partials:
+        merged.total += partial.total
+        merged.accepted += partial.accepted
+        merged.invalid_offsets.extend(partial.invalid_offsets)
+    return merged
+
+
+def iter_lines_at(path: str, offsets: Iterable[int]) -> Iterator[bytes]:
+    """Verilen bayt ofsetlerinden başlayan satırları (satır sonu hariç) üretir.
+
+    Args:
+        path: Dosya yolu.
+        offsets: Satır başı ofsetleri (ör. `invalid_offsets`).
+
+    Yields:
+        Ham satır baytları.
+    """
+    with open(path, "rb") as stream:
+        for offset in offsets:
+            stream.seek(offset)
+            yield stream.readline().rstrip(NEWLINE)
@@ -0,0 +1,261 @@
+"""Plaka DFA'sından türetilen düzenli ifade (regex) arka ucu.
+
+Düzenli ifade, derlenmiş geçiş tablosu üzerinde durum eleme (state
+elimination) yöntemiyle üretilir; böylece `TRANSITIONS` tablosu ve il kodu
+kuralları tek kaynak olarak kalır. Üretilen ifade ilk kullanımda `re` ile
+derlenir ve otomatla denkliği otomatik olarak sınanır.
+
+- Kabul-odaklı yol: `fullmatch` (C hızında)
+- Metin içinde arama: `finditer` (kelime sınırlarıyla)
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .compiled import (
+    PLATE_DFA,
+    STATES,
+    START_ID,
+    DEAD_ID,
+    NUM_CLASSES,
+    CLASS_OTHER,
+    CLASS_REPRESENTATIVES,
+)
+
+# Kelime sınırı (str.isalnum ile aynı: \w eksi alt çizgi)
+_NOT_AFTER_WORD = r"(?<![^\W_])"
+_NOT_BEFORE_WORD = r"(?![^\W_])"
+
+# Karakter kümesi denetiminde taranan kod noktası sınırı
+# (ASCII, Latin-1 ve Türkçe harfleri kapsar)
+_CHARSET_CHECK_LIMIT = 0x250
+
+
+class RegexMismatchError(RuntimeError):
+    """Üretilen düzenli ifade otomatla aynı dili tanımadığında fırlatılır."""
+
+
+def _class_members(byte_class: int) -> List[str]:
+    """Bir bayt sınıfına ait (ASCII) karakterleri döndürür."""
+    return [
+        chr(code)
+        for code, member_class in enumerate(PLATE_DFA.ascii_classes)
+        if member_class == byte_class
+    ]
+
+
+def _render_charset(chars: List[str]) -> str:
+    """Karakter listesini en kısa karakter kümesi ifadesine çevirir."""
+    codes = sorted(set(ord(ch) for ch in chars))
+    if len(codes) == 1:
+        return re.escape(chr(codes[0]))
+
+    ranges: List[str] = []
+    run_start = previous = codes[0]
+    for code in codes[1:] + [None]:
+        if code is not None and code == previous + 1:
+            previous = code
+            continue
+        if previous - run_start >= 2:
+            ranges.append(f"{re.escape(chr(run_start))}-{re.escape(chr(previous))}")
+        else:
+            ranges.extend(
+                re.escape(chr(member)) for member in range(run_start, previous + 1)
+            )
+        if code is not None:
+            run_start = previous = code
+
+    return "[" + "".join(ranges) + "]"
+
+
+def _union(left: Optional[str], right: Optional[str]) -> Optional[str]:
+    """İki ifadenin birleşimini (|) üretir; None boş dili temsil eder."""
+    if left is None:
+        return right
+    if right is None or left == right:
+        return left
+    if left == "":
+        return f"(?:{right})?"
+    if right == "":
+        return f"(?:{left})?"
+    return f"(?:{left}|{right})"
+
+
+def _star(expression: Optional[str]) -> str:
+    """Bir ifadenin Kleene yıldızını üretir."""
+    if not expression:
+        return ""
+    return f"(?:{expression})*"
+
+
+def _elimination_cost(
+    edges: Dict[Tuple[int, int], Optional[str]],
+    state_id: int
+) -> int:
+    """Bir durum elendiğinde oluşacak yeni kenar sayısını döndürür."""
+    incoming = sum(
+        1 for source, target in edges if target == state_id and source != state_id
+    )
+    outgoing = sum(
+        1 for source, target in edges if source == state_id and target != state_id
+    )
+    return incoming * outgoing
+
+
+def derive_pattern() -> str:
+    """Geçiş tablosundan durum eleme yöntemiyle düzenli ifade türetir.
+
+    Ölü durum ve ona giden geçişler baştan çıkarılır. Her (kaynak, hedef)
+    çifti için bayt sınıfları tek bir karakter kümesinde birleştirilir.
+
+    Returns:
+        Plaka dilini tanıyan düzenli ifade (çapasız).
+    """
+    live_states = [
+        state_id for state_id in range(len(STATES)) if state_id != DEAD_ID
+    ]
+    initial = len(STATES)
+    final = initial + 1
+
+    # Genelleştirilmiş NFA kenarları: (kaynak, hedef) -> ifade
+    edges: Dict[Tuple[int, int], Optional[str]] = {}
+
+    for state_id in live_states:
+        targets: Dict[int, List[str]] = {}
+        for byte_class in range(NUM_CLASSES):
+            if byte_class == CLASS_OTHER:
+                continue
+            next_id = PLATE_DFA.step(state_id, byte_class)
+            if next_id != DEAD_ID:
+                targets.setdefault(next_id, []).extend(_class_members(byte_class))
+        for next_id, chars in targets.items():
+            edges[(state_id, next_id)] = _render_charset(chars)
+
+        if PLATE_DFA.is_accepting_id(state_id):
+            edges[(state_id, final)] = ""
+
+    edges[(initial, START_ID)] = ""
+
+    remaining = list(live_states)
+    while remaining:
+        # En az kenar üreten durumu önce ele (ifadenin büyümesini sınırlar)
+        eliminated = min(
+            remaining,
+            key=lambda state_id: _elimination_cost(edges, state_id)
+        )
+        remaining.remove(eliminated)
+
+        loop = _star(edges.pop((eliminated, eliminated), None))
+        incoming = [
+            (source, expression) for (source, target), expression in edges.items()
+            if target == eliminated
+        ]
+        outgoing = [
+            (target, expression) for (source, target), expression in edges.items()
+            if source == eliminated
+        ]
+        for source, _ in incoming:
+            del edges[(source, eliminated)]
+        for target, _ in outgoing:
+            del edges[(eliminated, target)]
+
+        for source, into in incoming:
+            for target, out_of in outgoing:
+                bypass = into + loop + out_of
+                edges[(source, target)] = _union(edges.get((source, target)), bypass)
+
+    return edges.get((initial, final)) or "(?!)"
+
+
+def _dfa_accepts(text: str) -> bool:
+    """Girişin derlenmiş otomat tarafından kabul edilip edilmediğini döndürür."""
+    final_id, _ = PLATE_DFA.run(text)
+    return PLATE_DFA.is_accepting_id(final_id)
+
+
+def check_equivalence(pattern: str) -> List[str]:
+    """Düzenli ifadeyi otomatla dil sınırları üzerinde karşılaştırır.
+
+    İki aşamada sınanır:
+    1. Her bayt sınıfının karakter kümesi, sınıfın tüm üyelerini ve yalnızca
+       onları kapsamalıdır.
+    2. Otomatın tüm canlı önekleri, her bayt sınıfının temsilcisiyle
+       uzatılarak (dil sınırının hemen içi ve hemen dışı) iki motorda çalıştırılır.
+
+    Args:
+        pattern: Sınanacak düzenli ifade.
+
+    Returns:
+        Uyuşmayan girişlerin listesi (boşsa ifade denktir).
+    """
+    regex = re.compile(pattern)
+    mismatches: List[str] = []
+
+    for byte_class in range(NUM_CLASSES):
+        if byte_class == CLASS_OTHER:
+            continue
+        charset = re.compile(_render_charset(_class_members(byte_class)))
+        for code in range(_CHARSET_CHECK_LIMIT):
+            ch = chr(code)
+            in_charset = charset.fullmatch(ch) is not None
+            if in_charset != (PLATE_DFA.class_of(ch) == byte_class):
+                mismatches.append(ch)
+
+    pending = [("", START_ID)]
+    while pending:
+        prefix, state_id = pending.pop()
+        if (regex.fullmatch(prefix) is not None) != _dfa_accepts(prefix):
+            mismatches.append(prefix)
+
+        for byte_class, representative in enumerate(CLASS_REPRESENTATIVES):
+            next_id = PLATE_DFA.step(state_id, byte_class)
+            candidate = prefix + representative
+            if next_id == DEAD_ID:
+                if regex.fullmatch(candidate) is not None:
+                    mismatches.append(candidate)
+            else:
+                pending.append((candidate, next_id))
+
+    return mismatches
+
+
+@lru_cache(maxsize=None)
+def plate_regex() -> "re.Pattern[str]":
+    """Türetilen düzenli ifadeyi derler, denkliğini sınar ve önbelleğe alır.
+
+    Raises:
+        RegexMismatchError: İfade otomatla aynı dili tanımıyorsa.
+    """
+    pattern = derive_pattern()
+    mismatches = check_equivalence(pattern)
+    if mismatches:
+        raise RegexMismatchError(
+            f"Üretilen düzenli ifade DFA ile uyuşmuyor ({len(mismatches)} giriş), "
+            f"örnek: {mismatches[0]!r}"
+        )
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=None)
+def search_regex() -> "re.Pattern[str]":
+    """Metin içinde arama için kelime sınırlı düzenli ifadeyi döndürür."""
+    return re.compile(_NOT_AFTER_WORD + plate_regex().pattern + _NOT_BEFORE_WORD)
+
+
+def accepts_re(input_string: str) -> bool:
+    """Girişin kabul edilip edilmediğini düzenli ifadeyle döndürür."""
+    return plate_regex().fullmatch(input_string) is not None
+
+
+def iter_plates_re(text: str) -> Iterator[Tuple[int, int, str]]:
+    """Metindeki plaka geçişlerini düzenli ifadeyle bulur.
+
+    Args:
+        text: Aranacak metin.
+
+    Yields:
+        (başlangıç, bitiş, plaka) üçlüleri.
+    """
+    for match in search_regex().finditer(text):
+        yield match.start(), match.end(), match.group()
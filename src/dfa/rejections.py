@@ -0,0 +1,270 @@
+"""Reddedilen plakalar için akış hâlinde, sabit bellekli neden özeti.
+
+Her doğrulama yolundan (`run_dfa`, `validate`, `run_dfa_batch`, CLI) gelen
+kararlar tüketilir; girişler saklanmaz. Tutulanlar:
+
+- kesin sayaçlar: toplam/ret sayısı, ölünen duruma ve hata indeksine göre
+  dağılım (indeks `MAX_TRACKED_INDEX` üzerinde tek kovada toplanır),
+- Space-Saving ile en sık reddedilen girişler, ret nedenleri
+  ("durum|indeks|karakter") ve hataya neden olan karakterler,
+- Count-Min Sketch ile herhangi bir reddedilen girişin sıklık tahmini.
+
+Özetlere giren girişler `MAX_KEY_LENGTH` karaktere kırpılır; böylece çok
+uzun satırlar da belleği sınırsız büyütmez.
+
+Özetler süreçler arasında `merge` ile birleştirilebilir ve `to_dict` /
+`from_dict` ile taşınabilir. `report_interval` verilirse rapor periyodik
+olarak `on_report` fonksiyonuna iletilir.
+"""
+
+import time
+from array import array
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+from utils.normalize import normalize_input
+from utils.sketches import CountMinSketch, SpaceSaving
+
+from .compiled import PLATE_DFA, STATES
+from .instrumentation import END_OF_INPUT
+from .runner import BatchResult, RunResult
+
+# Varsayılan özet boyutları
+DEFAULT_CAPACITY = 256  # Space-Saving başına izlenen anahtar sayısı
+DEFAULT_SKETCH_WIDTH = 4096
+DEFAULT_SKETCH_DEPTH = 4
+
+# Bu değerden büyük hata indeksleri tek kovada toplanır
+MAX_TRACKED_INDEX = 16
+
+# Özet anahtarlarının en fazla uzunluğu (karakter); uzun girişler kırpılır
+MAX_KEY_LENGTH = 64
+TRUNCATION_MARK = "…"
+
+# Periyodik rapor zamanının kaç kayıtta bir denetleneceği
+_REPORT_CHECK_EVERY = 1024
+
+# Rapor alıcısı
+ReportCallback = Callable[[Dict[str, Any]], None]
+
+
+def _bounded_key(text: str) -> str:
+    """Girişi özet anahtarı olarak en fazla `MAX_KEY_LENGTH` karaktere kırpar."""
+    if len(text) <= MAX_KEY_LENGTH:
+        return text
+    return text[:MAX_KEY_LENGTH - len(TRUNCATION_MARK)] + TRUNCATION_MARK
+
+
+def _reason_key(state_name: str, fail_index: int, fail_char: str) -> str:
+    """Ret nedenini özet anahtarına çevirir."""
+    return f"{state_name}|{fail_index}|{fail_char}"
+
+
+class RejectionAggregator:
+    """Ret nedenlerini sabit bellekte biriktiren, birleştirilebilir özet."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        sketch_width: int = DEFAULT_SKETCH_WIDTH,
+        sketch_depth: int = DEFAULT_SKETCH_DEPTH,
+        report_interval: Optional[float] = None,
+        on_report: Optional[ReportCallback] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Özeti oluşturur.
+
+        Args:
+            capacity: Her Space-Saving özetinde izlenen anahtar sayısı.
+            sketch_width: Count-Min Sketch genişliği.
+            sketch_depth: Count-Min Sketch derinliği.
+            report_interval: Periyodik rapor aralığı (saniye); None ise kapalı.
+            on_report: Periyodik raporu alan fonksiyon.
+            clock: Zaman kaynağı (saniye döndüren fonksiyon).
+
+        Raises:
+            ValueError: report_interval pozitif değilse.
+        """
+        if report_interval is not None and report_interval <= 0:
+            raise ValueError(
+                f"report_interval pozitif olmalıdır, alınan: {report_interval}"
+            )
+
+        self.total = 0
+        self.rejected = 0
+        self.states = array("Q", bytes(8 * len(STATES)))
+        self.fail_indices = array("Q", bytes(8 * (MAX_TRACKED_INDEX + 2)))
+        self.inputs = SpaceSaving(capacity)
+        self.reasons = SpaceSaving(capacity)
+        self.fail_chars = SpaceSaving(capacity)
+        self.input_sketch = CountMinSketch(sketch_width, sketch_depth)
+
+        self._report_interval = report_interval
+        self._on_report = on_report
+        self._clock = clock
+        self._last_report = clock()
+
+    # ---------- Tüketme ----------
+    def add(self, text: str, accepted: bool, fail_index: Optional[int]) -> None:
+        """Tek bir kararı ekler.
+
+        Args:
+            text: Doğrulanan (normalize edilmiş) metin.
+            accepted: Kabul edildi mi?
+            fail_index: Hata indeksi (yoksa None veya -1).
+        """
+        self.total += 1
+        if not accepted:
+            self._add_rejection(text, fail_index)
+
+        if self._report_interval is not None and self.total % _REPORT_CHECK_EVERY == 0:
+            self._maybe_report()
+
+    def _add_rejection(self, text: str, fail_index: Optional[int]) -> None:
+        """Bir reddi sayaçlara ve özetlere işler."""
+        self.rejected += 1
+        if fail_index is None or fail_index < 0:
+            # Girdi kabul dışı bir durumda bitti
+            state_id, _ = PLATE_DFA.run(text)
+            position = len(text)
+            fail_char = END_OF_INPUT
+        else:
+            state_id, _ = PLATE_DFA.run(text[:fail_index])
+            position = fail_index
+            fail_char = text[fail_index]
+
+        self.states[state_id] += 1
+        self.fail_indices[min(position, MAX_TRACKED_INDEX + 1)] += 1
+        key = _bounded_key(text)
+        self.inputs.add(key)
+        self.input_sketch.add(key)
+        self.fail_chars.add(fail_char)
+        self.reasons.add(_reason_key(STATES[state_id].value, position, fail_char))
+
+    def add_result(self, text: str, result: RunResult) -> None:
+        """Bir `RunResult` kararını ekler."""
+        self.add(text, result.accepted, result.fail_index)
+
+    def add_batch(self, raw_inputs: Sequence[str], batch: BatchResult) -> None:
+        """`run_dfa_batch` sonucunu ekler (yalnızca retler normalize edilir)."""
+        accepted = batch.accepted
+        fail_indices = batch.fail_indices
+        for index, raw_input in enumerate(raw_inputs):
+            if accepted[index]:
+                self.add(raw_input, True, None)
+            else:
+                self.add(normalize_input(raw_input), False, fail_indices[index])
+
+    def add_verdicts(self, verdicts: Iterable[tuple]) -> None:
+        """CLI biçimindeki (metin, kabul, hata indeksi) üçlülerini ekler."""
+        for text, accepted, fail_index in verdicts:
+            self.add(text, accepted, fail_index)
+
+    # ---------- Birleştirme ve taşıma ----------
+    def merge(self, other: "RejectionAggregator") -> "RejectionAggregator":
+        """Başka bir süreçten gelen özeti bu özete ekler (yerinde)."""
+        self.total += other.total
+        self.rejected += other.rejected
+        for index, count in enumerate(other.states):
+            self.states[index] += count
+        for index, count in enumerate(other.fail_indices):
+            self.fail_indices[index] += count
+        self.inputs.merge(other.inputs)
+        self.reasons.merge(other.reasons)
+        self.fail_chars.merge(other.fail_chars)
+        self.input_sketch.merge(other.input_sketch)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Özeti JSON uyumlu bir sözlüğe çevirir."""
+        return {
+            "total": self.total,
+            "rejected": self.rejected,
+            "states": list(self.states),
+            "fail_indices": list(self.fail_indices),
+            "inputs": self.inputs.to_dict(),
+            "reasons": self.reasons.to_dict(),
+            "fail_chars": self.fail_chars.to_dict(),
+            "input_sketch": self.input_sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RejectionAggregator":
+        """`to_dict` çıktısından özeti yeniden oluşturur."""
+        aggregator = cls()
+        aggregator.total = data["total"]
+        aggregator.rejected = data["rejected"]
+        aggregator.states = array("Q", data["states"])
+        aggregator.fail_indices = array("Q", data["fail_indices"])
+        aggregator.inputs = SpaceSaving.from_dict(data["inputs"])
+        aggregator.reasons = SpaceSaving.from_dict(data["reasons"])
+        aggregator.fail_chars = SpaceSaving.from_dict(data["fail_chars"])
+        aggregator.input_sketch = CountMinSketch.from_dict(data["input_sketch"])
+        return aggregator
+
+    # ---------- Raporlama ----------
+    def estimate(self, text: str) -> int:
+        """Bir girişin kaç kez reddedildiğine dair üst sınırlı tahmin.
+
+        Uzun girişler kırpılmış anahtarları üzerinden (aynı öneki paylaşan
+        girişlerle birlikte) sayılır.
+        """
+        return self.input_sketch.estimate(_bounded_key(text))
+
+    def report(self, top: int = 10) -> Dict[str, Any]:
+        """Güncel özet raporunu döndürür.
+
+        Args:
+            top: Her sıralı listede gösterilecek kayıt sayısı.
+        """
+        fail_indices = {
+            (f">{MAX_TRACKED_INDEX}" if index > MAX_TRACKED_INDEX else str(index)): count
+            for index, count in enumerate(self.fail_indices)
+            if count
+        }
+        return {
+            "total": self.total,
+            "rejected": self.rejected,
+            "rejection_rate": self.rejected / self.total if self.total else 0.0,
+            "states": {
+                STATES[state_id].value: count
+                for state_id, count in enumerate(self.states)
+                if count
+            },
+            "fail_indices": fail_indices,
+            "top_inputs": self.inputs.top(top),
+            "top_reasons": self.reasons.top(top),
+            "top_fail_chars": self.fail_chars.top(top),
+        }
+
+    def format_report(self, top: int = 10) -> str:
+        """Raporu okunabilir metin olarak biçimlendirir."""
+        report = self.report(top)
+        lines = [
+            f"{report['total']} giriş, {report['rejected']} ret "
+            f"(%{report['rejection_rate'] * 100:.2f})",
+            "Ölünen durum: " + ", ".join(
+                f"{state}={count}" for state, count in report["states"].items()
+            ),
+            "Hata indeksi: " + ", ".join(
+                f"{index}={count}" for index, count in report["fail_indices"].items()
+            ),
+        ]
+        for title, key in (
+            ("En sık nedenler (durum|indeks|karakter)", "top_reasons"),
+            ("En sık hatalı karakterler", "top_fail_chars"),
+            ("En sık reddedilen girişler", "top_inputs"),
+        ):
+            lines.append(f"{title}:")
+            for item, count, error in report[key]:
+                bound = f" (±{error})" if error else ""
+                lines.append(f"  {count:>10}{bound}  {item!r}")
+        return "\n".join(lines)
+
+    def _maybe_report(self) -> None:
+        """Rapor aralığı dolduysa raporu `on_report` fonksiyonuna iletir."""
+        now = self._clock()
+        if now - self._last_report < self._report_interval:
+            return
+        self._last_report = now
+        if self._on_report is not None:
+            self._on_report(self.report())
@@ -1,13 +1,45 @@
 """DFA çalıştırıcı ve sonuç veri yapıları."""
 
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+from array import array
+from collections.abc import Sequence as SequenceABC
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Generator, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from .alphabet import classify_char, CharClass
-from .tr_plate_dfa import State, Q0, is_accepting, next_state_with_char
+from utils.normalize import normalize_to_classes
 
+from .alphabet import CharClass, classify_char
+from .codegen import run_generated
+from .formats import MULTI_FORMAT_DFA, FORMAT_STANDARD
+from .instrumentation import RunnerStats
+from .compiled import (
+    PLATE_DFA,
+    STATES,
+    STATE_IDS,
+    START_ID,
+    DEAD_ID,
+    NUM_CLASSES,
+    BYTE_CLASS_TO_CHAR_CLASS,
+)
+from .regex_backend import accepts_re
+from .tr_plate_dfa import State, Q0, next_state_with_char
 
-@dataclass
+# Çalışma zamanında seçilebilen doğrulama motorları
+ENGINE_TABLE = "table"  # Derlenmiş yoğun geçiş tablosu
+ENGINE_INTERPRETED = "interpreted"  # tr_plate_dfa kuralları (Enum + sözlük)
+ENGINE_GENERATED = "generated"  # Üretilmiş, konum bazında açılmış kod
+ENGINE_RE = "re"  # DFA'dan türetilen düzenli ifade
+ENGINES = (ENGINE_TABLE, ENGINE_INTERPRETED, ENGINE_GENERATED, ENGINE_RE)
+
+# Etkin enstrümantasyon (None ise kapalı; bkz. enable_instrumentation)
+_instrumentation: Optional[RunnerStats] = None
+
+# Python 3.10+ sürümlerinde dataclass'lar __slots__ ile oluşturulur
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Step:
     """DFA'nın tek bir adımını temsil eder."""
     index: int  # Karakterin input içindeki indeksi
@@ -17,59 +49,444 @@ class Step:
     to_state: State  # Hedef durum
 
 
-@dataclass
+class Trace(SequenceABC):
+    """DFA adımlarının sıkıştırılmış (dizi tabanlı) kaydı.
+    
+    Karakter sınıfları ve kaynak/hedef durum kimlikleri paralel `array('B')`
+    tamponlarında tutulur. Adım indeksi dizideki konumla aynı olduğundan
+    ayrıca saklanmaz. `Step` nesneleri yalnızca indeksleme veya dolaşma
+    sırasında oluşturulur.
+    """
+
+    __slots__ = ("_text", "_classes", "_from_states", "_to_states")
+
+    def __init__(
+        self,
+        text: str,
+        classes: array,
+        from_states: array,
+        to_states: array
+    ) -> None:
+        """İzi oluşturur.
+        
+        Args:
+            text: İşlenen karakterler (adım sayısı uzunluğunda).
+            classes: Her adımın bayt sınıfı.
+            from_states: Her adımın kaynak durum kimliği.
+            to_states: Her adımın hedef durum kimliği.
+        """
+        self._text = text
+        self._classes = classes
+        self._from_states = from_states
+        self._to_states = to_states
+
+    def __len__(self) -> int:
+        return len(self._text)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Step, List[Step]]:
+        if isinstance(index, slice):
+            return [self._step_at(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Trace indeksi aralık dışında")
+        return self._step_at(index)
+
+    def __iter__(self) -> Iterator[Step]:
+        for index in range(len(self)):
+            yield self._step_at(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Trace):
+            return (
+                self._text == other._text
+                and self._classes == other._classes
+                and self._from_states == other._from_states
+                and self._to_states == other._to_states
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Trace({list(self)!r})"
+
+    def _step_at(self, index: int) -> Step:
+        """Verilen konumdaki adımın `Step` görünümünü oluşturur."""
+        return Step(
+            index=index,
+            ch=self._text[index],
+            char_class=BYTE_CLASS_TO_CHAR_CLASS[self._classes[index]],
+            from_state=STATES[self._from_states[index]],
+            to_state=STATES[self._to_states[index]]
+        )
+
+
+# İz istenmeyen sonuçlar için paylaşılan boş iz
+EMPTY_TRACE = Trace("", array("B"), array("B"), array("B"))
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class RunResult:
     """DFA çalıştırma sonucunu temsil eder."""
     accepted: bool  # Giriş kabul edildi mi?
     final_state: State  # Son durum
-    steps: List[Step]  # Tüm adımlar
+    steps: Sequence[Step]  # Tüm adımlar (iz istenmediyse boş)
     fail_index: Optional[int] = None  # Hatanın gerçekleştiği indeks
     fail_char: Optional[str] = None  # Hataya neden olan karakter
+    formats: Tuple[int, ...] = ()  # Eşleşen format kimlikleri (yalnızca run_formats)
+
+
+@dataclass
+class BatchResult:
+    """Toplu DFA çalıştırma sonucunu sütunlar hâlinde temsil eder.
+    
+    Her sütunun i. elemanı, girdinin i. elemanına karşılık gelir.
+    """
+    accepted: bytearray = field(default_factory=bytearray)  # Kabul bayrakları (1/0)
+    fail_indices: array = field(default_factory=lambda: array("h"))  # Hata indeksleri (yoksa -1)
+    final_states: array = field(default_factory=lambda: array("B"))  # Son durum kimlikleri
+
+    def __len__(self) -> int:
+        return len(self.accepted)
+
+    def accepted_count(self) -> int:
+        """Kabul edilen giriş sayısını döndürür."""
+        return self.accepted.count(1)
+
+
+def _run_interpreted(input_string: str) -> Tuple[int, int]:
+    """Girişi `next_state_with_char` kurallarıyla doğrudan çalıştırır.
+    
+    Returns:
+        (son durum kimliği, hata indeksi) çifti. Hata yoksa indeks -1'dir.
+    """
+    current_state = Q0
+    for char_index, character in enumerate(input_string):
+        current_state = next_state_with_char(
+            current_state,
+            character,
+            classify_char(character)
+        )
+        if current_state == State.DEAD:
+            return DEAD_ID, char_index
+    return STATE_IDS[current_state], -1
+
+
+# (son durum kimliği, hata indeksi) döndüren motorlar
+_VERDICT_ENGINES = {
+    ENGINE_TABLE: PLATE_DFA.run,
+    ENGINE_INTERPRETED: _run_interpreted,
+    ENGINE_GENERATED: run_generated,
+}
+
+
+def enable_instrumentation(stats: Optional[RunnerStats] = None) -> RunnerStats:
+    """Çalıştırıcı enstrümantasyonunu açar.
+    
+    Açıkken `accepts`, `validate`, izsiz `run_dfa` ve `run_dfa_batch`
+    seçilen motordan bağımsız olarak sayaç tutan yoldan geçer.
+    
+    Args:
+        stats: Kullanılacak sayaçlar (None ise yenileri oluşturulur).
+        
+    Returns:
+        Etkin sayaçlar.
+    """
+    global _instrumentation
+    _instrumentation = stats if stats is not None else RunnerStats()
+    return _instrumentation
+
+
+def disable_instrumentation() -> Optional[RunnerStats]:
+    """Enstrümantasyonu kapatır ve son sayaçları döndürür."""
+    global _instrumentation
+    stats, _instrumentation = _instrumentation, None
+    return stats
+
+
+def get_instrumentation() -> Optional[RunnerStats]:
+    """Etkin sayaçları döndürür (kapalıysa None)."""
+    return _instrumentation
+
+
+@contextmanager
+def instrumented(stats: Optional[RunnerStats] = None) -> Iterator[RunnerStats]:
+    """Blok süresince enstrümantasyonu açan bağlam yöneticisi.
+    
+    Önceki durum blok sonunda geri yüklenir.
+    """
+    previous = _instrumentation
+    try:
+        yield enable_instrumentation(stats)
+    finally:
+        if previous is None:
+            disable_instrumentation()
+        else:
+            enable_instrumentation(previous)
+
+
+def _verdict_engine(engine: str):
+    """Motor adına karşılık gelen karar fonksiyonunu döndürür."""
+    run = _VERDICT_ENGINES.get(engine)
+    if run is None:
+        raise ValueError(
+            f"Bilinmeyen motor: {engine!r} (seçenekler: {', '.join(ENGINES)})"
+        )
+    stats = _instrumentation
+    return run if stats is None else stats.run
+
+
+def accepts(input_string: str, engine: str = ENGINE_TABLE) -> bool:
+    """Girişin kabul edilip edilmediğini iz (trace) oluşturmadan döndürür.
+    
+    Tüm motorlar aynı sonucu verir; yalnızca hızları farklıdır.
+    
+    Args:
+        input_string: Doğrulanacak plaka metni.
+        engine: Kullanılacak motor (`ENGINES` içinden).
+        
+    Returns:
+        Giriş kabul edildiyse True, aksi halde False.
+        
+    Raises:
+        ValueError: Motor adı bilinmiyorsa.
+    """
+    if engine == ENGINE_RE:
+        if _instrumentation is None:
+            return accepts_re(input_string)
+        engine = ENGINE_TABLE
 
+    final_id, _ = _verdict_engine(engine)(input_string)
+    return PLATE_DFA.is_accepting_id(final_id)
 
-def run_dfa(input_string: str) -> RunResult:
+
+def validate(
+    input_string: str,
+    engine: str = ENGINE_TABLE
+) -> Tuple[bool, Optional[int]]:
+    """Girişi iz (trace) oluşturmadan doğrular.
+    
+    Düzenli ifade motorunda kabul edilen girişler doğrudan döner; hata
+    indeksi yalnızca reddedilen girişler için tablodan hesaplanır.
+    
+    Args:
+        input_string: Doğrulanacak plaka metni.
+        engine: Kullanılacak motor (`ENGINES` içinden).
+        
+    Returns:
+        (kabul, hata indeksi) çifti. Ölü duruma düşülmediyse indeks None'dır.
+        
+    Raises:
+        ValueError: Motor adı bilinmiyorsa.
+    """
+    if engine == ENGINE_RE:
+        if _instrumentation is None and accepts_re(input_string):
+            return True, None
+        engine = ENGINE_TABLE
+
+    final_id, fail_index = _verdict_engine(engine)(input_string)
+    if fail_index >= 0:
+        return False, fail_index
+    return PLATE_DFA.is_accepting_id(final_id), None
+
+
+def run_dfa(input_string: str, trace: bool = False) -> RunResult:
     """Verilen girişi DFA üzerinde çalıştırır.
     
+    Adım adım iz (trace) isteğe bağlıdır; varsayılan olarak `steps` boş
+    döner ve karakter başına nesne oluşturulmaz.
+    
     Args:
         input_string: Doğrulanacak plaka metni.
+        trace: True ise tüm adımlar `steps` listesine kaydedilir.
         
     Returns:
         DFA çalıştırma sonucu (kabul durumu, adımlar, hata bilgisi).
     """
-    current_state = Q0
-    execution_steps: List[Step] = []
+    if trace:
+        return _run_dfa_traced(input_string)
 
-    for char_index, character in enumerate(input_string):
-        char_classification = classify_char(character)
-        next_state = next_state_with_char(
-            current_state,
-            character,
-            char_classification
+    stats = _instrumentation
+    run = PLATE_DFA.run if stats is None else stats.run
+    final_id, fail_index = run(input_string)
+    return result_from_verdict(input_string, final_id, fail_index)
+
+
+def result_from_verdict(
+    input_string: str,
+    final_id: int,
+    fail_index: int
+) -> RunResult:
+    """Derlenmiş otomatın kararından izsiz bir `RunResult` oluşturur.
+    
+    Args:
+        input_string: Çalıştırılan metin.
+        final_id: Son durum kimliği.
+        fail_index: Hata indeksi (hata yoksa -1).
+        
+    Returns:
+        Boş adım listeli DFA çalıştırma sonucu.
+    """
+    if fail_index >= 0:
+        return RunResult(
+            accepted=False,
+            final_state=State.DEAD,
+            steps=EMPTY_TRACE,
+            fail_index=fail_index,
+            fail_char=input_string[fail_index]
+        )
+
+    return RunResult(
+        accepted=PLATE_DFA.is_accepting_id(final_id),
+        final_state=STATES[final_id],
+        steps=EMPTY_TRACE
+    )
+
+
+def run_formats(input_string: str) -> RunResult:
+    """Girişi tüm plaka formatlarına karşı tek geçişte çalıştırır.
+    
+    `final_state` standart formatın bileşen durumudur. Hata indeksi,
+    hiçbir formatın devam edemediği ilk konumdur.
+    
+    Args:
+        input_string: Doğrulanacak plaka metni.
+        
+    Returns:
+        Eşleşen format kimliklerini (`formats`) içeren izsiz sonuç.
+    """
+    state_id, fail_index = MULTI_FORMAT_DFA.run(input_string)
+    final_state = STATES[MULTI_FORMAT_DFA.component_state(state_id, FORMAT_STANDARD)]
+    if fail_index >= 0:
+        return RunResult(
+            accepted=False,
+            final_state=final_state,
+            steps=EMPTY_TRACE,
+            fail_index=fail_index,
+            fail_char=input_string[fail_index]
         )
 
-        execution_steps.append(Step(
+    formats = MULTI_FORMAT_DFA.matched_formats(state_id)
+    return RunResult(
+        accepted=bool(formats),
+        final_state=final_state,
+        steps=EMPTY_TRACE,
+        formats=formats
+    )
+
+
+def iter_dfa(input_string: str) -> Generator[Step, None, RunResult]:
+    """Girişi tembel (lazy) olarak çalıştırır ve her adımı üretildikçe verir.
+    
+    Ölü duruma geçildiğinde üretim durur. Nihai sonuç `StopIteration.value`
+    (veya `yield from` ifadesinin değeri) olarak döner; adımlar zaten
+    tüketildiğinden bu sonucun `steps` alanı boştur.
+    
+    Args:
+        input_string: Doğrulanacak plaka metni.
+        
+    Yields:
+        Her karakter için bir `Step`.
+        
+    Returns:
+        İzsiz DFA çalıştırma sonucu.
+    """
+    transitions = PLATE_DFA.transitions
+    current_id = START_ID
+
+    for char_index, character in enumerate(input_string):
+        byte_class = PLATE_DFA.class_of(character)
+        next_id = transitions[current_id * NUM_CLASSES + byte_class]
+
+        yield Step(
             index=char_index,
             ch=character,
-            char_class=char_classification,
-            from_state=current_state,
-            to_state=next_state
-        ))
+            char_class=BYTE_CLASS_TO_CHAR_CLASS[byte_class],
+            from_state=STATES[current_id],
+            to_state=STATES[next_id]
+        )
+
+        current_id = next_id
+        if current_id == DEAD_ID:
+            return result_from_verdict(input_string, DEAD_ID, char_index)
+
+    return result_from_verdict(input_string, current_id, -1)
 
-        current_state = next_state
+
+def _run_dfa_traced(input_string: str) -> RunResult:
+    """Girişi çalıştırır ve her adımı sıkıştırılmış `Trace` içine kaydeder."""
+    transitions = PLATE_DFA.transitions
+    current_id = START_ID
+    classes = array("B")
+    from_states = array("B")
+    to_states = array("B")
+
+    for char_index, character in enumerate(input_string):
+        byte_class = PLATE_DFA.class_of(character)
+        next_id = transitions[current_id * NUM_CLASSES + byte_class]
+
+        classes.append(byte_class)
+        from_states.append(current_id)
+        to_states.append(next_id)
+
+        current_id = next_id
         
         # Ölü duruma geçildiğinde erken çıkış
-        if current_state == State.DEAD:
+        if current_id == DEAD_ID:
             return RunResult(
                 accepted=False,
-                final_state=current_state,
-                steps=execution_steps,
+                final_state=State.DEAD,
+                steps=Trace(
+                    input_string[:char_index + 1],
+                    classes,
+                    from_states,
+                    to_states
+                ),
                 fail_index=char_index,
                 fail_char=character
             )
 
     # Giriş tamamen işlendi, kabul edilip edilmediği kontrol edilir
     return RunResult(
-        accepted=is_accepting(current_state),
-        final_state=current_state,
-        steps=execution_steps
+        accepted=PLATE_DFA.is_accepting_id(current_id),
+        final_state=STATES[current_id],
+        steps=Trace(input_string, classes, from_states, to_states)
     )
+
+
+def run_dfa_batch(inputs: Iterable[str]) -> BatchResult:
+    """Bir giriş kümesini normalize edip DFA üzerinde toplu çalıştırır.
+    
+    Sonuçlar giriş başına nesne oluşturulmadan sütunlara yazılır.
+    
+    Args:
+        inputs: Ham plaka girişleri.
+        
+    Returns:
+        Kabul bayrakları, hata indeksleri ve son durum kimliklerini
+        içeren sütunsal sonuç.
+    """
+    result = BatchResult()
+
+    stats = _instrumentation
+    if stats is None:
+        verdicts = map(PLATE_DFA.run_classes, map(normalize_to_classes, inputs))
+    else:
+        verdicts = map(stats.run_raw, inputs)
+
+    # Döngü içi öznitelik aramalarını dışarı taşı
+    accepting = PLATE_DFA.accepting
+    append_accepted = result.accepted.append
+    append_fail_index = result.fail_indices.append
+    append_final_state = result.final_states.append
+
+    for final_id, fail_index in verdicts:
+        append_accepted(accepting[final_id])
+        append_fail_index(fail_index)
+        append_final_state(final_id)
+
+    return result
@@ -0,0 +1,265 @@
+"""Serbest metin içinde plaka arama (tek geçişli tarayıcı).
+
+Tarayıcı, plaka DFA'sının durumlarını aynı anda birden çok başlangıç noktası
+için ilerletir. Aynı duruma düşen iki aday aynı geleceğe sahip olduğundan
+yalnızca en soldaki başlangıç tutulur; böylece her konumda en fazla durum
+sayısı kadar aday işlenir ve tarama metin uzunluğunda doğrusaldır.
+
+Eşleşmeler en soldaki-en uzun (leftmost-longest) kuralıyla ve çakışmasız
+seçilir. Bir eşleşmenin hemen öncesi ve hemen sonrası harf/rakam olamaz
+(kelime sınırı).
+"""
+
+import mmap
+import re
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .compiled import (
+    PLATE_DFA,
+    START_ID,
+    DEAD_ID,
+    NUM_CLASSES,
+    ASCII_LIMIT,
+    CLASS_OTHER,
+)
+from .regex_backend import iter_plates_re
+from .runner import ENGINE_RE, ENGINE_TABLE
+
+# (başlangıç, bitiş, metin) üçlüsü
+Match = Tuple[int, int, str]
+
+# ASCII karakterlerin kelime karakteri olup olmadığı
+_ASCII_WORD = bytes(
+    1 if chr(code).isalnum() else 0 for code in range(ASCII_LIMIT)
+)
+
+# Bayt -> kelime bayrağı tablosu (ASCII dışı baytlar ayrıca çözülür)
+_BYTE_WORD_TABLE = _ASCII_WORD + bytes(256 - ASCII_LIMIT)
+_NON_ASCII_RUN = re.compile(rb"[\x80-\xff]+")
+
+# Bayrak hesaplamasında bir kerede işlenen bayt sayısı
+_FLAG_CHUNK_SIZE = 1 << 20
+
+
+def _is_word_char(code: int) -> bool:
+    """Bir karakter kodunun harf/rakam olup olmadığını döndürür."""
+    if code < ASCII_LIMIT:
+        return _ASCII_WORD[code] == 1
+    return chr(code).isalnum()
+
+
+def _utf8_sequence_length(lead: int) -> int:
+    """UTF-8 öncü baytının dizi uzunluğunu döndürür (geçersizse 1)."""
+    if 0xC2 <= lead <= 0xDF:
+        return 2
+    if 0xE0 <= lead <= 0xEF:
+        return 3
+    if 0xF0 <= lead <= 0xF4:
+        return 4
+    return 1
+
+
+def _mark_non_ascii_run(chunk: bytes, start: int, end: int, flags: bytearray) -> None:
+    """ASCII dışı bir bayt dizisindeki karakterlerin kelime bayraklarını yazar.
+
+    Çok baytlı diziler çözülür ve `_is_word_char` ile aynı kural (isalnum)
+    uygulanır; dizinin tüm baytları aynı bayrağı alır. Geçersiz baytlar
+    (metin yolundaki U+FFFD gibi) kelime karakteri sayılmaz.
+    """
+    index = start
+    while index < end:
+        length = _utf8_sequence_length(chunk[index])
+        if length > 1:
+            try:
+                if chunk[index:index + length].decode("utf-8").isalnum():
+                    flags[index:index + length] = b"\x01" * length
+            except UnicodeDecodeError:
+                length = 1
+        index += length
+
+
+def _iter_flag_chunks(data) -> Iterator[bytearray]:
+    """Veriyi parça parça kelime bayraklarına (0/1) çevirir."""
+    size = len(data)
+    start = 0
+    while start < size:
+        end = min(start + _FLAG_CHUNK_SIZE, size)
+        # Çok baytlı bir diziyi bölmemek için sonu öncü bayta çek; parça
+        # tek bir diziden küçükse ileri kaydır
+        while start < end < size and 0x80 <= data[end] < 0xC0:
+            end -= 1
+        if end == start:
+            end += 1
+            while end < size and 0x80 <= data[end] < 0xC0:
+                end += 1
+        chunk = bytes(data[start:end])
+        flags = bytearray(chunk.translate(_BYTE_WORD_TABLE))
+        for match in _NON_ASCII_RUN.finditer(chunk):
+            _mark_non_ascii_run(chunk, match.start(), match.end(), flags)
+        yield flags
+        start = end
+
+
+def _utf8_word_flags(data) -> Iterator[int]:
+    """UTF-8 baytlarının her biri için kelime karakteri bayrağını (0/1) üretir.
+
+    Bellek kullanımı, dosya boyutundan bağımsız olarak parça boyutuyla
+    sınırlıdır.
+    """
+    return chain.from_iterable(_iter_flag_chunks(data))
+
+
+def _scan_spans(
+    codes: Iterable[int],
+    words: Iterable[bool]
+) -> Iterator[Tuple[int, int]]:
+    """Karakter kodları üzerinde tek geçişte eşleşme aralıklarını üretir.
+
+    Args:
+        codes: Karakter (veya bayt) kodları.
+        words: Her kod için kelime karakteri (harf/rakam) bayrağı.
+
+    Yields:
+        Çakışmasız (başlangıç, bitiş) aralıkları, soldan sağa.
+    """
+    transitions = PLATE_DFA.transitions
+    classes = PLATE_DFA.ascii_classes
+    accepting = PLATE_DFA.accepting
+
+    # Canlı adaylar: durum -> en soldaki başlangıç
+    threads: Dict[int, int] = {}
+    # Kelime sınırı doğrulanmış kabuller: başlangıç -> en uzun bitiş
+    accepts: Dict[int, int] = {}
+    # Son adımda kabul durumunda olan adayların başlangıçları
+    pending: List[int] = []
+    previous_is_word = False
+    length = 0
+
+    for position, (code, word) in enumerate(zip(codes, words)):
+        length = position + 1
+
+        # Önceki adımda kabul edenler, bu karakter sınır ise eşleşmedir
+        if not word:
+            for start in pending:
+                accepts[start] = position
+
+        # Kelime başında yeni aday başlat
+        if not previous_is_word:
+            threads[START_ID] = position
+
+        byte_class = classes[code] if code < ASCII_LIMIT else CLASS_OTHER
+        advanced: Dict[int, int] = {}
+        for state_id, start in threads.items():
+            next_id = transitions[state_id * NUM_CLASSES + byte_class]
+            if next_id == DEAD_ID:
+                continue
+            kept = advanced.get(next_id)
+            if kept is None or start < kept:
+                advanced[next_id] = start
+        threads = advanced
+        pending = [
+            start for state_id, start in threads.items() if accepting[state_id]
+        ]
+
+        yield from _emit_ready(threads, accepts)
+        previous_is_word = word
+
+    # Metin sonu da bir kelime sınırıdır
+    for start in pending:
+        accepts[start] = length
+    threads.clear()
+    yield from _emit_ready(threads, accepts)
+
+
+def _emit_ready(
+    threads: Dict[int, int],
+    accepts: Dict[int, int]
+) -> Iterator[Tuple[int, int]]:
+    """Artık değişemeyecek en soldaki eşleşmeleri üretir.
+
+    Daha solda veya aynı noktada başlayan canlı bir aday kaldığı sürece
+    eşleşme bekletilir. Üretilen eşleşmeyle çakışan adaylar silinir.
+    """
+    while accepts:
+        start = min(accepts)
+        if any(live_start <= start for live_start in threads.values()):
+            return
+
+        end = accepts[start]
+        yield start, end
+
+        for other in [key for key in accepts if key < end]:
+            del accepts[other]
+        for state_id in [
+            key for key, live_start in threads.items() if live_start < end
+        ]:
+            del threads[state_id]
+
+
+def iter_plates(text: str, engine: str = ENGINE_TABLE) -> Iterator[Match]:
+    """Metindeki tüm plaka geçişlerini soldan sağa tek geçişte bulur.
+
+    Metin olduğu gibi taranır; büyük/küçük harf dönüşümü yapılmaz.
+
+    Args:
+        text: Aranacak metin.
+        engine: "table" (DFA tarayıcı) veya "re" (türetilmiş düzenli ifade).
+
+    Yields:
+        (başlangıç, bitiş, plaka) üçlüleri. `text[başlangıç:bitiş]` plakadır.
+
+    Raises:
+        ValueError: Motor adı bilinmiyorsa.
+    """
+    if engine == ENGINE_RE:
+        yield from iter_plates_re(text)
+        return
+    if engine != ENGINE_TABLE:
+        raise ValueError(f"Bilinmeyen motor: {engine!r}")
+
+    words = map(_is_word_char, map(ord, text))
+    for start, end in _scan_spans(map(ord, text), words):
+        yield start, end, text[start:end]
+
+
+def find_plates(text: str, engine: str = ENGINE_TABLE) -> List[Match]:
+    """Metindeki tüm plaka geçişlerini liste olarak döndürür.
+
+    Args:
+        text: Aranacak metin.
+        engine: "table" veya "re" (bkz. `iter_plates`).
+
+    Returns:
+        (başlangıç, bitiş, plaka) üçlüleri.
+    """
+    return list(iter_plates(text, engine))
+
+
+def scan_file(path: str) -> Iterator[Match]:
+    """Bir dosyayı bellek eşlemeli (mmap) olarak tek geçişte tarar.
+
+    Dosya UTF-8 kabul edilir. Kelime sınırları `iter_plates` ile aynı
+    kuralla belirlenir: ASCII dışı karakterler çözülüp harf/rakam olup
+    olmadıklarına bakılır; geçersiz baytlar sınır sayılır.
+
+    Args:
+        path: Dosya yolu.
+
+    Yields:
+        (başlangıç baytı, bitiş baytı, plaka) üçlüleri.
+    """
+    with open(path, "rb") as stream:
+        try:
+            mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Boş dosyalar eşlenemez
+            return
+
+        with mapped:
+            view = memoryview(mapped)
+            try:
+                for start, end in _scan_spans(view, _utf8_word_flags(view)):
+                    yield start, end, mapped[start:end].decode("ascii")
+            finally:
+                view.release()
@@ -0,0 +1,179 @@
+"""Hatalı girişler için en yakın geçerli plaka önerileri.
+
+Öneriler, metin konumu ve DFA durumu çiftleri `(i, durum)` üzerinde
+Levenshtein tarzı dinamik programlama ile bulunur; aday dizi üretip
+sınama yapılmaz. Adımlar:
+
+1. Geriye doğru DP: `kalan[i][s]`, metnin `i`. konumundan sonrasını `s`
+   durumundan kabule götürmek için gereken en az düzenleme sayısıdır
+   (silme, ekleme ve değiştirme birer maliyetlidir; eşleşme ücretsizdir).
+2. İleri A* araması: `kalan` tablosu kesin (exact) sezgisel olduğundan
+   yalnızca `max_edits` bütçesi içinde kabule ulaşabilen dallar açılır ve
+   öneriler artan maliyet sırasıyla üretilir.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import List, Set, Tuple
+
+from .compiled import PLATE_DFA, STATES, START_ID, DEAD_ID, NUM_CLASSES
+from .language import Run, outgoing_runs
+
+# Varsayılan öneri sayısı ve düzenleme bütçesi
+DEFAULT_SUGGESTIONS = 5
+DEFAULT_MAX_EDITS = 1
+
+# Durum başına canlı hedeflere giden karakter blokları
+_RUNS: Tuple[Tuple[Run, ...], ...] = tuple(
+    tuple(outgoing_runs(state_id)) for state_id in range(len(STATES))
+)
+# Durum başına farklı canlı hedefler
+_TARGETS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(sorted({target for _, target in runs})) for runs in _RUNS
+)
+_ACCEPTING = tuple(
+    PLATE_DFA.is_accepting_id(state_id) for state_id in range(len(STATES))
+)
+
+
+def _reverse_topological_order() -> Tuple[int, ...]:
+    """Canlı durumları, her durum hedeflerinden sonra gelecek şekilde sıralar.
+
+    Otomat döngüsüz olduğundan böyle bir sıra her zaman vardır.
+    """
+    order: List[int] = []
+    visited: Set[int] = set()
+
+    def visit(state_id: int) -> None:
+        visited.add(state_id)
+        for _, target in _RUNS[state_id]:
+            if target not in visited:
+                visit(target)
+        order.append(state_id)
+
+    for state_id in range(len(STATES)):
+        if state_id != DEAD_ID and state_id not in visited:
+            visit(state_id)
+    return tuple(order)
+
+
+_STATE_ORDER = _reverse_topological_order()
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """Tek bir öneri."""
+    plate: str  # Önerilen geçerli plaka
+    cost: int  # Girişe düzenleme uzaklığı
+
+
+def _remaining_costs(text: str, limit: int) -> List[List[int]]:
+    """Her `(i, durum)` için kabule kalan en az düzenleme sayısını hesaplar.
+
+    `limit` değerini aşan maliyetler `limit` olarak kesilir (budama için yeterli).
+    """
+    length = len(text)
+    state_count = len(STATES)
+    transitions = PLATE_DFA.transitions
+    class_of = PLATE_DFA.class_of
+
+    final_row = [limit] * state_count
+    for state_id in _STATE_ORDER:
+        best = 0 if _ACCEPTING[state_id] else limit
+        for target in _TARGETS[state_id]:
+            if final_row[target] + 1 < best:
+                best = final_row[target] + 1  # Ekleme
+        final_row[state_id] = best
+    costs = [final_row]
+
+    for position in range(length - 1, -1, -1):
+        next_row = costs[-1]
+        row = [limit] * state_count
+        byte_class = class_of(text[position])
+
+        for state_id in _STATE_ORDER:
+            best = next_row[state_id] + 1  # Silme
+            matched = transitions[state_id * NUM_CLASSES + byte_class]
+            if matched != DEAD_ID and next_row[matched] < best:
+                best = next_row[matched]  # Eşleşme (ücretsiz)
+            for target in _TARGETS[state_id]:
+                if next_row[target] + 1 < best:
+                    best = next_row[target] + 1  # Değiştirme
+                if row[target] + 1 < best:
+                    best = row[target] + 1  # Ekleme
+            row[state_id] = best if best < limit else limit
+        costs.append(row)
+
+    costs.reverse()
+    return costs
+
+
+def suggest(
+    text: str,
+    max_edits: int = DEFAULT_MAX_EDITS,
+    n: int = DEFAULT_SUGGESTIONS
+) -> List[Suggestion]:
+    """Girişe en yakın geçerli plakaları döndürür.
+
+    Args:
+        text: Normalize edilmiş (büyük harfli) giriş.
+        max_edits: İzin verilen en fazla düzenleme (silme/ekleme/değiştirme).
+        n: En fazla öneri sayısı.
+
+    Returns:
+        Maliyete, eşit maliyette plakaya göre sıralı öneriler. Giriş zaten
+        geçerliyse ilk öneri 0 maliyetli girişin kendisidir.
+    """
+    if n <= 0 or max_edits < 0:
+        return []
+
+    length = len(text)
+    limit = max_edits + 1
+    costs = _remaining_costs(text, limit)
+    if costs[0][START_ID] > max_edits:
+        return []
+
+    # (tahmini toplam maliyet, çıktı, konum, durum, harcanan maliyet)
+    frontier: List[Tuple[int, str, int, int, int]] = [
+        (costs[0][START_ID], "", 0, START_ID, 0)
+    ]
+    expanded: Set[Tuple[int, str]] = set()
+    found: List[Suggestion] = []
+    emitted: Set[str] = set()
+
+    def push(spent: int, output: str, position: int, state_id: int) -> None:
+        estimate = spent + costs[position][state_id]
+        if estimate <= max_edits:
+            heapq.heappush(frontier, (estimate, output, position, state_id, spent))
+
+    while frontier and len(found) < n:
+        _, output, position, state_id, spent = heapq.heappop(frontier)
+        if (position, output) in expanded:
+            continue
+        expanded.add((position, output))
+
+        if position == length and _ACCEPTING[state_id] and output not in emitted:
+            emitted.add(output)
+            found.append(Suggestion(output, spent))
+
+        ch = text[position] if position < length else ""
+        if position < length:
+            push(spent + 1, output, position + 1, state_id)  # Silme
+
+        for chars, target in _RUNS[state_id]:
+            insert_ok = spent + 1 + costs[position][target] <= max_edits
+            replace_ok = (
+                position < length
+                and spent + 1 + costs[position + 1][target] <= max_edits
+            )
+            if ch in chars and ch:
+                push(spent, output + ch, position + 1, target)  # Eşleşme
+            if not insert_ok and not replace_ok:
+                continue
+            for candidate in chars:
+                if insert_ok:
+                    push(spent + 1, output + candidate, position, target)
+                if replace_ok and candidate != ch:
+                    push(spent + 1, output + candidate, position + 1, target)
+
+    return found
@@ -0,0 +1,8 @@
+"""`python -m server` giriş noktası."""
+
+import sys
+
+from server.app import main
+
+if __name__ == "__main__":
+    sys.exit(main())
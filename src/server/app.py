@@ -0,0 +1,508 @@
+"""Plaka doğrulaması için asyncio tabanlı HTTP/JSON sunucusu.
+
+Uç noktalar:
+    POST /validate   {"plate": "34 ABC 1234"}          -> tek sonuç
+                     {"plates": ["34 A 12", "..."]}     -> toplu sonuç
+    GET  /metrics    Prometheus metin biçiminde sayaçlar
+    GET  /health     Canlılık denetimi
+
+Eşzamanlı istekler (farklı bağlantılardan veya aynı bağlantıda ardışık
+gönderilen - pipelining - isteklerden) kısa bir süre bekletilip tek bir
+mikro toplu işte `run_dfa_batch` ile doğrulanır. HTTP/1.1 bağlantıları
+varsayılan olarak açık tutulur (keep-alive); yanıtlar istek sırasıyla yazılır.
+
+Kullanım (src dizininde):
+    python -m server --port 8080
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+
+from dfa.runner import run_dfa_batch
+
+# Sunucu sabitleri
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_MAX_BATCH = 512  # Mikro toplu iş başına en fazla plaka
+DEFAULT_MAX_DELAY = 0.0  # Toplu işin dolmasını bekleme süresi (sn; 0: döngü turu sonu)
+MAX_HEADER_SIZE = 16 * 1024
+MAX_BODY_SIZE = 1 << 20
+MAX_BULK_SIZE = 10000  # Toplu istek başına en fazla plaka
+MAX_PIPELINE_DEPTH = 64  # Bağlantı başına yanıt bekleyen en fazla istek
+
+JSON_CONTENT_TYPE = "application/json"
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# İstek sayaçlarında ayrı etiketlenen yollar; diğerleri tek etikette toplanır
+KNOWN_PATHS = ("/validate", "/metrics", "/health")
+OTHER_PATH_LABEL = "other"
+
+# (kabul, hata indeksi) çifti; hata yoksa indeks None'dır
+Verdict = Tuple[bool, Optional[int]]
+
+
+class HttpError(Exception):
+    """İstemciye hata yanıtı olarak döndürülen istek hatası."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class Request:
+    """Ayrıştırılmış bir HTTP isteği."""
+    method: str  # İstek yöntemi (GET, POST, ...)
+    path: str  # Sorgu dizesi hariç yol
+    version: str  # HTTP sürümü
+    headers: Dict[str, str]  # Küçük harfli başlık adları
+    body: bytes  # İstek gövdesi
+
+    @property
+    def keep_alive(self) -> bool:
+        """Yanıttan sonra bağlantının açık tutulup tutulmayacağını döndürür."""
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+
+def _escape_label(value: str) -> str:
+    """Prometheus etiket değerindeki ters bölü, tırnak ve satır sonunu kaçırır."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@dataclass
+class ServerMetrics:
+    """Sunucu sayaçları (Prometheus metin biçiminde dışa aktarılır)."""
+    requests: Dict[str, int] = field(default_factory=dict)  # Yol etiketi başına istek
+    errors: int = 0  # Hata yanıtı sayısı
+    plates: int = 0  # Doğrulanan plaka sayısı
+    accepted: int = 0  # Kabul edilen plaka sayısı
+    batches: int = 0  # Çalıştırılan mikro toplu iş sayısı
+    connections_open: int = 0  # Açık bağlantı sayısı
+    connections_total: int = 0  # Kabul edilen bağlantı sayısı
+    latency_seconds: float = 0.0  # İstek işleme sürelerinin toplamı
+    started: float = field(default_factory=time.time)  # Başlangıç zamanı
+
+    def render(self) -> str:
+        """Sayaçları Prometheus metin biçiminde döndürür."""
+        lines = [
+            "# TYPE plate_http_requests_total counter",
+        ]
+        for path, count in sorted(self.requests.items()):
+            lines.append(
+                f'plate_http_requests_total{{path="{_escape_label(path)}"}} {count}'
+            )
+
+        handled = sum(self.requests.values())
+        lines.extend([
+            "# TYPE plate_http_errors_total counter",
+            f"plate_http_errors_total {self.errors}",
+            "# TYPE plate_http_request_seconds summary",
+            f"plate_http_request_seconds_sum {self.latency_seconds:.6f}",
+            f"plate_http_request_seconds_count {handled}",
+            "# TYPE plate_validated_total counter",
+            f"plate_validated_total {self.plates}",
+            "# TYPE plate_accepted_total counter",
+            f"plate_accepted_total {self.accepted}",
+            "# TYPE plate_batches_total counter",
+            f"plate_batches_total {self.batches}",
+            "# TYPE plate_connections_open gauge",
+            f"plate_connections_open {self.connections_open}",
+            "# TYPE plate_connections_total counter",
+            f"plate_connections_total {self.connections_total}",
+            "# TYPE plate_uptime_seconds gauge",
+            f"plate_uptime_seconds {time.time() - self.started:.3f}",
+        ])
+        return "\n".join(lines) + "\n"
+
+
+class MicroBatcher:
+    """Eşzamanlı doğrulama isteklerini mikro toplu işlerde birleştirir.
+
+    Bekleyen plaka sayısı `max_batch` değerine ulaştığında veya ilk
+    isteğin üzerinden `max_delay` saniye geçtiğinde toplu iş çalıştırılır.
+    `max_delay` 0 ise toplu iş olay döngüsünün o anki turu bitince çalışır;
+    aynı turda hazır olan tüm istekler yine birleşir, tekil gecikme artmaz.
+    """
+
+    def __init__(
+        self,
+        metrics: ServerMetrics,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY
+    ) -> None:
+        self._metrics = metrics
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._pending: List[Tuple[List[str], "asyncio.Future[List[Verdict]]"]] = []
+        self._pending_size = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, plates: List[str]) -> List[Verdict]:
+        """Plakaları bir sonraki toplu işe ekler ve sonuçlarını bekler."""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[List[Verdict]]" = loop.create_future()
+        self._pending.append((plates, future))
+        self._pending_size += len(plates)
+
+        if self._pending_size >= self._max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Bekleyen tüm istekleri tek bir toplu işte doğrular."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        self._pending_size = 0
+        if not pending:
+            return
+
+        plates = [plate for group, _ in pending for plate in group]
+        result = run_dfa_batch(plates)
+        accepted = result.accepted
+        fail_indices = result.fail_indices
+
+        offset = 0
+        for group, future in pending:
+            verdicts = [
+                (accepted[index] == 1, fail_indices[index] if fail_indices[index] >= 0 else None)
+                for index in range(offset, offset + len(group))
+            ]
+            offset += len(group)
+            if not future.done():
+                future.set_result(verdicts)
+
+        self._metrics.batches += 1
+        self._metrics.plates += len(plates)
+        self._metrics.accepted += result.accepted_count()
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Akıştan bir HTTP isteği okur.
+
+    Returns:
+        İstek; bağlantı istekler arasında kapandıysa None.
+
+    Raises:
+        HttpError: İstek ayrıştırılamıyorsa, sınırları aşıyorsa veya
+            desteklenmeyen bir gövde kodlaması (Transfer-Encoding) kullanıyorsa.
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as error:
+        if not error.partial.strip():
+            return None
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Eksik istek başlığı")
+    except asyncio.LimitOverrunError:
+        raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "İstek başlığı çok büyük")
+
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Geçersiz istek satırı")
+
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, separator, value = line.partition(":")
+        if not separator:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Geçersiz başlık satırı")
+        headers[name.strip().lower()] = value.strip()
+
+    if "transfer-encoding" in headers:
+        # Gövde sınırı bilinmeden okumaya devam etmek bağlantıyı kaydırır
+        raise HttpError(HTTPStatus.NOT_IMPLEMENTED, "Transfer-Encoding desteklenmez")
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Geçersiz Content-Length")
+    if length < 0 or length > MAX_BODY_SIZE:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "İstek gövdesi çok büyük")
+
+    try:
+        body = await reader.readexactly(length) if length else b""
+    except asyncio.IncompleteReadError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Eksik istek gövdesi")
+
+    return Request(method, target.split("?", 1)[0], version, headers, body)
+
+
+def build_response(
+    status: HTTPStatus,
+    body: bytes,
+    content_type: str,
+    keep_alive: bool
+) -> bytes:
+    """HTTP/1.1 yanıt baytlarını oluşturur."""
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def _json_body(payload: Any) -> bytes:
+    """Nesneyi kompakt JSON baytlarına çevirir."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _verdict_payload(verdict: Verdict) -> Dict[str, Any]:
+    """Bir doğrulama sonucunu JSON nesnesine çevirir."""
+    accepted, fail_index = verdict
+    return {"accepted": accepted, "fail_index": fail_index}
+
+
+def _parse_plates(body: bytes) -> Tuple[List[str], bool]:
+    """`/validate` gövdesinden plakaları çıkarır.
+
+    Returns:
+        (plakalar, toplu istek mi) çifti.
+
+    Raises:
+        HttpError: Gövde geçerli bir istek değilse.
+    """
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Gövde geçerli JSON değil")
+
+    if isinstance(payload, dict) and isinstance(payload.get("plate"), str):
+        return [payload["plate"]], False
+
+    plates = payload.get("plates") if isinstance(payload, dict) else None
+    if not isinstance(plates, list) or not all(isinstance(plate, str) for plate in plates):
+        raise HttpError(
+            HTTPStatus.BAD_REQUEST,
+            'Gövde {"plate": "..."} veya {"plates": ["...", ...]} olmalıdır'
+        )
+    if len(plates) > MAX_BULK_SIZE:
+        raise HttpError(
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            f"Toplu istek en fazla {MAX_BULK_SIZE} plaka içerebilir"
+        )
+    return plates, True
+
+
+class PlateServer:
+    """Mikro toplu doğrulama yapan HTTP/JSON sunucusu."""
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.metrics = ServerMetrics()
+        self.batcher = MicroBatcher(self.metrics, max_batch, max_delay)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Dinlemeye başlar (port 0 ise atanan port `port` alanına yazılır)."""
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            self.host,
+            self.port,
+            limit=MAX_HEADER_SIZE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Sunucuyu başlatır ve kapatılana kadar çalıştırır."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Dinlemeyi durdurur."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Bir bağlantıdaki istekleri okur; yanıtları sırayla yazdırır.
+
+        Okuma, önceki isteklerin yanıtlarını beklemeden sürer (pipelining);
+        böylece aynı bağlantıdaki ardışık istekler de aynı toplu işe girebilir.
+        """
+        self.metrics.connections_open += 1
+        self.metrics.connections_total += 1
+        responses: "asyncio.Queue[Optional[Tuple[asyncio.Future, bool]]]" = (
+            asyncio.Queue(maxsize=MAX_PIPELINE_DEPTH)
+        )
+        write_task = asyncio.ensure_future(self._write_responses(responses, writer))
+
+        try:
+            while not write_task.done():
+                try:
+                    request = await read_request(reader)
+                except HttpError as error:
+                    await responses.put((self._error_future(error), False))
+                    break
+                if request is None:
+                    break
+
+                keep_alive = request.keep_alive
+                await responses.put(
+                    (asyncio.ensure_future(self._respond(request, keep_alive)), keep_alive)
+                )
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            if not write_task.done():
+                await responses.put(None)
+            await write_task
+            writer.close()
+            self.metrics.connections_open -= 1
+
+    async def _write_responses(
+        self,
+        responses: "asyncio.Queue[Optional[Tuple[asyncio.Future, bool]]]",
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Kuyruktaki yanıtları istek sırasıyla yazar.
+
+        Bağlantı koparsa kuyruk boşaltılmaya devam edilir; böylece okuma
+        tarafı dolu kuyrukta beklerken kilitlenmez.
+        """
+        connected = True
+        while True:
+            item = await responses.get()
+            if item is None:
+                return
+            pending, keep_alive = item
+            payload = await pending
+            if connected:
+                try:
+                    writer.write(payload)
+                    await writer.drain()
+                except ConnectionError:
+                    connected = False
+            if not keep_alive:
+                return
+
+    def _error_future(self, error: HttpError) -> "asyncio.Future[bytes]":
+        """Hata yanıtını tamamlanmış bir future olarak döndürür."""
+        future: "asyncio.Future[bytes]" = asyncio.get_running_loop().create_future()
+        future.set_result(self._error_response(error, keep_alive=False))
+        return future
+
+    def _error_response(self, error: HttpError, keep_alive: bool) -> bytes:
+        """Hata için JSON yanıt oluşturur."""
+        self.metrics.errors += 1
+        return build_response(
+            error.status,
+            _json_body({"error": error.message}),
+            JSON_CONTENT_TYPE,
+            keep_alive
+        )
+
+    async def _respond(self, request: Request, keep_alive: bool) -> bytes:
+        """İsteği yönlendirir ve yanıt baytlarını döndürür."""
+        started = time.perf_counter()
+        metrics = self.metrics
+        label = request.path if request.path in KNOWN_PATHS else OTHER_PATH_LABEL
+        metrics.requests[label] = metrics.requests.get(label, 0) + 1
+        try:
+            if request.path == "/validate":
+                if request.method != "POST":
+                    raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Yalnızca POST desteklenir")
+                response = await self._validate(request, keep_alive)
+            elif request.path == "/metrics":
+                if request.method != "GET":
+                    raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Yalnızca GET desteklenir")
+                response = build_response(
+                    HTTPStatus.OK,
+                    metrics.render().encode("utf-8"),
+                    METRICS_CONTENT_TYPE,
+                    keep_alive
+                )
+            elif request.path == "/health":
+                if request.method != "GET":
+                    raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Yalnızca GET desteklenir")
+                response = build_response(
+                    HTTPStatus.OK,
+                    _json_body({"status": "ok"}),
+                    JSON_CONTENT_TYPE,
+                    keep_alive
+                )
+            else:
+                raise HttpError(HTTPStatus.NOT_FOUND, f"Bilinmeyen yol: {request.path}")
+        except HttpError as error:
+            response = self._error_response(error, keep_alive)
+
+        metrics.latency_seconds += time.perf_counter() - started
+        return response
+
+    async def _validate(self, request: Request, keep_alive: bool) -> bytes:
+        """`/validate` isteğini mikro toplu iş üzerinden yanıtlar."""
+        plates, bulk = _parse_plates(request.body)
+        verdicts = await self.batcher.submit(plates)
+
+        if bulk:
+            payload: Any = {"results": [_verdict_payload(verdict) for verdict in verdicts]}
+        else:
+            payload = _verdict_payload(verdicts[0])
+        return build_response(HTTPStatus.OK, _json_body(payload), JSON_CONTENT_TYPE, keep_alive)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Komut satırı argüman ayrıştırıcısını oluşturur."""
+    parser = argparse.ArgumentParser(description="Plaka doğrulama HTTP/JSON sunucusu")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Dinlenecek adres")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Dinlenecek port")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                        help="Mikro toplu iş başına en fazla plaka")
+    parser.add_argument("--max-delay-ms", type=float, default=DEFAULT_MAX_DELAY * 1000,
+                        help="Toplu işin dolmasını bekleme süresi (milisaniye)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Sunucuyu başlatır ve Ctrl+C ile durdurulana kadar çalıştırır.
+
+    Returns:
+        Çıkış kodu.
+    """
+    args = _build_parser().parse_args(argv)
+    server = PlateServer(args.host, args.port, args.max_batch, args.max_delay_ms / 1000)
+
+    async def run() -> None:
+        await server.start()
+        print(f"Dinleniyor: http://{server.host}:{server.port}", file=sys.stderr)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1,231 @@
+"""Plaka doğrulama sunucusu için yük üreteci (load generator).
+
+Verilen sayıda kalıcı (keep-alive) bağlantı açar ve her bağlantıda en
+fazla `pipeline` kadar yanıtı beklenen istek tutar. İstek başına gecikme
+ölçülür; sonunda p50/p99 gecikme ve saniyedeki istek sayısı raporlanır.
+Plakalar `dfa.language` ile düzgün dağılımlı (ve istenen oranda geçersiz)
+olarak üretilir.
+
+Kullanım (src dizininde, sunucu çalışırken):
+    python -m server.loadgen --connections 16 --requests 20000 --pipeline 8
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional, Sequence
+
+from dfa.language import PLATE_LANGUAGE
+from server.app import DEFAULT_HOST, DEFAULT_PORT
+
+# Yük sabitleri
+DEFAULT_CONNECTIONS = 8
+DEFAULT_REQUESTS = 10000
+DEFAULT_PIPELINE = 1
+DEFAULT_BULK = 1
+DEFAULT_INVALID_RATIO = 0.5
+DEFAULT_SEED = 2024
+
+
+@dataclass
+class LoadReport:
+    """Yük testi sonucu."""
+    requests: int  # Tamamlanan istek sayısı
+    errors: int  # 200 dışı yanıt sayısı
+    seconds: float  # Toplam süre
+    requests_per_sec: float  # Saniyedeki istek sayısı
+    p50_ms: float  # Ortanca gecikme (milisaniye)
+    p99_ms: float  # %99'luk dilim gecikmesi (milisaniye)
+    max_ms: float  # En yüksek gecikme (milisaniye)
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Sıralı değerlerden en yakın sıra (nearest-rank) yöntemiyle dilim değeri döndürür."""
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values) - 1, max(0, int(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+
+def build_payloads(
+    count: int,
+    bulk: int,
+    invalid_ratio: float,
+    seed: int
+) -> List[bytes]:
+    """`/validate` istek baytlarını önceden üretir.
+
+    Args:
+        count: İstek sayısı.
+        bulk: İstek başına plaka sayısı (1 ise tekli istek gönderilir).
+        invalid_ratio: Geçersiz plaka oranı.
+        seed: Rastgele sayı üreteci tohumu.
+    """
+    rng = random.Random(seed)
+
+    def plate() -> str:
+        if rng.random() < invalid_ratio:
+            return PLATE_LANGUAGE.sample_invalid(rng)
+        return PLATE_LANGUAGE.sample(rng)
+
+    requests = []
+    for _ in range(count):
+        if bulk == 1:
+            body = {"plate": plate()}
+        else:
+            body = {"plates": [plate() for _ in range(bulk)]}
+        encoded = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        requests.append(
+            b"POST /validate HTTP/1.1\r\n"
+            b"Host: loadgen\r\n"
+            b"Content-Type: application/json\r\n"
+            + f"Content-Length: {len(encoded)}\r\n\r\n".encode("latin-1")
+            + encoded
+        )
+    return requests
+
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    """Bir HTTP yanıtını okur ve durum kodunu döndürür."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+
+    length = 0
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    if length:
+        await reader.readexactly(length)
+    return status
+
+
+async def _drive_connection(
+    host: str,
+    port: int,
+    payloads: Sequence[bytes],
+    pipeline: int,
+    latencies: List[float]
+) -> int:
+    """Tek bir bağlantı üzerinden istekleri gönderir.
+
+    Returns:
+        200 dışı yanıt sayısı.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    slots = asyncio.Semaphore(pipeline)
+    started: Deque[float] = deque()
+
+    async def send() -> None:
+        for payload in payloads:
+            await slots.acquire()
+            started.append(time.perf_counter())
+            writer.write(payload)
+            await writer.drain()
+
+    async def receive() -> int:
+        errors = 0
+        for _ in payloads:
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - started.popleft())
+            slots.release()
+            if status != 200:
+                errors += 1
+        return errors
+
+    try:
+        _, errors = await asyncio.gather(send(), receive())
+    finally:
+        writer.close()
+    return errors
+
+
+async def run_load(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    connections: int = DEFAULT_CONNECTIONS,
+    requests: int = DEFAULT_REQUESTS,
+    pipeline: int = DEFAULT_PIPELINE,
+    bulk: int = DEFAULT_BULK,
+    invalid_ratio: float = DEFAULT_INVALID_RATIO,
+    seed: int = DEFAULT_SEED
+) -> LoadReport:
+    """Sunucuya yük uygular ve sonucu raporlar.
+
+    İstekler bağlantılara eşit paylaştırılır; üretim süresi ölçüme dahil değildir.
+    """
+    payloads = build_payloads(requests, bulk, invalid_ratio, seed)
+    shares = [payloads[index::connections] for index in range(connections)]
+    latencies: List[float] = []
+
+    started = time.perf_counter()
+    errors = await asyncio.gather(*(
+        _drive_connection(host, port, share, pipeline, latencies)
+        for share in shares if share
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return LoadReport(
+        requests=len(latencies),
+        errors=sum(errors),
+        seconds=elapsed,
+        requests_per_sec=len(latencies) / elapsed if elapsed > 0 else 0.0,
+        p50_ms=percentile(latencies, 0.50) * 1000,
+        p99_ms=percentile(latencies, 0.99) * 1000,
+        max_ms=(latencies[-1] if latencies else 0.0) * 1000
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Yük üretecini çalıştırır ve raporu yazar.
+
+    Returns:
+        Çıkış kodu (hata yanıtı varsa 1).
+    """
+    parser = argparse.ArgumentParser(description="Plaka doğrulama sunucusu yük üreteci")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Sunucu adresi")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Sunucu portu")
+    parser.add_argument("--connections", type=int, default=DEFAULT_CONNECTIONS,
+                        help="Eşzamanlı bağlantı sayısı")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS,
+                        help="Toplam istek sayısı")
+    parser.add_argument("--pipeline", type=int, default=DEFAULT_PIPELINE,
+                        help="Bağlantı başına yanıtı beklenen en fazla istek")
+    parser.add_argument("--bulk", type=int, default=DEFAULT_BULK,
+                        help="İstek başına plaka sayısı (1: tekli istek)")
+    parser.add_argument("--invalid-ratio", type=float, default=DEFAULT_INVALID_RATIO,
+                        help="Geçersiz plaka oranı")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help="Rastgele sayı üreteci tohumu")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_load(
+        args.host,
+        args.port,
+        max(1, args.connections),
+        args.requests,
+        max(1, args.pipeline),
+        max(1, args.bulk),
+        args.invalid_ratio,
+        args.seed
+    ))
+
+    print(
+        f"{report.requests} istek, {report.errors} hata; {report.seconds:.3f} sn\n"
+        f"istek/sn: {report.requests_per_sec:,.0f}"
+        f" (plaka/sn: {report.requests_per_sec * max(1, args.bulk):,.0f})\n"
+        f"gecikme ms: p50 {report.p50_ms:.3f}  p99 {report.p99_ms:.3f}"
+        f"  max {report.max_ms:.3f}"
+    )
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,11 @@
 """Türk plaka DFA doğrulama uygulaması."""
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional, List
+from typing import Optional, Sequence
 
 from utils.normalize import normalize_input
 from dfa.runner import run_dfa, RunResult, Step
+from dfa.matcher import PlateMatcher, MatchStatus
 from ui.dfa_view_tk import DFACanvasView
 
 # Uygulama sabitleri
@@ -15,6 +16,13 @@ ENTRY_WIDTH = 40
 LISTBOX_WIDTH = 160
 LISTBOX_HEIGHT = 12
 
+# Canlı doğrulama durum metinleri ve renkleri
+LIVE_STATUS_STYLES = {
+    MatchStatus.VALID: ("Geçerli", "green"),
+    MatchStatus.INVALID: ("Geçersiz", "red"),
+    MatchStatus.INCOMPLETE: ("Eksik", "gray40"),
+}
+
 
 class PlateCheckerApp:
     """Türk plaka formatını DFA ile doğrulayan GUI uygulaması."""
@@ -32,10 +40,13 @@ class PlateCheckerApp:
         # Animasyon kontrol değişkenleri
         self._animation_timer_id: Optional[str] = None
         self._is_playing: bool = False
-        self._current_steps: List[Step] = []
+        self._current_steps: Sequence[Step] = []
         self._current_step_index: int = 0
         self._animation_delay_ms: int = DEFAULT_ANIMATION_DELAY_MS
 
+        # Canlı (tuş tuş) doğrulama
+        self._live_matcher = PlateMatcher()
+
         self._build_ui()
 
     # ---------- UI Oluşturma ----------
@@ -64,6 +75,13 @@ class PlateCheckerApp:
         )
         self.entry.pack(pady=5)
 
+        self.live_status_label = ttk.Label(
+            self.root,
+            text="",
+            font=("Arial", 10)
+        )
+        self.live_status_label.pack()
+
     def _create_control_panel(self) -> None:
         """Kontrol butonlarını oluşturur."""
         control_frame = ttk.Frame(self.root)
@@ -134,6 +152,7 @@ class PlateCheckerApp:
     def _bind_keyboard_shortcuts(self) -> None:
         """Klavye kısayollarını bağlar."""
         self.entry.bind("<Return>", lambda e: self.prepare_validation())
+        self.entry.bind("<KeyRelease>", lambda e: self.update_live_validation())
 
     # ---------- Animasyon Kontrolleri ----------
     def _stop_animation_timer(self) -> None:
@@ -202,6 +221,40 @@ class PlateCheckerApp:
         return self._current_step_index >= len(self._current_steps)
 
     # ---------- Doğrulama ----------
+    def update_live_validation(self) -> None:
+        """Girişi artımlı eşleştiriciyle eşitler ve canlı durumu gösterir.
+        
+        Yalnızca değişen karakterler eşleştiriciye beslenir veya silinir;
+        DFA baştan çalıştırılmaz.
+        """
+        normalized_input = normalize_input(self.entry.get())
+        if normalized_input == self._live_matcher.text:
+            return
+
+        # Hazırlanmış adımlar artık girişe ait değil
+        self.pause_animation()
+        self.steps_box.delete(0, tk.END)
+        self._current_steps = []
+        self._current_step_index = 0
+        self.result_label.config(text="")
+        self._update_button_states()
+
+        self._live_matcher.sync(normalized_input)
+        self._display_live_status()
+        self.dfa_view.show_path(self._live_matcher.path)
+
+    def _display_live_status(self) -> None:
+        """Artımlı eşleştiricinin durumunu giriş altında gösterir."""
+        if not self._live_matcher.text:
+            self.live_status_label.config(text="")
+            return
+
+        text, color = LIVE_STATUS_STYLES[self._live_matcher.status]
+        self.live_status_label.config(
+            text=f"{text} ({self._live_matcher.state.value})",
+            foreground=color
+        )
+
     def prepare_validation(self) -> None:
         """Plaka doğrulamasını hazırlar ve DFA adımlarını oluşturur."""
         self.pause_animation()
@@ -209,7 +262,14 @@ class PlateCheckerApp:
 
         raw_input = self.entry.get()
         normalized_input = normalize_input(raw_input)
-        validation_result = run_dfa(normalized_input)
+
+        # Giriş tuş bırakma olayı olmadan değişmiş olabilir (fareyle yapıştırma,
+        # programla ekleme); eşitlenmezse Return tuşunun kendi <KeyRelease>
+        # olayı hazırlanan adımları siler
+        self._live_matcher.sync(normalized_input)
+        self._display_live_status()
+
+        validation_result = run_dfa(normalized_input, trace=True)
 
         self._display_validation_result(validation_result)
         self._setup_steps_for_animation(validation_result)
@@ -239,7 +299,7 @@ class PlateCheckerApp:
         self._current_step_index = 0
         self._populate_steps_listbox(result.steps)
 
-    def _populate_steps_listbox(self, steps: List[Step]) -> None:
+    def _populate_steps_listbox(self, steps: Sequence[Step]) -> None:
         """Adımları listbox'a ekler."""
         for step in steps:
             step_text = (
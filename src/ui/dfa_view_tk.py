@@ -1,7 +1,7 @@
 """DFA durumlarını ve geçişlerini görselleştiren canvas bileşeni."""
 import tkinter as tk
 from dataclasses import dataclass
-from typing import Dict, Tuple, List, Optional, Set
+from typing import Dict, Tuple, List, Optional, Sequence, Set
 
 from dfa.tr_plate_dfa import State, is_accepting
 
@@ -218,6 +218,16 @@ class DFACanvasView:
         self._active_state = to_state
         self.draw()
 
+    def show_path(self, path: Sequence[State]) -> None:
+        """Verilen durum yolunu vurgular; son durum aktif durum olur.
+        
+        Args:
+            path: Başlangıç durumundan itibaren ziyaret edilen durumlar.
+        """
+        self._traversed_edges = set(zip(path, path[1:]))
+        self._active_state = path[-1] if path else None
+        self.draw()
+
     # ---------- Çizim ----------
     def draw(self) -> None:
         """DFA'yı canvas üzerinde çizer."""
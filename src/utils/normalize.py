@@ -1,5 +1,36 @@
 """Giriş metni normalizasyon fonksiyonları."""
 
+from dfa.compiled import PLATE_DFA
+
+# Normalizasyonda silinen satır sonu karakterleri
+_LINE_BREAKS = ("\r", "\n")
+
+
+class _FusedTable(dict):
+    """Karakter kodunu büyük harfli karşılığının bayt sınıflarına eşler.
+    
+    Tabloda olmayan karakterler ilk kullanımda hesaplanır (saklanmaz);
+    `str.upper` birden fazla karakter üretebildiğinden (ör. 'ß' -> 'SS')
+    değer birden çok sınıf içerebilir.
+    """
+
+    def __missing__(self, code: int) -> str:
+        return _classes_of(chr(code))
+
+
+def _classes_of(ch: str) -> str:
+    """Bir karakterin normalize edilmiş hâlinin bayt sınıflarını döndürür."""
+    return "".join(chr(PLATE_DFA.class_of(upper)) for upper in ch.upper())
+
+
+# ASCII ve sık görülen Türkçe küçük harfler için önceden hesaplanmış tablo
+_FUSED_TRANSLATION = _FusedTable(
+    (ord(ch), _classes_of(ch))
+    for ch in [chr(code) for code in range(128)] + list("çğıöşü")
+)
+for _line_break in _LINE_BREAKS:
+    _FUSED_TRANSLATION[ord(_line_break)] = None
+
 
 def normalize_input(raw_input: str) -> str:
     """Plaka girişini DFA için normalize eder.
@@ -22,3 +53,23 @@ def normalize_input(raw_input: str) -> str:
     
     # Satır sonu karakterlerini temizle ve büyük harfe çevir
     return raw_input.replace("\r", "").replace("\n", "").upper()
+
+
+def normalize_to_classes(raw_input: str) -> bytes:
+    """Girişi tek geçişte normalize eder ve DFA bayt sınıflarına çevirir.
+    
+    Sonuç, `normalize_input(raw_input)` metninin karakter karakter bayt
+    sınıflarıyla aynıdır; ancak satır sonu silme, büyük harfe çevirme ve
+    sınıflandırma tek bir `str.translate` çağrısında yapılır.
+    İç boşluklara dokunulmaz.
+    
+    Args:
+        raw_input: Ham plaka girişi.
+        
+    Returns:
+        Normalize edilmiş metnin her karakteri için bir bayt sınıfı.
+    """
+    if raw_input is None:
+        return b""
+
+    return raw_input.translate(_FUSED_TRANSLATION).encode("ascii")
@@ -0,0 +1,242 @@
+"""Sabit bellekli, birleştirilebilir (mergeable) akış özetleri.
+
+- `SpaceSaving`: en sık görülen anahtarların (heavy hitters) yaklaşık sayıları
+- `CountMinSketch`: herhangi bir anahtarın sıklığı için üst sınırlı tahmin
+
+İki özet de süreçler arasında `to_dict`/`from_dict` (JSON uyumlu) veya
+pickle ile taşınabilir ve `merge` ile birleştirilebilir. Özetlerde
+kullanılan karma (hash) süreçten bağımsızdır (Python `hash` tuzlanır).
+"""
+
+import base64
+import hashlib
+import heapq
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+# Yığın (heap) bu kat kadar şişince eski kayıtlardan temizlenir
+_HEAP_SLACK = 4
+
+
+def stable_hash(key: str, seed: int = 0) -> Tuple[int, int]:
+    """Süreçten bağımsız iki adet 64 bitlik karma değeri döndürür."""
+    digest = hashlib.blake2b(
+        key.encode("utf-8", "surrogatepass"),
+        digest_size=16,
+        salt=seed.to_bytes(16, "little")
+    ).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+
+class SpaceSaving:
+    """Space-Saving algoritmasıyla en sık `capacity` anahtarı izler.
+
+    Her anahtar için (sayı, hata) tutulur; gerçek sıklık
+    `sayı - hata <= gerçek <= sayı` aralığındadır. Bellek kullanımı
+    `capacity` ile sınırlıdır.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Özeti oluşturur.
+
+        Raises:
+            ValueError: capacity pozitif değilse.
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity pozitif olmalıdır, alınan: {capacity}")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        # (sayı, anahtar) kayıtları; güncel olmayanlar tembel olarak atlanır
+        self._heap: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, key: str, count: int = 1) -> None:
+        """Anahtarı `count` kez görülmüş olarak ekler."""
+        self.total += count
+        counts = self._counts
+        current = counts.get(key)
+
+        if current is None:
+            if len(counts) < self.capacity:
+                current = 0
+                self._errors[key] = 0
+            else:
+                # En küçük sayılı anahtarın yerini al
+                current, evicted = self._pop_min()
+                del counts[evicted]
+                del self._errors[evicted]
+                self._errors[key] = current
+
+        counts[key] = current + count
+        heapq.heappush(self._heap, (current + count, key))
+        if len(self._heap) > _HEAP_SLACK * self.capacity:
+            self._rebuild_heap()
+
+    def _pop_min(self) -> Tuple[int, str]:
+        """En küçük sayılı güncel kaydı yığından çıkarır."""
+        heap = self._heap
+        counts = self._counts
+        while True:
+            count, key = heapq.heappop(heap)
+            if counts.get(key) == count:
+                return count, key
+
+    def _rebuild_heap(self) -> None:
+        """Yığını yalnızca güncel kayıtlarla yeniden kurar."""
+        self._heap = [(count, key) for key, count in self._counts.items()]
+        heapq.heapify(self._heap)
+
+    def min_count(self) -> int:
+        """Özet doluysa en küçük sayıyı, değilse 0 döndürür."""
+        if len(self._counts) < self.capacity:
+            return 0
+        return min(self._counts.values())
+
+    def estimate(self, key: str) -> Tuple[int, int]:
+        """Anahtarın (sayı, hata) tahminini döndürür.
+
+        İzlenmeyen anahtarlar için (en küçük sayı, en küçük sayı) döner.
+        """
+        if key in self._counts:
+            return self._counts[key], self._errors[key]
+        floor = self.min_count()
+        return floor, floor
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """En sık anahtarları (anahtar, sayı, hata) olarak azalan sırayla döndürür."""
+        ranked = sorted(self._counts.items(), key=lambda item: (-item[1], item[0]))
+        if n is not None:
+            ranked = ranked[:n]
+        return [(key, count, self._errors[key]) for key, count in ranked]
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """Başka bir özeti bu özete ekler (yerinde) ve kendisini döndürür.
+
+        Bir özette bulunmayan anahtarlara o özetin en küçük sayısı hem sayı
+        hem hata olarak eklenir; sonuçtan en sık `capacity` anahtar tutulur.
+        """
+        floor_self = self.min_count()
+        floor_other = other.min_count()
+        merged: Dict[str, Tuple[int, int]] = {}
+
+        for key in set(self._counts) | set(other._counts):
+            count_self, error_self = (
+                (self._counts[key], self._errors[key])
+                if key in self._counts else (floor_self, floor_self)
+            )
+            count_other, error_other = (
+                (other._counts[key], other._errors[key])
+                if key in other._counts else (floor_other, floor_other)
+            )
+            merged[key] = (count_self + count_other, error_self + error_other)
+
+        kept = sorted(merged.items(), key=lambda item: (-item[1][0], item[0]))[:self.capacity]
+        self._counts = {key: count for key, (count, _) in kept}
+        self._errors = {key: error for key, (_, error) in kept}
+        self.total += other.total
+        self._rebuild_heap()
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Özeti JSON uyumlu bir sözlüğe çevirir."""
+        return {
+            "capacity": self.capacity,
+            "total": self.total,
+            "items": [[key, count, error] for key, count, error in self.top()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SpaceSaving":
+        """`to_dict` çıktısından özeti yeniden oluşturur."""
+        summary = cls(data["capacity"])
+        summary.total = data["total"]
+        for key, count, error in data["items"]:
+            summary._counts[key] = count
+            summary._errors[key] = error
+        summary._rebuild_heap()
+        return summary
+
+
+class CountMinSketch:
+    """Count-Min Sketch: sabit bellekte sıklık tahmini.
+
+    Tahmin hiçbir zaman gerçek değerin altında değildir; `width` genişliği
+    ile hata, `depth` derinliği ile hata olasılığı azalır.
+    """
+
+    def __init__(self, width: int, depth: int, seed: int = 0) -> None:
+        """Özeti oluşturur.
+
+        Raises:
+            ValueError: width veya depth pozitif değilse.
+        """
+        if width <= 0 or depth <= 0:
+            raise ValueError(f"width ve depth pozitif olmalıdır, alınan: {width}x{depth}")
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.total = 0
+        self._counters = array("Q", bytes(8 * width * depth))
+
+    def _cells(self, key: str) -> List[int]:
+        """Anahtarın her satırdaki hücre indekslerini döndürür (çift karma)."""
+        first, second = stable_hash(key, self.seed)
+        second |= 1
+        width = self.width
+        return [
+            row * width + (first + row * second) % width
+            for row in range(self.depth)
+        ]
+
+    def add(self, key: str, count: int = 1) -> None:
+        """Anahtarı `count` kez görülmüş olarak ekler."""
+        self.total += count
+        counters = self._counters
+        for cell in self._cells(key):
+            counters[cell] += count
+
+    def estimate(self, key: str) -> int:
+        """Anahtarın sıklığı için üst sınırlı tahmini döndürür."""
+        counters = self._counters
+        return min(counters[cell] for cell in self._cells(key))
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        """Aynı boyut ve tohumlu başka bir özeti ekler (yerinde).
+
+        Raises:
+            ValueError: Özetlerin boyutları veya tohumları farklıysa.
+        """
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("Yalnızca aynı boyut ve tohumlu özetler birleştirilebilir")
+        counters = self._counters
+        for index, value in enumerate(other._counters):
+            if value:
+                counters[index] += value
+        self.total += other.total
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Özeti JSON uyumlu bir sözlüğe çevirir (sayaçlar base64)."""
+        return {
+            "width": self.width,
+            "depth": self.depth,
+            "seed": self.seed,
+            "total": self.total,
+            "counters": base64.b64encode(self._counters.tobytes()).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CountMinSketch":
+        """`to_dict` çıktısından özeti yeniden oluşturur."""
+        sketch = cls(data["width"], data["depth"], data["seed"])
+        sketch.total = data["total"]
+        counters = array("Q")
+        counters.frombytes(base64.b64decode(data["counters"]))
+        if len(counters) != len(sketch._counters):
+            raise ValueError("Sayaç dizisi boyutu özet boyutuyla uyuşmuyor")
+        sketch._counters = counters
+        return sketch
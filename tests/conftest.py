@@ -0,0 +1,30 @@
+"""Testlerin `src` altındaki paketleri içe aktarabilmesi için yol ayarı ve ortak veriler."""
+
+import os
+import random
+import sys
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_DIR)
+
+# Elle seçilmiş sınır durumları (boş giriş, eksik/fazla karakter, il sınırları,
+# küçük harf, Türkçe harfler, NUL ve ASCII dışı karakterler)
+EDGE_CASES = (
+    "", " ", "3", "34", "34 ", "34 A", "34 A ", "34 A 1", "34 A 12", "34 A 12345",
+    "00 A 12", "01 A 12", "09 A 12", "10 A 12", "79 A 12", "80 A 12", "81 A 12", "82 A 12",
+    "90 A 12", "34 ABCD 12", "34 ABC 1234", "34 ABC 12345", "34 ab 12", "34 Ç 12",
+    "34 Q 12", "34  A 12", "34 A  12", " 34 A 12", "34 A 12 ", "34 AB 12\x00", "İ", "🚗",
+)
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    """Geçerli ve geçersiz örneklerden oluşan sabit tohumlu test kümesi."""
+    from dfa.language import PLATE_LANGUAGE
+
+    rng = random.Random(2024)
+    valid = [PLATE_LANGUAGE.sample(rng) for _ in range(1500)]
+    invalid = [PLATE_LANGUAGE.sample_invalid(rng) for _ in range(1500)]
+    return list(EDGE_CASES) + valid + invalid
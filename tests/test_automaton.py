@@ -0,0 +1,101 @@
+"""`dfa.automaton` için testler."""
+
+from itertools import product
+
+import pytest
+
+from dfa.automaton import DFA, MISSING, SINK_NAME, union_product
+from dfa.compiled import PLATE_AUTOMATON
+
+
+def _same_language(left: DFA, right: DFA) -> bool:
+    """İki otomatın dilini çarpım yapısındaki kabul bayraklarıyla karşılaştırır."""
+    _, tuples = union_product([left, right])
+    left, right = left.complete(), right.complete()
+    return all(
+        left.is_accepting(left_id) == right.is_accepting(right_id)
+        for left_id, right_id in tuples
+    )
+
+
+def _redundant_parity() -> DFA:
+    """Çift sayıda 1 sınıfı içeren dizileri tanıyan, gereksiz durumlu otomat.
+
+    s0/s2 ve s1/s3 denktir; s4 erişilemez.
+    """
+    transitions = [
+        0, 1,  # s0
+        1, 2,  # s1
+        2, 3,  # s2
+        3, 0,  # s3
+        4, 4,  # s4
+    ]
+    return DFA(2, transitions, [1, 0, 1, 0, 1])
+
+
+def _all_words(num_classes: int, max_length: int):
+    for length in range(max_length + 1):
+        yield from product(range(num_classes), repeat=length)
+
+
+def test_plate_automaton_is_already_minimal():
+    minimal = PLATE_AUTOMATON.minimize()
+    assert minimal.num_states == PLATE_AUTOMATON.num_states == 15
+    assert _same_language(minimal, PLATE_AUTOMATON)
+
+
+def test_minimize_merges_equivalent_states_and_drops_unreachable():
+    dfa = _redundant_parity()
+    minimal = dfa.minimize()
+    assert minimal.num_states == 2
+    assert minimal.state_names == ("s0+s2", "s1+s3")
+    for word in _all_words(2, 8):
+        assert minimal.accepts_classes(word) == dfa.accepts_classes(word)
+    assert minimal.minimize() == minimal
+
+
+def test_complete_adds_sink():
+    dfa = DFA(2, [1, MISSING, MISSING, MISSING], [0, 1])
+    assert not dfa.is_complete()
+    complete = dfa.complete()
+    assert complete.is_complete()
+    assert complete.num_states == 3
+    assert complete.state_names[-1] == SINK_NAME
+    assert complete.complete() is complete
+    for word in _all_words(2, 4):
+        assert complete.accepts_classes(word) == dfa.accepts_classes(word)
+    assert dfa.live_states() == {0, 1}
+    assert dfa.run_classes([0, 0]) == (MISSING, 1)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (0, [], [1]),
+        (2, [0], [1]),
+        (1, [3], [1]),
+        (1, [0], [1], 1),
+        (1, [0], [1], 0, ["a", "b"]),
+    ],
+)
+def test_constructor_rejects_inconsistent_tables(args):
+    with pytest.raises(ValueError):
+        DFA(*args)
+
+
+def test_union_product_accepts_either_language():
+    parity = _redundant_parity()
+    # En az bir 0 sınıfı içeren diziler
+    has_zero = DFA(2, [1, 0, 1, 1], [0, 1])
+    union, tuples = union_product([parity, has_zero])
+    assert len(tuples) == union.num_states
+    for word in _all_words(2, 8):
+        expected = parity.accepts_classes(word) or has_zero.accepts_classes(word)
+        assert union.accepts_classes(word) == expected
+
+
+def test_union_product_rejects_bad_input():
+    with pytest.raises(ValueError):
+        union_product([])
+    with pytest.raises(ValueError):
+        union_product([_redundant_parity(), DFA(3, [0, 0, 0], [1])])
@@ -0,0 +1,33 @@
+"""`run_dfa_batch` için testler."""
+
+from utils.normalize import normalize_input
+
+from dfa.compiled import STATE_IDS
+from dfa.runner import BatchResult, run_dfa, run_dfa_batch
+
+
+def test_batch_matches_run_dfa(corpus):
+    raw_inputs = list(corpus) + ["  34 ab 12  ", "06 a 1234\n", "34-AB-12"]
+    batch = run_dfa_batch(raw_inputs)
+
+    assert len(batch) == len(raw_inputs)
+    assert len(batch.fail_indices) == len(batch.final_states) == len(raw_inputs)
+    for index, raw_input in enumerate(raw_inputs):
+        expected = run_dfa(normalize_input(raw_input))
+        assert batch.accepted[index] == int(expected.accepted), raw_input
+        assert batch.final_states[index] == STATE_IDS[expected.final_state], raw_input
+        fail_index = batch.fail_indices[index]
+        assert (None if fail_index < 0 else fail_index) == expected.fail_index, raw_input
+
+
+def test_batch_accepts_any_iterable():
+    batch = run_dfa_batch(plate for plate in ["34 AB 12", "34 AB 1", "06 A 1234"])
+    assert list(batch.accepted) == [1, 0, 1]
+    assert batch.accepted_count() == 2
+
+
+def test_empty_batch():
+    batch = run_dfa_batch([])
+    assert isinstance(batch, BatchResult)
+    assert len(batch) == 0
+    assert batch.accepted_count() == 0
@@ -0,0 +1,98 @@
+"""`ResultCache` için testler."""
+
+import pytest
+
+from dfa.cache import MAX_KEY_LENGTH, ResultCache
+from dfa.runner import run_dfa, validate
+
+
+class FakeClock:
+    """Elle ilerletilen zaman kaynağı."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_results_match_uncached_runner(corpus):
+    cache = ResultCache(max_size=64)
+    for text in corpus[:300] * 2:
+        assert cache.validate(text) == validate(text)
+        assert cache.accepts(text) == validate(text)[0]
+        cached = cache.run_dfa(text, trace=True)
+        expected = run_dfa(text, trace=True)
+        assert (cached.accepted, cached.final_state, cached.fail_index) == (
+            expected.accepted, expected.final_state, expected.fail_index
+        )
+        assert list(cached.steps) == list(expected.steps)
+
+
+def test_hits_misses_and_hit_rate():
+    cache = ResultCache(max_size=8)
+    cache.accepts("34 AB 12")
+    cache.accepts("34 AB 12")
+    cache.validate("34 AB 12")
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.size) == (2, 1, 1)
+    assert info.hit_rate == pytest.approx(2 / 3)
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = ResultCache(max_size=2)
+    cache.accepts("34 AB 12")
+    cache.accepts("06 A 1234")
+    cache.accepts("34 AB 12")  # En son kullanılan olur
+    cache.accepts("35 ABC 99")  # "06 A 1234" çıkarılır
+
+    info = cache.cache_info()
+    assert (info.size, info.evictions) == (2, 1)
+    cache.accepts("34 AB 12")
+    assert cache.cache_info().hits == 2
+    cache.accepts("06 A 1234")
+    assert cache.cache_info().misses == 4
+
+
+def test_ttl_expires_entries():
+    clock = FakeClock()
+    cache = ResultCache(max_size=8, ttl=10.0, clock=clock)
+    cache.accepts("34 AB 12")
+    clock.now = 9.0
+    cache.accepts("34 AB 12")
+    assert cache.cache_info().hits == 1
+
+    clock.now = 10.5
+    cache.accepts("34 AB 12")
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (1, 2, 1)
+
+
+def test_verdict_only_entry_misses_for_trace():
+    cache = ResultCache()
+    cache.accepts("34 AB 12")
+    result = cache.run_dfa("34 AB 12", trace=True)
+    assert len(result.steps) == 8
+    assert cache.cache_info().misses == 2
+    cache.accepts("34 AB 12")  # İzli kayıt karar için de kullanılır
+    assert cache.cache_info().hits == 1
+
+
+def test_long_inputs_bypass_cache():
+    cache = ResultCache()
+    text = "3" * (MAX_KEY_LENGTH + 1)
+    assert cache.validate(text) == validate(text)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.size) == (0, 0, 0)
+
+
+def test_clear_and_argument_validation():
+    cache = ResultCache()
+    cache.accepts("34 AB 12")
+    cache.cache_clear()
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.size, info.evictions) == (0, 0, 0, 0)
+    with pytest.raises(ValueError):
+        ResultCache(max_size=0)
+    with pytest.raises(ValueError):
+        ResultCache(ttl=0)
@@ -0,0 +1,70 @@
+"""`cli.py` için uçtan uca testler."""
+
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from dfa.language import PLATE_LANGUAGE
+
+CLI_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "cli.py"
+)
+
+
+def _run_cli(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, CLI_PATH, "--quiet", *args],
+        capture_output=True,
+        check=False,
+    )
+
+
+@pytest.fixture
+def plate_file(tmp_path):
+    """Geçerli/geçersiz satırlar ve karışık satır sonları içeren dosya."""
+    rng = random.Random(6)
+    endings = ["\n", "\r\n", "\r", "x\n"]
+    parts = []
+    for _ in range(3000):
+        plate = PLATE_LANGUAGE.sample(rng) if rng.random() < 0.6 else PLATE_LANGUAGE.sample_invalid(rng)
+        parts.append(plate + rng.choice(endings))
+    parts.append("a\rb\r34 AB 12\r")
+    path = tmp_path / "plates.txt"
+    path.write_bytes("".join(parts).encode("utf-8"))
+    return str(path)
+
+
+@pytest.mark.parametrize("mode", ["--count", "--invalid-only"])
+@pytest.mark.parametrize("workers", ["1", "3"])
+def test_parallel_output_matches_serial(plate_file, mode, workers):
+    serial = _run_cli(mode, plate_file)
+    parallel = _run_cli(mode, "--workers", workers, "--chunk-size", "4096", plate_file)
+    assert serial.returncode == parallel.returncode == 0
+    assert parallel.stdout == serial.stdout
+
+
+def test_lone_carriage_return_is_not_a_line_break(tmp_path):
+    path = tmp_path / "cr.txt"
+    path.write_bytes(b"a\rb\r34 AB 12\r")
+    expected = b"total\t1\nvalid\t0\ninvalid\t1\n"
+    assert _run_cli("--count", str(path)).stdout == expected
+    assert _run_cli("--count", "--workers", "1", str(path)).stdout == expected
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("--count", "--workers", "2", "--chunk-size", "-5"),
+        ("--count", "--workers", "2", "--chunk-size", "0"),
+        ("--count", "--workers", "0"),
+        ("--workers", "2"),
+    ],
+)
+def test_invalid_parallel_options_are_usage_errors(plate_file, args):
+    result = _run_cli(*args, plate_file)
+    assert result.returncode == 2
+    assert b"usage:" in result.stderr
+    assert b"Traceback" not in result.stderr
@@ -0,0 +1,84 @@
+"""`dfa.codec` için testler."""
+
+import random
+from array import array
+
+import pytest
+
+from dfa.codec import (
+    CODE_SPACE,
+    CODE_TYPECODE,
+    INVALID_CODE,
+    decode,
+    decode_many,
+    encode,
+    encode_many,
+)
+from dfa.language import PLATE_LANGUAGE
+from dfa.runner import validate
+
+
+def _natural_key(plate: str):
+    province, letters, serial = plate.split(" ")
+    return int(province), letters, int(serial), len(serial)
+
+
+def test_code_space_matches_language_size():
+    assert CODE_SPACE == PLATE_LANGUAGE.size
+
+
+def test_round_trip_at_both_ends():
+    assert decode(0) == "01 A 00"
+    assert decode(CODE_SPACE - 1) == "81 ZZZ 9999"
+    assert encode(decode(0)) == 0
+    assert encode(decode(CODE_SPACE - 1)) == CODE_SPACE - 1
+
+
+def test_round_trip_on_random_plates():
+    rng = random.Random(25)
+    plates = [PLATE_LANGUAGE.sample(rng) for _ in range(5000)]
+    assert [decode(encode(plate)) for plate in plates] == plates
+
+
+def test_serial_order_is_value_then_width():
+    plates = ["34 A 12", "34 A 012", "34 A 0012", "34 A 13", "34 A 123"]
+    codes = [encode(plate) for plate in plates]
+    assert codes == sorted(codes)
+
+
+def test_letters_order_prefix_first():
+    plates = ["34 A 99", "34 AA 00", "34 AAZ 00", "34 AB 00", "34 AZZ 9999", "34 B 00"]
+    codes = [encode(plate) for plate in plates]
+    assert codes == sorted(codes)
+
+
+def test_code_order_matches_natural_order():
+    rng = random.Random(7)
+    plates = list({PLATE_LANGUAGE.sample(rng) for _ in range(5000)})
+    by_code = [decode(code) for code in sorted(encode(plate) for plate in plates)]
+    assert by_code == sorted(plates, key=_natural_key)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "34 AB 1", "00 A 12", "82 A 12", "34 QB 12", "34 ab 12", "34 AB 12 ", "34 AB 12\x00"],
+)
+def test_encode_rejects_invalid(text):
+    assert not validate(text)[0]
+    with pytest.raises(ValueError):
+        encode(text)
+
+
+def test_encode_many_marks_invalid_and_decode_many_raises():
+    codes = encode_many(["34 AB 12", "34 AB 1", "06 A 1234"])
+    assert isinstance(codes, array) and codes.typecode == CODE_TYPECODE
+    assert codes[1] == INVALID_CODE
+    assert decode_many([codes[0], codes[2]]) == ["34 AB 12", "06 A 1234"]
+    with pytest.raises(ValueError):
+        decode_many(codes)
+
+
+@pytest.mark.parametrize("code", [-1, CODE_SPACE, INVALID_CODE])
+def test_decode_rejects_out_of_range(code):
+    with pytest.raises(ValueError):
+        decode(code)
@@ -0,0 +1,62 @@
+"""`dfa.codegen` için testler."""
+
+import random
+
+import pytest
+
+from dfa import codegen
+from dfa.automaton import DFA
+from dfa.compiled import (
+    CLASS_DIGIT_0,
+    CLASS_DIGIT_9,
+    PLATE_AUTOMATON,
+    PLATE_DFA,
+    STATE_IDS,
+    CompiledPlateDFA,
+)
+from dfa.language import PLATE_LANGUAGE
+from dfa.tr_plate_dfa import State
+
+
+def _cyclic_compiled() -> CompiledPlateDFA:
+    """Q11'den sonra sınırsız rakam kabul eden (döngülü) otomat."""
+    transitions = bytearray(PLATE_AUTOMATON.transitions)
+    q11 = STATE_IDS[State.Q11]
+    for byte_class in range(CLASS_DIGIT_0, CLASS_DIGIT_9 + 1):
+        transitions[q11 * PLATE_AUTOMATON.num_classes + byte_class] = q11
+    automaton = DFA(
+        PLATE_AUTOMATON.num_classes,
+        transitions,
+        PLATE_AUTOMATON.accepting,
+        PLATE_AUTOMATON.start,
+        PLATE_AUTOMATON.state_names,
+    )
+    return CompiledPlateDFA(automaton)
+
+
+def test_generated_runner_matches_table_engine():
+    rng = random.Random(15)
+    inputs = [PLATE_LANGUAGE.sample(rng) for _ in range(2000)]
+    inputs += [PLATE_LANGUAGE.sample_invalid(rng) for _ in range(2000)]
+    inputs += ["", " ", "3", "34", "34 ", "34 A", "34 ABC 1234 ", "34 ab 12", "34 AB 12\x00", "İ"]
+    for text in inputs:
+        assert codegen.run_generated(text) == PLATE_DFA.run(text), text
+
+
+def test_plate_automaton_is_acyclic():
+    assert codegen.find_cycle() is None
+
+
+def test_cyclic_automaton_is_rejected(monkeypatch):
+    cyclic = _cyclic_compiled()
+    monkeypatch.setattr(codegen, "PLATE_DFA", cyclic)
+    q11 = STATE_IDS[State.Q11]
+
+    assert codegen.find_cycle() == [q11, q11]
+    with pytest.raises(ValueError):
+        codegen.generate_source()
+
+    run = codegen.load_generated_run()
+    assert run == cyclic.run
+    final_id, fail_index = run("34 AB 123456789")
+    assert final_id == q11 and fail_index == -1
@@ -0,0 +1,59 @@
+"""Doğrulama motorlarının (tablo, yorumlanan, üretilmiş, düzenli ifade) eşdeğerliği."""
+
+import pytest
+
+from dfa.compiled import PLATE_DFA, STATES
+from dfa.runner import (
+    ENGINE_INTERPRETED,
+    ENGINES,
+    accepts,
+    run_dfa,
+    validate,
+)
+from dfa.alphabet import classify_char
+from dfa.tr_plate_dfa import State, next_state_with_char
+
+
+def _reference(text):
+    """Özgün kurallarla (Enum + sözlük) adım adım çalıştırma."""
+    state = State.Q0
+    for index, ch in enumerate(text):
+        state = next_state_with_char(state, ch, classify_char(ch))
+        if state == State.DEAD:
+            return False, State.DEAD, index
+    return state in (State.Q9, State.Q10, State.Q11), state, None
+
+
+def test_table_engine_matches_reference(corpus):
+    for text in corpus:
+        accepted, state, fail_index = _reference(text)
+        final_id, table_fail = PLATE_DFA.run(text)
+        assert STATES[final_id] == state, text
+        assert (None if table_fail < 0 else table_fail) == fail_index, text
+        assert PLATE_DFA.is_accepting_id(final_id) == accepted, text
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_agree(corpus, engine):
+    for text in corpus:
+        assert validate(text, engine) == validate(text, ENGINE_INTERPRETED), (engine, text)
+        assert accepts(text, engine) == validate(text, ENGINE_INTERPRETED)[0], (engine, text)
+
+
+def test_run_dfa_trace_matches_verdict(corpus):
+    for text in corpus[:500]:
+        plain = run_dfa(text)
+        traced = run_dfa(text, trace=True)
+        assert (plain.accepted, plain.final_state, plain.fail_index, plain.fail_char) == (
+            traced.accepted, traced.final_state, traced.fail_index, traced.fail_char
+        ), text
+        assert len(plain.steps) == 0
+        consumed = len(text) if traced.fail_index is None else traced.fail_index + 1
+        assert len(traced.steps) == consumed
+        if traced.steps:
+            assert traced.steps[-1].to_state == traced.final_state
+
+
+def test_unknown_engine_raises():
+    with pytest.raises(ValueError):
+        validate("34 AB 12", "unknown")
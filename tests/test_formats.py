@@ -0,0 +1,87 @@
+"""`dfa.formats` ve `run_formats` için testler."""
+
+import random
+import re
+
+import pytest
+
+from dfa.formats import (
+    DIPLOMATIC_DIGIT_COUNTS,
+    DIPLOMATIC_SERIES,
+    FORMAT_DIPLOMATIC,
+    FORMAT_STANDARD,
+    FORMAT_STRICT,
+    MULTI_FORMAT_DFA,
+    PLATE_LETTERS,
+    STRICT_PAIRINGS,
+)
+from dfa.runner import accepts, run_dfa, run_formats
+
+# Formatların bağımsız düzenli ifade tanımları
+PROVINCE = r"(?:0[1-9]|[1-7][0-9]|8[01])"
+LETTER = "[" + re.escape(PLATE_LETTERS) + "]"
+STRICT_RE = re.compile("|".join(
+    rf"{PROVINCE} {LETTER}{{{letters}}} [0-9]{{{digits}}}"
+    for letters, digit_counts in STRICT_PAIRINGS.items()
+    for digits in digit_counts
+))
+DIPLOMATIC_RE = re.compile(
+    rf"{PROVINCE} (?:{'|'.join(DIPLOMATIC_SERIES)}) "
+    rf"[0-9]{{{min(DIPLOMATIC_DIGIT_COUNTS)},{max(DIPLOMATIC_DIGIT_COUNTS)}}}"
+)
+
+
+def _expected_formats(text: str):
+    expected = []
+    if accepts(text):
+        expected.append(FORMAT_STANDARD)
+    if STRICT_RE.fullmatch(text):
+        expected.append(FORMAT_STRICT)
+    if DIPLOMATIC_RE.fullmatch(text):
+        expected.append(FORMAT_DIPLOMATIC)
+    return tuple(expected)
+
+
+@pytest.fixture(scope="module")
+def format_corpus(corpus):
+    """Genel test kümesine diplomatik ve katı sınır örnekleri ekler."""
+    rng = random.Random(19)
+    extra = []
+    for _ in range(300):
+        province = f"{rng.randint(0, 82):02d}"
+        series = rng.choice(DIPLOMATIC_SERIES + ("CE", "C", "CCC"))
+        serial = "".join(rng.choice("0123456789") for _ in range(rng.randint(1, 5)))
+        extra.append(f"{province} {series} {serial}")
+    return list(corpus) + extra
+
+
+def test_matched_formats_agree_with_references(format_corpus):
+    for text in format_corpus:
+        assert MULTI_FORMAT_DFA.match(text) == _expected_formats(text), text
+
+
+@pytest.mark.parametrize(
+    "text, names",
+    [
+        ("34 A 1234", ["standart", "katı"]),
+        ("34 A 12", ["standart"]),
+        ("06 CD 123", ["standart", "katı", "diplomatik"]),
+        ("06 CC 12", ["standart"]),
+        ("34 ABC 1234", ["standart"]),
+        ("34 ABCD 12", []),
+    ],
+)
+def test_format_names(text, names):
+    assert MULTI_FORMAT_DFA.format_names(MULTI_FORMAT_DFA.match(text)) == names
+
+
+def test_run_formats_agrees_with_run_dfa(format_corpus):
+    for text in format_corpus:
+        result = run_formats(text)
+        expected = _expected_formats(text)
+        assert result.accepted == bool(expected)
+        assert result.formats == (expected if result.fail_index is None else ())
+        if accepts(text):
+            assert result.final_state == run_dfa(text).final_state
+        if result.fail_index is not None:
+            assert result.fail_char == text[result.fail_index]
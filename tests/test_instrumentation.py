@@ -0,0 +1,109 @@
+"""Çalıştırıcı enstrümantasyonu (`RunnerStats`) için testler."""
+
+from collections import Counter
+
+import pytest
+
+from dfa.compiled import BYTE_CLASS_TO_CHAR_CLASS, DEAD_ID, PLATE_DFA, START_ID, STATES
+from dfa.instrumentation import END_OF_INPUT, PHASES, RunnerStats
+from dfa.runner import (
+    ENGINES,
+    accepts,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_instrumentation,
+    instrumented,
+    run_dfa,
+    run_dfa_batch,
+    validate,
+)
+from utils.normalize import normalize_input
+
+
+def _reference_counts(texts):
+    """Sayaçları derlenmiş otomat üzerinde adım adım yeniden hesaplar."""
+    visits, edges, rejections = Counter(), Counter(), Counter()
+    accepted = 0
+    for text in texts:
+        state_id = START_ID
+        visits[STATES[state_id].value] += 1
+        for byte_class in PLATE_DFA.classify(text):
+            next_id = PLATE_DFA.step(state_id, byte_class)
+            visits[STATES[next_id].value] += 1
+            edges[f"{STATES[state_id].value}->{STATES[next_id].value}"] += 1
+            if next_id == DEAD_ID:
+                char_class = BYTE_CLASS_TO_CHAR_CLASS[byte_class].value
+                rejections[f"{STATES[state_id].value}/{char_class}"] += 1
+                break
+            state_id = next_id
+        else:
+            if PLATE_DFA.is_accepting_id(state_id):
+                accepted += 1
+            else:
+                rejections[f"{STATES[state_id].value}/{END_OF_INPUT}"] += 1
+    return accepted, dict(visits), dict(edges), dict(rejections)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_verdicts_unchanged_when_instrumented(corpus, engine):
+    expected = [validate(text, engine) for text in corpus]
+    with instrumented() as stats:
+        assert [validate(text, engine) for text in corpus] == expected
+        assert [accepts(text, engine) for text in corpus] == [ok for ok, _ in expected]
+    assert stats.runs == 2 * len(corpus)
+
+
+def test_counters_match_reference(corpus):
+    with instrumented() as stats:
+        for text in corpus:
+            run_dfa(text)
+
+    accepted, visits, edges, rejections = _reference_counts(corpus)
+    counters = stats.as_dict()
+    assert counters["runs"] == len(corpus)
+    assert counters["accepted"] == accepted
+    assert counters["visits"] == visits
+    assert counters["edges"] == edges
+    assert counters["rejections"] == rejections
+    assert set(counters["seconds"]) == set(PHASES)
+
+
+def test_batch_counts_normalized_inputs(corpus):
+    with instrumented() as stats:
+        result = run_dfa_batch(corpus)
+    assert stats.runs == len(corpus)
+    assert stats.accepted == result.accepted_count()
+    assert stats.as_dict()["visits"] == _reference_counts(map(normalize_input, corpus))[1]
+
+
+def test_instrumented_restores_previous_state():
+    assert get_instrumentation() is None
+    outer = enable_instrumentation()
+    try:
+        with instrumented() as inner:
+            assert get_instrumentation() is inner
+            accepts("34 A 12")
+        assert get_instrumentation() is outer
+        assert (outer.runs, inner.runs) == (0, 1)
+    finally:
+        assert disable_instrumentation() is outer
+    assert get_instrumentation() is None
+
+
+def test_to_prometheus():
+    stats = RunnerStats()
+    with instrumented(stats):
+        validate("34 A 12")
+        validate("34 ABCD 12")
+        validate("34 A")
+    text = stats.to_prometheus(prefix="test")
+    assert "test_runs_total 3" in text
+    assert "test_accepted_total 1" in text
+    assert 'test_state_visits_total{state="%s"} 3' % STATES[START_ID].value in text
+    assert 'char_class="LETTER"} 1' in text
+    assert f'char_class="{END_OF_INPUT}"}} 1' in text
+    for phase in PHASES:
+        assert f'test_phase_seconds_total{{phase="{phase}"}}' in text
+
+    stats.reset()
+    assert stats.as_dict()["runs"] == 0
@@ -0,0 +1,63 @@
+"""`dfa.language` için testler."""
+
+import random
+
+import pytest
+
+from dfa.codec import CODE_SPACE
+from dfa.language import PLATE_LANGUAGE
+from dfa.runner import accepts
+
+
+def test_size_matches_length_counts():
+    counts = PLATE_LANGUAGE.count_by_length()
+    assert PLATE_LANGUAGE.size == sum(counts.values()) == CODE_SPACE
+    assert min(counts) == len("01 A 00")
+    assert max(counts) == len("01 AAA 0000")
+
+
+def test_ends_of_the_order():
+    assert PLATE_LANGUAGE.unrank(0) == "01 A 00"
+    last = PLATE_LANGUAGE.unrank(PLATE_LANGUAGE.size - 1)
+    assert last == "81 ZZZ 9999"
+    assert PLATE_LANGUAGE.rank(last) == PLATE_LANGUAGE.size - 1
+
+
+def test_rank_unrank_bijection_on_samples():
+    rng = random.Random(17)
+    for _ in range(2000):
+        index = rng.randrange(PLATE_LANGUAGE.size)
+        plate = PLATE_LANGUAGE.unrank(index)
+        assert accepts(plate)
+        assert PLATE_LANGUAGE.rank(plate) == index
+
+
+def test_iter_lexicographic_is_sorted_and_consistent():
+    start = PLATE_LANGUAGE.rank("34 AB 9998")
+    plates = list(PLATE_LANGUAGE.iter_lexicographic(start, start + 50))
+    assert plates == sorted(plates)
+    assert plates[0] == "34 AB 9998"
+    assert plates == [PLATE_LANGUAGE.unrank(start + offset) for offset in range(50)]
+
+    size = PLATE_LANGUAGE.size
+    tail = list(PLATE_LANGUAGE.iter_lexicographic(size - 2, size + 5))
+    assert tail == [PLATE_LANGUAGE.unrank(size - 2), "81 ZZZ 9999"]
+
+
+def test_samples_are_valid_and_invalid_samples_are_not():
+    rng = random.Random(3)
+    for _ in range(500):
+        assert accepts(PLATE_LANGUAGE.sample(rng))
+        assert not accepts(PLATE_LANGUAGE.sample_invalid(rng))
+
+
+@pytest.mark.parametrize("plate", ["", "34", "34 A", "82 A 12", "34 ABCD 12", "34 A 12345"])
+def test_rank_rejects_invalid_plates(plate):
+    with pytest.raises(ValueError):
+        PLATE_LANGUAGE.rank(plate)
+
+
+@pytest.mark.parametrize("index", [-1, PLATE_LANGUAGE.size])
+def test_unrank_rejects_out_of_range(index):
+    with pytest.raises(IndexError):
+        PLATE_LANGUAGE.unrank(index)
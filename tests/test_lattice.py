@@ -0,0 +1,101 @@
+"""`dfa.lattice` için testler (kaba kuvvet ve eşitlik sırası)."""
+
+import math
+import random
+from itertools import product
+
+import pytest
+
+from dfa.lattice import Decoding, decode_lattice
+from dfa.runner import accepts
+
+
+def _column(*chars, probability=None):
+    """Karakterlere eşit (veya verilen) olasılık dağıtan bir kafes konumu."""
+    share = probability if probability is not None else 1 / len(chars)
+    return {ch: share for ch in chars}
+
+
+def _plate_lattice(letters):
+    """"34 <harf> 12" biçiminde, harf konumu verilen dağılım olan kafes."""
+    return [
+        _column("3"), _column("4"), _column(" "), letters,
+        _column(" "), _column("1"), _column("2"),
+    ]
+
+
+def _brute_force(lattice, n):
+    """Tüm kombinasyonları sayarak en olası N geçerli plakayı döndürür."""
+    results = []
+    for combination in product(*(sorted(column.items()) for column in lattice)):
+        plate = "".join(ch for ch, _ in combination)
+        if accepts(plate):
+            log_prob = 0.0
+            for _, probability in combination:
+                log_prob += math.log(probability)
+            results.append((-log_prob, plate))
+    results.sort()
+    return [Decoding(plate, -score) for score, plate in results[:n]]
+
+
+def _random_lattice(rng):
+    """Eşit puanlı plakaların sık görüldüğü küçük rastgele bir kafes.
+
+    Eşitlikler yalnızca düzgün (uniform) konumlardan gelir; böylece eşit
+    plakaların log olasılıkları aynı toplananlardan oluşur ve bit düzeyinde
+    eşittir. Diğer konumların olasılıkları rastgeledir: (1/6)·0.4 ile
+    (1/3)·0.2 gibi farklı çarpanlardan gelen eşitlikler kayan noktada
+    ara toplamlarda ayrışabilir.
+    """
+    pools = ["0123", "0189", " 1", "ABC", "AB ", " 7", "0129", "1234", "12 "]
+    lattice = []
+    for pool in pools[:rng.randint(7, 9)]:
+        chars = rng.sample(pool, rng.randint(1, len(pool)))
+        if rng.random() < 0.5:
+            lattice.append(_column(*chars))
+            continue
+        weights = [rng.random() + 0.01 for _ in chars]
+        total = sum(weights)
+        lattice.append({ch: weight / total for ch, weight in zip(chars, weights)})
+    return lattice
+
+
+def test_matches_brute_force_on_random_lattices():
+    rng = random.Random(24)
+    for _ in range(150):
+        lattice = _random_lattice(rng)
+        for n in (1, 3, 10):
+            assert decode_lattice(lattice, n=n) == _brute_force(lattice, n)
+
+
+def test_tie_at_n_best_cutoff_keeps_smallest_plates():
+    lattice = _plate_lattice(_column("A", "B"))
+    assert [d.plate for d in decode_lattice(lattice, n=1)] == ["34 A 12"]
+
+    lattice = _plate_lattice(_column("D", "C", "B", "A"))
+    assert [d.plate for d in decode_lattice(lattice, n=2)] == ["34 A 12", "34 B 12"]
+
+
+def test_tie_at_beam_cutoff_keeps_smallest_plates():
+    lattice = _plate_lattice(_column("A", "B"))
+    assert [d.plate for d in decode_lattice(lattice, n=1, beam=1)] == ["34 A 12"]
+
+    lattice = _plate_lattice(_column("D", "C", "B", "A"))
+    assert [d.plate for d in decode_lattice(lattice, n=4, beam=2)] == ["34 A 12", "34 B 12"]
+
+
+def test_ocr_confusions_resolved_by_automaton():
+    lattice = [
+        _column("O", "0"), {"6": 0.6, "G": 0.4}, _column(" "),
+        {"B": 0.7, "8": 0.3}, _column(" "), {"I": 0.9, "1": 0.1}, _column("2"),
+    ]
+    [best] = decode_lattice(lattice, n=1)
+    assert best.plate == "06 B 12"
+    assert best.probability == pytest.approx(0.5 * 0.6 * 0.7 * 0.1)
+
+
+def test_lowercase_merged_and_invalid_dropped():
+    lattice = _plate_lattice({"a": 0.3, "A": 0.3, "b": 0.4, "?": 0.0})
+    assert [d.plate for d in decode_lattice(lattice, n=5)] == ["34 A 12", "34 B 12"]
+    assert decode_lattice(lattice, n=0) == []
+    assert decode_lattice([_column("9"), _column("9")]) == []
@@ -0,0 +1,65 @@
+"""NumPy vektörel doğrulayıcısı için testler (NumPy kurulu değilse atlanır)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dfa.compiled import STATES  # noqa: E402
+from dfa.numpy_backend import (  # noqa: E402
+    DEFAULT_PACK_WIDTH,
+    pack_plates,
+    validate_array,
+)
+from dfa.runner import run_dfa  # noqa: E402
+
+
+def _assert_matches_run_dfa(plates, result):
+    for index, plate in enumerate(plates):
+        expected = run_dfa(plate)
+        fail_index = int(result.fail_indices[index])
+        assert bool(result.accepted[index]) == expected.accepted, plate
+        assert STATES[result.final_states[index]] == expected.final_state, plate
+        assert (None if fail_index < 0 else fail_index) == expected.fail_index, plate
+
+
+@pytest.mark.parametrize("width", [DEFAULT_PACK_WIDTH, 20])
+def test_packed_rows_match_run_dfa(corpus, width):
+    codes, lengths = pack_plates(corpus, width)
+    assert codes.shape == (len(corpus), width)
+    _assert_matches_run_dfa(corpus, validate_array(codes, lengths))
+
+
+@pytest.mark.parametrize(
+    "plate, fail_index",
+    [("34 AB 12\x00X", 8), ("34 AB 12\x00", 8), ("3\x004 AB 12", 1), ("\x00", 0)],
+)
+def test_nul_bytes_are_invalid_characters(plate, fail_index):
+    result = validate_array(*pack_plates([plate]))
+    assert not result.accepted[0]
+    assert result.fail_indices[0] == fail_index
+
+
+def test_overlong_rows_keep_their_verdict():
+    plates = ["34 AB 12" * 5, "34 ABC 12345"]
+    _assert_matches_run_dfa(plates, validate_array(*pack_plates(plates)))
+
+
+def test_bytes_array_without_lengths_pads_only_trailing_nul():
+    rows = np.array([b"34 AB 12", b"34 AB 12\x00X", b"06 A 1234"], dtype="S12")
+    result = validate_array(rows)
+    assert result.accepted.tolist() == [True, False, True]
+    assert result.fail_indices.tolist() == [-1, 8, -1]
+
+
+def test_narrow_widths_are_rejected():
+    with pytest.raises(ValueError):
+        pack_plates(["34 AB 12"], DEFAULT_PACK_WIDTH - 1)
+    with pytest.raises(ValueError):
+        validate_array(np.zeros((1, 8), dtype=np.uint8), [9])
+    with pytest.raises(ValueError):
+        validate_array(np.zeros((2, 12), dtype=np.uint8), [1])
+
+
+def test_unsupported_array_shape():
+    with pytest.raises(ValueError):
+        validate_array(np.zeros((2, 3, 4), dtype=np.uint8))
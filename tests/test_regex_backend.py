@@ -0,0 +1,46 @@
+"""`dfa.regex_backend` için testler."""
+
+import pytest
+
+from dfa import regex_backend
+from dfa.regex_backend import (
+    RegexMismatchError,
+    accepts_re,
+    check_equivalence,
+    derive_pattern,
+    iter_plates_re,
+    plate_regex,
+)
+from dfa.runner import accepts
+from dfa.scanner import iter_plates
+
+
+def test_derived_pattern_is_equivalent():
+    assert check_equivalence(derive_pattern()) == []
+    assert plate_regex().pattern == derive_pattern()
+
+
+def test_check_equivalence_reports_wrong_pattern():
+    # İl sınırı ve seri genişliği kaydırılmış ifade
+    mismatches = check_equivalence(r"[0-8][0-9] [A-Z]{1,3} [0-9]{2,5}")
+    assert mismatches
+
+
+def test_accepts_re_matches_dfa(corpus):
+    for text in corpus:
+        assert accepts_re(text) == accepts(text), text
+
+
+def test_iter_plates_re_matches_scanner(corpus):
+    text = " ".join(corpus[:400]) + " x34 AB 12 34 AB 12y, 06 A 1234."
+    assert list(iter_plates_re(text)) == list(iter_plates(text))
+
+
+def test_plate_regex_refuses_wrong_pattern(monkeypatch):
+    monkeypatch.setattr(regex_backend, "derive_pattern", lambda: r"[0-9]{2} [A-Z]+ [0-9]+")
+    plate_regex.cache_clear()
+    try:
+        with pytest.raises(RegexMismatchError):
+            plate_regex()
+    finally:
+        plate_regex.cache_clear()
@@ -0,0 +1,31 @@
+"""`RejectionAggregator` için testler."""
+
+from dfa.rejections import MAX_KEY_LENGTH, TRUNCATION_MARK, RejectionAggregator
+from dfa.runner import validate
+
+
+def _add(aggregator: RejectionAggregator, text: str) -> None:
+    accepted, fail_index = validate(text)
+    aggregator.add(text, accepted, fail_index)
+
+
+def test_long_inputs_are_truncated_before_summaries():
+    aggregator = RejectionAggregator(capacity=4)
+    for index in range(10):
+        _add(aggregator, str(index) * 1_000_000)
+
+    keys = [key for key, _, _ in aggregator.inputs.top()]
+    assert len(keys) == 4
+    assert all(len(key) == MAX_KEY_LENGTH for key in keys)
+    assert all(key.endswith(TRUNCATION_MARK) for key in keys)
+    assert aggregator.rejected == 10
+    assert aggregator.estimate("9" * 1_000_000) >= 1
+
+
+def test_short_inputs_are_kept_verbatim():
+    aggregator = RejectionAggregator()
+    for _ in range(3):
+        _add(aggregator, "34 AB 1X")
+
+    assert aggregator.inputs.top(1) == [("34 AB 1X", 3, 0)]
+    assert aggregator.estimate("34 AB 1X") == 3
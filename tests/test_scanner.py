@@ -0,0 +1,70 @@
+"""`dfa.scanner` için testler."""
+
+import pytest
+
+from dfa import scanner
+from dfa.runner import ENGINE_RE, ENGINE_TABLE
+from dfa.scanner import find_plates, iter_plates, scan_file
+
+
+def _scan_text_via_file(tmp_path, data: bytes):
+    """`scan_file` sonuçlarını karakter ofsetlerine çevirir."""
+    path = tmp_path / "input.txt"
+    path.write_bytes(data)
+    matches = []
+    for start, end, plate in scan_file(str(path)):
+        char_start = len(data[:start].decode("utf-8", "replace"))
+        matches.append((char_start, char_start + len(plate), plate))
+    return matches
+
+
+@pytest.mark.parametrize("engine", [ENGINE_TABLE, ENGINE_RE])
+def test_finds_plates_in_free_text(engine):
+    text = "Araç 34 ABC 1234 ile 06 A 12 çarpıştı; 99 X 1 değil."
+    assert find_plates(text, engine) == [
+        (5, 16, "34 ABC 1234"),
+        (21, 28, "06 A 12"),
+    ]
+
+
+@pytest.mark.parametrize("engine", [ENGINE_TABLE, ENGINE_RE])
+def test_word_boundaries(engine):
+    assert find_plates("X34 AB 12", engine) == []
+    assert find_plates("34 AB 12X", engine) == []
+    assert find_plates("é34 AB 12", engine) == []
+    assert find_plates("34 AB 12ş", engine) == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "“34 AB 12”",
+        "\xa034 AB 12　",
+        "34 AB 12—06 A 1234",
+        "é34 AB 12 ve 06 A 12ş",
+        "🚗34 AB 12🚗",
+        "Ü 34 AB 12 ü",
+    ],
+)
+def test_scan_file_matches_iter_plates_at_non_ascii_boundaries(tmp_path, text):
+    assert _scan_text_via_file(tmp_path, text.encode("utf-8")) == list(iter_plates(text))
+
+
+def test_scan_file_treats_invalid_utf8_as_boundary(tmp_path):
+    data = b"\xff34 AB 12\xc3 06 A 12\xe2\x80"
+    expected = list(iter_plates(data.decode("utf-8", "replace")))
+    assert [plate for _, _, plate in expected] == ["34 AB 12", "06 A 12"]
+    assert _scan_text_via_file(tmp_path, data) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+def test_scan_file_chunk_edges_do_not_split_characters(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(scanner, "_FLAG_CHUNK_SIZE", chunk_size)
+    text = "ş34 AB 12 “06 A 1234” 🚗 35 ABC 99é"
+    assert _scan_text_via_file(tmp_path, text.encode("utf-8")) == list(iter_plates(text))
+
+
+def test_scan_file_empty(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert list(scan_file(str(path))) == []
@@ -0,0 +1,146 @@
+"""`server.app` için testler (port 0 üzerinde gerçek asyncio sunucusu)."""
+
+import asyncio
+import json
+
+from dfa.runner import validate
+from server.app import OTHER_PATH_LABEL, PlateServer, ServerMetrics
+from utils.normalize import normalize_input
+
+
+def _request(method: str, path: str, body: bytes = b"", headers: str = "") -> bytes:
+    """Ham HTTP/1.1 isteği oluşturur."""
+    return (
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\n{headers}"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode("latin-1") + body
+
+
+def _json_request(path: str, payload) -> bytes:
+    return _request("POST", path, json.dumps(payload).encode("utf-8"))
+
+
+def _parse_responses(data: bytes):
+    """Ardışık yanıtları (durum kodu, başlıklar, gövde) üçlülerine ayırır."""
+    responses = []
+    while data:
+        head, _, rest = data.partition(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ")[1])
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers["content-length"])
+        responses.append((status, headers, rest[:length]))
+        data = rest[length:]
+    return responses
+
+
+def _exchange(*requests: bytes, close: bool = True):
+    """İstekleri tek bağlantıda ardışık gönderir ve yanıtları döndürür.
+
+    `close` ise son istekten sonra yazma tarafı kapatılır; sunucu bağlantıyı
+    kapatana kadar okunur.
+    """
+    async def run():
+        server = PlateServer(port=0)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            writer.write(b"".join(requests))
+            await writer.drain()
+            if close:
+                writer.write_eof()
+            data = await asyncio.wait_for(reader.read(), timeout=10)
+            writer.close()
+            return _parse_responses(data), server
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+
+def test_single_validate():
+    responses, _ = _exchange(
+        _json_request("/validate", {"plate": "34 ABC 1234"}),
+        _json_request("/validate", {"plate": "34 ABCD 12"}),
+    )
+    assert [status for status, _, _ in responses] == [200, 200]
+    assert responses[0][1]["content-type"] == "application/json"
+    assert [json.loads(body) for _, _, body in responses] == [
+        {"accepted": True, "fail_index": None},
+        {"accepted": False, "fail_index": 6},
+    ]
+
+
+def test_bulk_validate_matches_runner(corpus):
+    plates = corpus[:500]
+    [(status, _, body)], _ = _exchange(_json_request("/validate", {"plates": plates}))
+    assert status == 200
+    results = json.loads(body)["results"]
+    assert [(item["accepted"], item["fail_index"]) for item in results] == [
+        validate(normalize_input(plate)) for plate in plates
+    ]
+
+
+def test_pipelined_requests_answered_in_order():
+    plates = ["34 A 12", "x", "06 ABC 1234", "82 A 12", "34 AB 123"]
+    responses, server = _exchange(
+        *(_json_request("/validate", {"plate": plate}) for plate in plates)
+    )
+    assert [json.loads(body)["accepted"] for _, _, body in responses] == [
+        validate(normalize_input(plate))[0] for plate in plates
+    ]
+    assert server.metrics.plates == len(plates)
+    assert server.metrics.batches < len(plates)
+
+
+def test_health():
+    [(status, _, body)], _ = _exchange(_request("GET", "/health"))
+    assert status == 200
+    assert json.loads(body) == {"status": "ok"}
+
+
+def test_errors():
+    responses, server = _exchange(
+        _request("GET", "/nope"),
+        _request("GET", "/validate"),
+        _request("POST", "/validate", b"{not json"),
+        _json_request("/validate", {"plates": [1, 2]}),
+    )
+    assert [status for status, _, _ in responses] == [404, 405, 400, 400]
+    assert server.metrics.errors == 4
+
+
+def test_chunked_body_rejected_and_connection_closed():
+    chunked = (
+        b"POST /validate HTTP/1.1\r\nHost: test\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"5\r\nhello\r\n0\r\n\r\n"
+    )
+    responses, _ = _exchange(chunked, _request("GET", "/health"), close=False)
+    assert len(responses) == 1
+    status, headers, _ = responses[0]
+    assert status == 501
+    assert headers["connection"] == "close"
+
+
+def test_metrics_labels_unknown_paths_as_other():
+    responses, _ = _exchange(
+        _request("GET", "/a"),
+        _request("GET", "/b?x=1"),
+        _request("GET", "/health"),
+        _request("GET", "/metrics"),
+    )
+    status, headers, body = responses[-1]
+    assert status == 200
+    assert headers["content-type"].startswith("text/plain")
+    text = body.decode("utf-8")
+    assert f'plate_http_requests_total{{path="{OTHER_PATH_LABEL}"}} 2' in text
+    assert 'plate_http_requests_total{path="/health"} 1' in text
+    assert "/a" not in text and "/b" not in text
+
+
+def test_metrics_escapes_label_values():
+    metrics = ServerMetrics(requests={'a"b\\c\nd': 1})
+    assert 'plate_http_requests_total{path="a\\"b\\\\c\\nd"} 1' in metrics.render()
@@ -0,0 +1,88 @@
+"""`dfa.suggest` için testler (kaba kuvvet karşılaştırması)."""
+
+import random
+
+import pytest
+
+from dfa.language import ALPHABET, PLATE_LANGUAGE
+from dfa.runner import accepts
+from dfa.suggest import Suggestion, suggest
+
+
+def _edit_distance(left: str, right: str) -> int:
+    """Levenshtein uzaklığı."""
+    previous = list(range(len(right) + 1))
+    for i, left_ch in enumerate(left, 1):
+        current = [i]
+        for j, right_ch in enumerate(right, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (left_ch != right_ch),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def _neighbours(text: str):
+    """Tek düzenlemeyle (plaka alfabesi üzerinde) ulaşılan diziler."""
+    for position in range(len(text) + 1):
+        for ch in ALPHABET:
+            yield text[:position] + ch + text[position:]
+        if position < len(text):
+            yield text[:position] + text[position + 1:]
+            for ch in ALPHABET:
+                yield text[:position] + ch + text[position + 1:]
+
+
+def _brute_force(text: str, max_edits: int):
+    """En fazla `max_edits` düzenlemeli geçerli plakaları (maliyet, plaka) sırasıyla döndürür."""
+    frontier = {text}
+    seen = {text}
+    for _ in range(max_edits):
+        frontier = {
+            neighbour for current in frontier for neighbour in _neighbours(current)
+        } - seen
+        seen |= frontier
+    return sorted(
+        (Suggestion(plate, _edit_distance(text, plate)) for plate in seen if accepts(plate)),
+        key=lambda suggestion: (suggestion.cost, suggestion.plate),
+    )
+
+
+def _inputs():
+    rng = random.Random(23)
+    texts = ["34 A 1", "34 A12", "3 A 12", "34 AB", "341 A 12", "82 A 12", "34 ABCD 12", "34A1"]
+    texts += [PLATE_LANGUAGE.sample_invalid(rng) for _ in range(4)]
+    return texts
+
+
+@pytest.mark.parametrize("text", _inputs())
+def test_single_edit_matches_brute_force(text):
+    expected = _brute_force(text, 1)
+    assert suggest(text, max_edits=1, n=len(expected) + 10) == expected
+    assert suggest(text, max_edits=1, n=3) == expected[:3]
+
+
+@pytest.mark.parametrize("text", ["34 A1", "3 AB 12", "34 ABCDE 12", "0 A 1234"])
+def test_two_edits_match_brute_force(text):
+    expected = _brute_force(text, 2)
+    assert suggest(text, max_edits=2, n=len(expected) + 10) == expected
+
+
+def test_equal_cost_ties_are_ordered_by_plate():
+    # "34 A 1": tüm tek düzenlemeli öneriler maliyet 1'dir
+    suggestions = suggest("34 A 1", max_edits=1, n=50)
+    assert {suggestion.cost for suggestion in suggestions} == {1}
+    assert [s.plate for s in suggestions] == sorted(s.plate for s in suggestions)
+    assert suggestions[:2] == [Suggestion("34 A 01", 1), Suggestion("34 A 10", 1)]
+
+
+def test_valid_input_is_first_suggestion():
+    assert suggest("34 AB 12", max_edits=1, n=1) == [Suggestion("34 AB 12", 0)]
+
+
+def test_degenerate_arguments():
+    assert suggest("34 A 1", n=0) == []
+    assert suggest("34 A 1", max_edits=-1) == []
+    assert suggest("xxxxxxxxxx", max_edits=1) == []